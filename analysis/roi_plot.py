@@ -18,8 +18,13 @@ def project_revenue_curve(
     network_hashrate_growth=0.25,
     block_reward_btc=3.125,
     blocks_per_day=144,
+    hashrate_decay=None,
 ):
-    """Return list of yearly revenue projections in USD."""
+    """Return list of yearly revenue projections in USD.
+
+    ``hashrate_decay`` optionally scales the fleet hashrate in each period,
+    e.g. the ``hashrate_curve`` from ``FleetReliabilityModel``.
+    """
     revenue = []
     total_hashrate = asic_count * hashrate_per_asic
     steps = int(mission_lifetime / step)
@@ -28,6 +33,8 @@ def project_revenue_curve(
         price = btc_price * ((1 + btc_price_growth) ** t)
         net_hash = network_hashrate_ehs * ((1 + network_hashrate_growth) ** t)
         share = total_hashrate / (net_hash * 1_000_000)
+        if hashrate_decay is not None:
+            share *= hashrate_decay[i]
         btc_day = share * blocks_per_day * block_reward_btc * solar_fraction
         btc_period = btc_day * 365 * step
         revenue.append(btc_period * price)
@@ -44,6 +51,7 @@ def project_btc_curve(
     network_hashrate_growth=0.25,
     block_reward_btc=3.125,
     blocks_per_day=144,
+    hashrate_decay=None,
 ):
     """Return list of BTC mined each period."""
 
@@ -54,6 +62,8 @@ def project_btc_curve(
         t = (i + 1) * step
         net_hash = network_hashrate_ehs * ((1 + network_hashrate_growth) ** t)
         share = total_hashrate / (net_hash * 1_000_000)
+        if hashrate_decay is not None:
+            share *= hashrate_decay[i]
         btc_day = share * blocks_per_day * block_reward_btc * solar_fraction
         btc_period = btc_day * 365 * step
         btc.append(btc_period)
@@ -10,6 +10,7 @@ matplotlib.use("Agg")
 import base64
 import json
 import os
+import numpy as np
 import pandas as pd
 from astropy import units as u
 from analysis.orbit_plot import plot_orbit_to_buffer
@@ -26,23 +27,34 @@ from analysis.roi_plot import (
 from orbits.eclipse import OrbitEnvironment
 
 # === POWER FOLDER ===
-from power.power_model import PowerModel
+from power.power_model import PowerModel, SECONDS_PER_YEAR
 
 # === LAUNCH FOLDER ===
 from launch.launch_model import LaunchModel
 
 # === RADIATION FOLDER ===
 from radiation.tid_model import RadiationModel
-from radiation.Thermal import run_thermal_eclipse_model
+from radiation.fleet_reliability import FleetReliabilityModel
+from radiation.Thermal import run_thermal_eclipse_model, board_temperature_history
 from radiation.rf_model import (
     full_rf_visibility_simulation,
-    ground_stations_by_network,
+    ground_station_networks,
     rf_margin_plot_to_buffer,
-    constant_margin_plot_to_buffer,
+    rf_margin_segments,
+)
+from radiation.relay_model import relay_rf_summary, relay_margin_plot_to_buffer
+from radiation.station_selection import optimize_ground_stations
+from radiation.work_queue import (
+    DEFAULT_SHARE_BUFFER,
+    DEFAULT_SHARE_RATE_HZ,
+    simulate_work_queue,
+    work_queue_summary,
 )
 
 # === COSTMODEL FOLDER ===
 from costmodel.cost import run_cost_model
+from costmodel.asic_catalog import load_asic_catalog, DEFAULT_ASIC_MODEL
+from costmodel.thermal_derating import hashrate_derating
 
 app = Flask(__name__)
 
@@ -55,6 +67,8 @@ DEFAULT_SOLAR_POWER_W = 1000.0
 # Default rideshare solar panel price per Watt ($/W). Range may vary widely,
 # but typical commercial rates are well below $100/W.
 DEFAULT_SOLAR_COST_PER_W = 10.0
+# Share of the payload mass budget available to ASIC boards
+ASIC_MASS_FRACTION = 0.5
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
 orbits_path = os.path.join(ROOT, "config", "orbits_to_test.json")
@@ -78,7 +92,7 @@ SAT_CLASS_OPTIONS = [
 BITCOIN_PRICE_APPRECIATION_OPTIONS = [(str(i), f"{i}%") for i in range(-50, 51, 5)]
 BITCOIN_HASH_GROWTH_OPTIONS = [(str(i), f"{i}%") for i in range(-50, 51, 5)]
 NETWORK_OPTIONS = [("all", "All Ground Stations")] + [
-    (n, n) for n in sorted(ground_stations_by_network.keys())
+    (n, n) for n in ground_station_networks()
 ]
 
 # Parameters for satellite classes
@@ -100,6 +114,9 @@ SAT_CLASS_LOOKUP = {
     ),
 }
 
+# Optical downlink terminal (see radiation/data/optical_terminals.json)
+MULTIMW_OPTICAL_TERMINAL = "LCT-100G Coherent"
+
 SAT_COST_LOOKUP = {
     "cubesat": dict(
         bus_cost=60_000,
@@ -180,6 +197,105 @@ def build_multimw_params(power_mw: float):
     return params, costs
 
 
+def resolve_asic(data):
+    """Return ``(model, hashrate_per_asic, efficiency)`` for the request.
+
+    A named ``asic_model`` takes its figures from the ASIC catalog; otherwise
+    the default hashrate and the efficiency slider are used.
+    """
+    model = data.get("asic_model")
+    if model and model != "auto":
+        spec = load_asic_catalog().get(model)
+        return model, spec["hashrate_ths"], spec["efficiency_j_per_th"]
+    efficiency = float(data.get("efficiency", DEFAULT_EFFICIENCY_J_PER_TH))
+    return None, DEFAULT_HASHRATE_PER_ASIC, efficiency
+
+
+def select_asic(
+    data,
+    sat_class,
+    mode,
+    solar_power,
+    solar_cost,
+    mission_years=5.0,
+    tid_krad=None,
+    max_board_temp_c=None,
+):
+    """Return the catalog ASIC selection maximising BTC per dollar.
+
+    Dedicated missions evaluate every catalog entry against every satellite
+    class in one pass and return the entry for ``sat_class``; rideshare
+    missions are limited by the purchased solar power only.  Models rated
+    below the mission dose ``tid_krad`` or the peak board temperature
+    ``max_board_temp_c`` are not considered.
+    """
+    catalog = load_asic_catalog()
+    limits = dict(tid_krad=tid_krad, max_board_temp_c=max_board_temp_c)
+    if mode == "rideshare":
+        return catalog.select(
+            solar_power,
+            float("inf"),
+            solar_power * solar_cost,
+            mission_years,
+            **limits,
+        )[0]
+
+    ded_power = float(data.get("ded_power", 0))
+    labels, power, mass, fixed = [], [], [], []
+    for name in ("cubesat", "espa", "multimw"):
+        if name == "multimw":
+            params, costs = build_multimw_params(float(data.get("multimw_power", 1)))
+        else:
+            params, costs = SAT_CLASS_LOOKUP[name], SAT_COST_LOOKUP[name]
+        class_power = (
+            ded_power
+            if ded_power > 0 and name in ("cubesat", "espa")
+            else params["power_w"]
+        )
+        base_cost = (
+            costs["bus_cost"]
+            + costs["integration_cost"]
+            + costs["comms_cost"]
+            + class_power * solar_cost
+        )
+        labels.append(name)
+        power.append(class_power)
+        mass.append(params["payload_mass_kg"] * ASIC_MASS_FRACTION)
+        fixed.append(base_cost * (1 + costs["contingency"]))
+    by_class = {
+        r["label"]: r
+        for r in catalog.select(
+            power, mass, fixed, mission_years, labels=labels, **limits
+        )
+    }
+    return by_class.get(sat_class, by_class["cubesat"])
+
+
+def thermal_derating(asic_model, board_temps_C, dt):
+    """Return the hashrate derating of ``asic_model`` for a board temperature series."""
+    spec = load_asic_catalog().get(asic_model or DEFAULT_ASIC_MODEL)
+    derating = hashrate_derating(
+        board_temps_C,
+        dt,
+        throttle_temp_C=spec["max_temp_c"] - 15.0,
+        shutdown_temp_C=spec["max_temp_c"],
+    )
+    derating.pop("hashrate_series")
+    return derating
+
+
+def fleet_survival(asic_model, asic_count, rad_info, board_temp_C, mission_years):
+    """Return the expected fleet survival for ``asic_count`` ASICs."""
+    spec = load_asic_catalog().get(asic_model or DEFAULT_ASIC_MODEL)
+    fleet = FleetReliabilityModel.from_radiation(
+        rad_info,
+        asic_count,
+        tid_tolerance_krad=spec["tid_tolerance_krad"],
+        board_temp_C=board_temp_C,
+    )
+    return fleet.expected_survival(mission_years)
+
+
 @app.route("/")
 def index():
     return render_template(
@@ -229,7 +345,12 @@ def orbit_visuals(idx: int):
         rf_buf = None
         comms_mode = request.args.get("comms", "ground")
         if comms_mode == "relay":
-            rf_buf = constant_margin_plot_to_buffer(margin_dB=1.0, period_s=period_s)
+            rf_buf = relay_margin_plot_to_buffer(
+                tle=orbit_cfg.get("tle_lines"),
+                altitude_km=orbit_cfg.get("altitude_km"),
+                inclination_deg=orbit_cfg.get("inclination_deg"),
+                dt=60,
+            )
         elif orbit_cfg.get("tle_lines"):
             rf_buf = rf_margin_plot_to_buffer(
                 orbit_cfg.get("tle_lines"), networks=None, dt=60, verbose=False
@@ -257,8 +378,8 @@ def api_estimate_cost():
     try:
         data = request.get_json()
 
-        efficiency = float(data.get("efficiency", DEFAULT_EFFICIENCY_J_PER_TH))
-        power_per_asic = efficiency * DEFAULT_HASHRATE_PER_ASIC
+        asic_model, hashrate_per_asic, efficiency = resolve_asic(data)
+        power_per_asic = efficiency * hashrate_per_asic
 
         mode = data.get("mode", "dedicated")
         sat_class = data.get("sat_class", "cubesat")
@@ -270,13 +391,27 @@ def api_estimate_cost():
                 solar_power = float(data.get("solar_power", DEFAULT_SOLAR_POWER_W))
             solar_cost = float(data.get("solar_cost", DEFAULT_SOLAR_COST_PER_W))
             asic_count = int(solar_power / power_per_asic) if power_per_asic else 0
+            selection = None
+            if data.get("asic_model") == "auto":
+                selection = select_asic(data, sat_class, mode, solar_power, solar_cost)
+                if selection["model"]:
+                    asic_model = selection["model"]
+                    asic_count = selection["asic_count"]
             total_cost = solar_power * solar_cost
             breakdown = {
                 "Solar Panel Cost": total_cost,
                 "Cost per W": solar_cost,
                 "ASIC Count": asic_count,
             }
-            return jsonify({"total_cost": total_cost, "breakdown": breakdown})
+            if asic_model:
+                breakdown["ASIC Model"] = asic_model
+            return jsonify(
+                {
+                    "total_cost": total_cost,
+                    "breakdown": breakdown,
+                    "asic_selection": selection,
+                }
+            )
 
         if sat_class == "multimw":
             power_mw = float(data.get("multimw_power", 1))
@@ -314,14 +449,23 @@ def api_estimate_cost():
         solar_cost = float(data.get("solar_cost", DEFAULT_SOLAR_COST_PER_W))
         solar_power = ded_power if ded_power > 0 else params["power_w"]
 
+        selection = None
+        if data.get("asic_model") == "auto":
+            selection = select_asic(data, sat_class, mode, solar_power, solar_cost)
+            if selection["model"]:
+                asic_model = selection["model"]
+                asic_override = selection["asic_count"]
+
         capex = {
             **costs,
             "payload_cost": solar_power * solar_cost,
             "launch_cost": launch_cost,
             "asic_count": asic_override if asic_override is not None else params["asic_count"],
-            "hashrate_per_asic": DEFAULT_HASHRATE_PER_ASIC,
-            "power_per_asic": power_per_asic,
+            "asic_model": asic_model,
         }
+        if not asic_model:
+            capex["hashrate_per_asic"] = hashrate_per_asic
+            capex["power_per_asic"] = power_per_asic
         cost_data = run_cost_model(1.0, **capex)
         cost_data["launch_cost_per_kg"] = cost_per_kg
 
@@ -344,8 +488,17 @@ def api_estimate_cost():
             "Contingency": cost_data["contingency"],
             "Total Mission Cost": cost_data["total_cost"],
         }
-
-        return jsonify({"total_cost": cost_data["total_cost"], "breakdown": breakdown})
+        if asic_model:
+            breakdown["ASIC Model"] = asic_model
+            breakdown["ASIC Count"] = capex["asic_count"]
+
+        return jsonify(
+            {
+                "total_cost": cost_data["total_cost"],
+                "breakdown": breakdown,
+                "asic_selection": selection,
+            }
+        )
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -355,8 +508,8 @@ def api_simulate():
     try:
         data = request.get_json()
 
-        efficiency = float(data.get("efficiency", DEFAULT_EFFICIENCY_J_PER_TH))
-        power_per_asic = efficiency * DEFAULT_HASHRATE_PER_ASIC
+        asic_model, hashrate_per_asic, efficiency = resolve_asic(data)
+        power_per_asic = efficiency * hashrate_per_asic
 
         idx = int(data.get("orbit", 0))
         if idx < 0 or idx >= len(ORBIT_CONFIGS):
@@ -373,58 +526,89 @@ def api_simulate():
 
         period_s = env.orbit.period.to(u.s).value
         eclipse_duration_s = env.eclipse_fraction * period_s
-        _, _, thermal_buf, temp_stats = run_thermal_eclipse_model(
+        # One eclipse mask drives both the thermal and the array power model
+        thermal_dt = 60
+        orbit_t = np.arange(int(period_s * 5 / thermal_dt)) * thermal_dt
+        sunlit = (np.mod(orbit_t, period_s) >= eclipse_duration_s).astype(int)
+        T_hist, x_nodes, thermal_buf, temp_stats = run_thermal_eclipse_model(
             orbit_period_s=period_s,
             eclipse_duration_s=eclipse_duration_s,
-            t_total=period_s * 5,
-            dt=60,
+            dt=thermal_dt,
             plot3d=True,
+            illumination_profile=(orbit_t, sunlit),
             verbose=False,
         )
+        board_temps_C = board_temperature_history(T_hist, x_nodes) - 273.15
 
         comms_mode = data.get("comms_mode", "ground")
         gs_network = data.get("gs_network", "all")
+        sat_class = data.get("sat_class", "cubesat")
+        # Only the MultiMW class carries a laser terminal
+        optical = data.get("optical_terminal") or (
+            MULTIMW_OPTICAL_TERMINAL if sat_class == "multimw" else None
+        )
+        contacts = None
+        margin_series = None
         if comms_mode == "relay":
-            rf = {
-                "mode": "relay",
-                "Downlink % of mission": "100",
-                "Uplink % of mission": "100",
-            }
-            rf_buf = constant_margin_plot_to_buffer(margin_dB=1.0, period_s=period_s)
+            rf, contacts = relay_rf_summary(
+                tle=orbit_cfg.get("tle_lines"),
+                altitude_km=orbit_cfg.get("altitude_km"),
+                inclination_deg=orbit_cfg.get("inclination_deg"),
+                duration_days=1,
+                start_time=data.get("start_time"),
+                return_contacts=True,
+            )
+            rf_buf = relay_margin_plot_to_buffer(
+                tle=orbit_cfg.get("tle_lines"),
+                altitude_km=orbit_cfg.get("altitude_km"),
+                inclination_deg=orbit_cfg.get("inclination_deg"),
+                dt=60,
+                start_time=data.get("start_time"),
+            )
         else:
             if orbit_cfg.get("tle_lines"):
                 networks = None if gs_network == "all" else gs_network
-                rf = full_rf_visibility_simulation(
+                rf, contacts = full_rf_visibility_simulation(
                     tle=orbit_cfg.get("tle_lines"),
                     duration_days=1,
                     verbose=False,
                     networks=networks,
+                    acm=True,
+                    start_time=data.get("start_time"),
+                    return_contacts=True,
+                    optical=optical,
                 )
-                rf_buf = rf_margin_plot_to_buffer(
+                margin_series = rf_margin_segments(
                     orbit_cfg.get("tle_lines"),
                     networks=networks,
-                    dt=60,
-                    verbose=False,
+                    max_step_s=60,
+                    start_time=data.get("start_time"),
+                )
+                rf_buf = rf_margin_plot_to_buffer(
+                    orbit_cfg.get("tle_lines"), series=margin_series
                 )
             else:
                 rf = {}
                 rf_buf = None
 
-        # Determine how much of the mission communications are available
-        if comms_mode == "relay":
-            comms_fraction = 1.0
+        # Mining only pays while fresh work is uplinked and shares get down
+        # before the next block, so simulate the onboard queue over contacts
+        if contacts is not None:
+            queue = simulate_work_queue(
+                contacts["uplink"],
+                contacts["downlink"],
+                contacts["duration_s"],
+                share_rate_hz=float(data.get("share_rate_hz", DEFAULT_SHARE_RATE_HZ)),
+                share_buffer=int(data.get("share_buffer", DEFAULT_SHARE_BUFFER)),
+            )
+            rf["Onboard work queue"] = work_queue_summary(queue)
+            comms_fraction = queue["effective_mining_fraction"]
         else:
-            try:
-                dn_pct = float(str(rf.get("Downlink % of mission", "0")).strip("%"))
-                up_pct = float(str(rf.get("Uplink % of mission", "0")).strip("%"))
-                comms_fraction = min(dn_pct, up_pct) / 100.0
-            except Exception:
-                comms_fraction = 0.0
+            comms_fraction = 0.0
 
         orbit_buf = plot_orbit_to_buffer(env)
 
         # --- Power and Cost Models ---
-        sat_class = data.get("sat_class", "cubesat")
         if sat_class == "multimw":
             power_mw = float(data.get("multimw_power", 1))
             params, costs = build_multimw_params(power_mw)
@@ -460,6 +644,14 @@ def api_simulate():
         btc_hash = float(data.get("btc_hash_growth", 25)) / 100.0
 
         mission_life = float(data.get("mission_life", 5))
+
+        rad_model = RadiationModel()
+        rad_info = rad_model.estimate_tid(
+            env.altitude_km or orbit_cfg.get("altitude_km", 500),
+            env.inclination_deg or orbit_cfg.get("inclination_deg", 0),
+            years=mission_life,
+        )
+
         mode = data.get("mode", "dedicated")
         if mode == "rideshare":
             if sat_class == "multimw":
@@ -470,6 +662,34 @@ def api_simulate():
             solar_cost = float(data.get("solar_cost", DEFAULT_SOLAR_COST_PER_W))
             asic_power_pct = float(data.get("asic_power_pct", 100))
             asic_count = int(solar_power / power_per_asic) if power_per_asic else 0
+            if data.get("asic_model") == "auto":
+                selection = select_asic(
+                    data,
+                    sat_class,
+                    mode,
+                    solar_power,
+                    solar_cost,
+                    mission_life,
+                    tid_krad=rad_info["estimated_tid_krad"],
+                    max_board_temp_c=temp_stats["Max board temp (°C)"],
+                )
+                if selection["model"]:
+                    asic_model = selection["model"]
+                    hashrate_per_asic = selection["hashrate_per_asic"]
+                    efficiency = selection["efficiency_j_per_th"]
+                    power_per_asic = selection["power_per_asic"]
+                    asic_count = selection["asic_count"]
+            derating = thermal_derating(asic_model, board_temps_C, thermal_dt)
+            hashrate_eff = hashrate_per_asic * derating["hashrate_factor"]
+            # Hot ASICs hash slower and at a worse J/TH
+            power_eff = hashrate_eff * efficiency * derating["efficiency_factor"]
+            fleet = fleet_survival(
+                asic_model,
+                asic_count,
+                rad_info,
+                float(board_temps_C.mean()),
+                mission_life,
+            )
             effective_fraction = (
                 env.sunlight_fraction * (asic_power_pct / 100.0) * comms_fraction
             )
@@ -482,11 +702,13 @@ def api_simulate():
                 "comms_cost": 0,
                 "contingency": 0,
                 "asic_count": asic_count,
-                "hashrate_per_asic": DEFAULT_HASHRATE_PER_ASIC,
-                "power_per_asic": power_per_asic,
+                "hashrate_per_asic": hashrate_eff,
+                "power_per_asic": power_eff,
+                "asic_model": asic_model,
                 "btc_price_growth": btc_app,
                 "network_hashrate_growth": btc_hash,
                 "mission_lifetime": mission_life,
+                "hashrate_decay": fleet["hashrate_curve"],
             }
             cost_data = run_cost_model(effective_fraction, **capex)
             cost_data["launch_cost_per_kg"] = 0
@@ -499,16 +721,47 @@ def api_simulate():
             solar_cost = float(data.get("solar_cost", DEFAULT_SOLAR_COST_PER_W))
             solar_power = ded_power if ded_power > 0 else params["power_w"]
 
+            if data.get("asic_model") == "auto":
+                selection = select_asic(
+                    data,
+                    sat_class,
+                    mode,
+                    solar_power,
+                    solar_cost,
+                    mission_life,
+                    tid_krad=rad_info["estimated_tid_krad"],
+                    max_board_temp_c=temp_stats["Max board temp (°C)"],
+                )
+                if selection["model"]:
+                    asic_model = selection["model"]
+                    hashrate_per_asic = selection["hashrate_per_asic"]
+                    efficiency = selection["efficiency_j_per_th"]
+                    power_per_asic = selection["power_per_asic"]
+                    asic_override = selection["asic_count"]
+            derating = thermal_derating(asic_model, board_temps_C, thermal_dt)
+            hashrate_eff = hashrate_per_asic * derating["hashrate_factor"]
+            # Hot ASICs hash slower and at a worse J/TH
+            power_eff = hashrate_eff * efficiency * derating["efficiency_factor"]
+            fleet = fleet_survival(
+                asic_model,
+                asic_override if asic_override is not None else params["asic_count"],
+                rad_info,
+                float(board_temps_C.mean()),
+                mission_life,
+            )
+
             capex = {
                 **costs,
                 "payload_cost": solar_power * solar_cost,
                 "launch_cost": launch_cost,
                 "asic_count": asic_override if asic_override is not None else params["asic_count"],
-                "hashrate_per_asic": DEFAULT_HASHRATE_PER_ASIC,
-                "power_per_asic": power_per_asic,
+                "hashrate_per_asic": hashrate_eff,
+                "power_per_asic": power_eff,
+                "asic_model": asic_model,
                 "btc_price_growth": btc_app,
                 "network_hashrate_growth": btc_hash,
                 "mission_lifetime": mission_life,
+                "hashrate_decay": fleet["hashrate_curve"],
             }
             cost_data = run_cost_model(env.sunlight_fraction * comms_fraction, **capex)
             cost_data["launch_cost_per_kg"] = cost_per_kg
@@ -518,24 +771,26 @@ def api_simulate():
                 effective_fraction,
                 mission_life,
                 asic_count,
-                hashrate_per_asic=DEFAULT_HASHRATE_PER_ASIC,
+                hashrate_per_asic=hashrate_eff,
                 btc_price=capex.get("btc_price", 105000.0),
                 btc_price_growth=btc_app,
                 network_hashrate_ehs=capex.get("network_hashrate_ehs", 700.0),
                 network_hashrate_growth=btc_hash,
                 block_reward_btc=capex.get("block_reward_btc", 3.125),
+                hashrate_decay=fleet["hashrate_curve"],
             )
         else:
             revenue_curve = project_revenue_curve(
                 env.sunlight_fraction * comms_fraction,
                 mission_life,
                 (asic_override if asic_override is not None else params["asic_count"]),
-                hashrate_per_asic=capex.get("hashrate_per_asic", DEFAULT_HASHRATE_PER_ASIC),
+                hashrate_per_asic=hashrate_eff,
                 btc_price=capex.get("btc_price", 105000.0),
                 btc_price_growth=btc_app,
                 network_hashrate_ehs=capex.get("network_hashrate_ehs", 700.0),
                 network_hashrate_growth=btc_hash,
                 block_reward_btc=capex.get("block_reward_btc", 3.125),
+                hashrate_decay=fleet["hashrate_curve"],
             )
         roi_buf = roi_plot_to_buffer(cost_data["total_cost"], revenue_curve, step=0.25)
         btc_curve = project_btc_curve(
@@ -543,22 +798,48 @@ def api_simulate():
             mission_life,
             asic_count if mode == "rideshare" else (asic_override if asic_override is not None else params["asic_count"]),
             step=0.25,
-            hashrate_per_asic=capex.get("hashrate_per_asic", DEFAULT_HASHRATE_PER_ASIC),
+            hashrate_per_asic=hashrate_eff,
             network_hashrate_ehs=capex.get("network_hashrate_ehs", 700.0),
             network_hashrate_growth=btc_hash,
             block_reward_btc=capex.get("block_reward_btc", 3.125),
+            hashrate_decay=fleet["hashrate_curve"],
         )
         btc_buf = btc_plot_to_buffer(btc_curve, step=0.25)
 
-        rad_model = RadiationModel()
-        rad_info = rad_model.estimate_tid(
-            env.altitude_km or orbit_cfg.get("altitude_km", 500),
-            env.inclination_deg or orbit_cfg.get("inclination_deg", 0),
-            years=cost_data["mission_lifetime"],
+        if mode == "rideshare":
+            available_power = solar_power
+            solar_area = 1.0
+        else:
+            available_power = ded_power if ded_power > 0 else params["power_w"]
+            solar_area = params.get("solar_area_m2") or 1.0
+        power_model = PowerModel(
+            power_density_w_m2=available_power / solar_area, area_m2=solar_area
+        )
+        # Array output over the thermal run's orbits, with the top (cell)
+        # layer temperatures, at beginning and end of life
+        power_kwargs = dict(
+            illumination=sunlit,
+            illumination_times_s=orbit_t,
+            orbit_period_s=period_s,
+            cell_temp_K=T_hist[:, 0],
+            cell_temp_times_s=orbit_t,
+            tid_krad_per_year=(
+                rad_info["estimated_tid_krad"] / rad_info["years"]
+                if rad_info["years"]
+                else 0.0
+            ),
+        )
+        bol_power = power_model.power_timeseries(orbit_t, **power_kwargs)
+        eol_power = power_model.power_timeseries(
+            orbit_t + rad_info["years"] * SECONDS_PER_YEAR, **power_kwargs
         )
+        power_profile = {
+            "Orbit-average power BOL (W)": float(f"{bol_power.mean():.2f}"),
+            "Orbit-average power EOL (W)": float(f"{eol_power.mean():.2f}"),
+            "Peak sunlit power EOL (W)": float(f"{eol_power.max():.2f}"),
+        }
 
         if mode == "rideshare":
-            available_power = solar_power
             specs = {
                 "asic_count": asic_count,
                 "solar_power_w": solar_power,
@@ -566,14 +847,6 @@ def api_simulate():
                 "asic_power_pct": asic_power_pct,
             }
         else:
-            power_model = PowerModel(
-                power_density_w_m2=(
-                    params["power_w"] / params["solar_area_m2"]
-                    if params.get("solar_area_m2")
-                    else 200
-                )
-            )
-            available_power = ded_power if ded_power > 0 else params["power_w"]
 
             specs = {
                 "asic_count": asic_override if asic_override is not None else params["asic_count"],
@@ -585,14 +858,28 @@ def api_simulate():
                     if params["solar_area_m2"]
                     else None
                 ),
+                "eol_power_w": power_profile["Peak sunlit power EOL (W)"],
             }
 
+        if asic_model:
+            specs["asic_model"] = asic_model
+
         result = {
             "orbit": orbit_cfg.get("name"),
             "thermal_stats": temp_stats,
+            "thermal_derating": derating,
+            "fleet_reliability": {
+                "Mean hashrate fraction": float(fleet["hashrate_curve"].mean())
+                if fleet["hashrate_curve"].size
+                else 1.0,
+                "End-of-life hashrate fraction": float(fleet["hashrate_fraction"][-1]),
+                "Failed ASICs at end of life": float(fleet["counts"][-1, 2]),
+            },
             "rf_summary": rf,
+            "rf_margin_series": margin_series,
             "radiation": rad_info,
             "power_w": available_power,
+            "power_profile": power_profile,
             "cost_summary": cost_data,
             "specs": specs,
             "orbit_plot": base64.b64encode(orbit_buf.getvalue()).decode("utf-8"),
@@ -611,6 +898,36 @@ def api_simulate():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route("/api/select_stations", methods=["POST"])
+def api_select_stations():
+    """Return the cheapest ground station subset for a target contact fraction."""
+    try:
+        data = request.get_json() or {}
+        idx = int(data.get("orbit", 0))
+        if idx < 0 or idx >= len(ORBIT_CONFIGS):
+            idx = 0
+        tle = data.get("tle_lines") or ORBIT_CONFIGS[idx].get("tle_lines")
+        if not tle:
+            return jsonify({"error": "Station selection needs a TLE orbit"}), 400
+
+        target = float(data.get("target_fraction", 0.2))
+        if target > 1:
+            target /= 100.0
+        gs_network = data.get("gs_network", "all")
+        result = optimize_ground_stations(
+            tle,
+            target,
+            duration_days=float(data.get("duration_days", 7)),
+            networks=None if gs_network == "all" else gs_network,
+            start_time=data.get("start_time"),
+            method=data.get("method", "greedy"),
+            bin_s=float(data.get("bin_s", 60)),
+        )
+        return jsonify(result)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @app.route("/health")
 def health():
     return "OK", 200
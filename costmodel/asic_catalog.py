@@ -0,0 +1,118 @@
+"""ASIC generation catalog and power/mass-budget selection optimizer."""
+
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+# Name of the catalog entry matching the app's historical defaults
+# (0.63 TH/s at 19 J/TH).
+DEFAULT_ASIC_MODEL = "Gen-C 5nm"
+
+
+class AsicCatalog:
+    def __init__(self, db_path=None):
+        if db_path is None:
+            # Always resolve path relative to this file's directory
+            root = os.path.dirname(os.path.abspath(__file__))
+            db_path = os.path.join(root, "asic_db.csv")
+        self.db = pd.read_csv(db_path)
+        self.models = self.db["model"].tolist()
+        self.hashrate_ths = self.db["hashrate_ths"].to_numpy(dtype=float)
+        self.efficiency_j_per_th = self.db["efficiency_j_per_th"].to_numpy(dtype=float)
+        self.power_w = self.hashrate_ths * self.efficiency_j_per_th
+        self.mass_kg = self.db["mass_kg"].to_numpy(dtype=float)
+        self.unit_cost_usd = self.db["unit_cost_usd"].to_numpy(dtype=float)
+        self.max_temp_c = self.db["max_temp_c"].to_numpy(dtype=float)
+        self.tid_tolerance_krad = self.db["tid_tolerance_krad"].to_numpy(dtype=float)
+
+    def get(self, model):
+        """Return the catalog entry for ``model`` as a dict."""
+        try:
+            i = self.models.index(model)
+        except ValueError:
+            raise KeyError(f"Unknown ASIC model: {model}") from None
+        return {**self.db.iloc[i].to_dict(), "power_w": float(self.power_w[i])}
+
+    def select(
+        self,
+        power_budget_w,
+        mass_budget_kg,
+        fixed_cost_usd=0.0,
+        mission_years=5.0,
+        uptime_fraction=1.0,
+        tid_krad=None,
+        max_board_temp_c=None,
+        network_hashrate_ehs=700.0,
+        block_reward_btc=3.125,
+        blocks_per_day=144,
+        labels=None,
+    ):
+        """Pick the ASIC model and count that maximise expected BTC per dollar.
+
+        Every catalog entry is evaluated against every budget in a single
+        ``(budgets, models)`` array computation.  Budgets and costs may be
+        scalars or 1-D arrays (one entry per satellite class).  Entries whose
+        radiation tolerance is below ``tid_krad`` or whose thermal limit is
+        below ``max_board_temp_c`` are excluded.
+
+        Returns a list of dicts, one per budget, in input order.
+        """
+        power = np.atleast_1d(np.asarray(power_budget_w, dtype=float))[:, None]
+        mass = np.atleast_1d(np.asarray(mass_budget_kg, dtype=float))[:, None]
+        fixed = np.atleast_1d(np.asarray(fixed_cost_usd, dtype=float))[:, None]
+        power, mass, fixed = np.broadcast_arrays(power, mass, fixed)
+
+        count = np.floor(np.minimum(power / self.power_w, mass / self.mass_kg))
+        count = np.clip(count, 0.0, None)
+
+        btc_per_ths_year = (
+            blocks_per_day * block_reward_btc * 365 / (network_hashrate_ehs * 1_000_000)
+        )
+        btc = (
+            count
+            * self.hashrate_ths
+            * btc_per_ths_year
+            * mission_years
+            * uptime_fraction
+        )
+        cost = fixed + count * self.unit_cost_usd
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.where(cost > 0, btc / cost, 0.0)
+
+        feasible = count > 0
+        if tid_krad is not None:
+            feasible &= self.tid_tolerance_krad >= tid_krad
+        if max_board_temp_c is not None:
+            feasible &= self.max_temp_c >= max_board_temp_c
+        score = np.where(feasible, score, -np.inf)
+        best = np.argmax(score, axis=1)
+
+        results = []
+        for r, k in enumerate(best):
+            label = labels[r] if labels else r
+            if not np.isfinite(score[r, k]):
+                results.append({"label": label, "model": None})
+                continue
+            results.append(
+                {
+                    "label": label,
+                    "model": self.models[k],
+                    "asic_count": int(count[r, k]),
+                    "hashrate_per_asic": float(self.hashrate_ths[k]),
+                    "power_per_asic": float(self.power_w[k]),
+                    "efficiency_j_per_th": float(self.efficiency_j_per_th[k]),
+                    "asic_cost_usd": float(count[r, k] * self.unit_cost_usd[k]),
+                    "asic_mass_kg": float(count[r, k] * self.mass_kg[k]),
+                    "expected_btc": float(btc[r, k]),
+                    "btc_per_usd": float(score[r, k]),
+                }
+            )
+        return results
+
+
+@functools.lru_cache(maxsize=None)
+def load_asic_catalog(db_path=None):
+    """Return a cached :class:`AsicCatalog`."""
+    return AsicCatalog(db_path)
@@ -1,5 +1,7 @@
 # cost.py · Now handles price/network growth and custom lifetime.
 
+from costmodel.asic_catalog import load_asic_catalog
+
 
 def run_cost_model(solar_fraction, **kwargs):
     """Return mission cost and revenue projections.
@@ -8,6 +10,14 @@ def run_cost_model(solar_fraction, **kwargs):
     ``bus_structure_cost`` and ``bus_electronics_cost`` which will be summed
     to obtain the overall bus cost.  If component values are omitted they
     default to a 60/40 split of the total bus cost.
+
+    ``asic_model`` selects an entry from the ASIC catalog
+    (``costmodel/asic_db.csv``) whose hashrate and power become the defaults
+    for ``hashrate_per_asic`` and ``power_per_asic``.
+
+    ``hashrate_decay`` is an optional per-period (0.25 yr) fleet hashrate
+    multiplier, e.g. the ``FleetReliabilityModel`` survival curve, used to
+    derate the mined BTC.
     """
 
     # Accept overrides or use defaults
@@ -25,8 +35,12 @@ def run_cost_model(solar_fraction, **kwargs):
     contingency = kwargs.get("contingency", 0.25)
     # Core technical constants
     asic_count = kwargs.get("asic_count", 3)
-    hashrate_per_asic = kwargs.get("hashrate_per_asic", 0.63)
-    power_per_asic = kwargs.get("power_per_asic", 12.0)
+    asic_model = kwargs.get("asic_model")
+    asic_spec = load_asic_catalog().get(asic_model) if asic_model else {}
+    hashrate_per_asic = kwargs.get(
+        "hashrate_per_asic", asic_spec.get("hashrate_ths", 0.63)
+    )
+    power_per_asic = kwargs.get("power_per_asic", asic_spec.get("power_w", 12.0))
     mission_lifetime = float(kwargs.get("mission_lifetime", 5))
     network_hashrate_ehs = float(kwargs.get("network_hashrate_ehs", 700))
     block_reward_btc = float(kwargs.get("block_reward_btc", 3.125))
@@ -54,6 +68,12 @@ def run_cost_model(solar_fraction, **kwargs):
 
     avg_btc_price = sum(btc_price_list) / steps if steps else btc_price
     avg_network_hashrate = sum(net_hash_list) / steps if steps else network_hashrate_ehs
+    hashrate_decay = kwargs.get("hashrate_decay")
+    fleet_factor = (
+        sum(hashrate_decay[:steps]) / steps
+        if hashrate_decay is not None and steps
+        else 1.0
+    )
 
     # ---- Calculations ----
     base_cost = bus_cost + payload_cost + launch_cost + integration_cost + comms_cost
@@ -61,7 +81,7 @@ def run_cost_model(solar_fraction, **kwargs):
     total_hashrate = asic_count * hashrate_per_asic
     total_power = asic_count * power_per_asic
     share = total_hashrate / (avg_network_hashrate * 1_000_000)
-    btc_day = share * blocks_per_day * block_reward_btc * solar_fraction
+    btc_day = share * blocks_per_day * block_reward_btc * solar_fraction * fleet_factor
     btc_year = btc_day * 365
     revenue_usd = btc_year * mission_lifetime * avg_btc_price
     profit_usd = revenue_usd - total_cost
@@ -98,5 +118,7 @@ def run_cost_model(solar_fraction, **kwargs):
         "mission_lifetime": mission_lifetime,
         "power_per_asic": power_per_asic,
         "hashrate_per_asic": hashrate_per_asic,
+        "asic_model": asic_model,
+        "fleet_hashrate_factor": fleet_factor,
         "efficiency_j_per_th": power_per_asic / hashrate_per_asic,
     }
@@ -0,0 +1,64 @@
+"""Temperature-dependent ASIC hashrate and efficiency derating."""
+
+import numpy as np
+
+
+def hashrate_derating(
+    board_temp_C,
+    dt,
+    nominal_temp_C=60.0,
+    derate_per_C=0.005,
+    efficiency_per_C=0.003,
+    throttle_temp_C=70.0,
+    shutdown_temp_C=85.0,
+    min_operating_temp_C=-20.0,
+):
+    """Map a board temperature time series to per-step hashrate derating.
+
+    Above ``nominal_temp_C`` the ASICs lose ``derate_per_C`` of their
+    hashrate and ``efficiency_per_C`` of their efficiency (J/TH rises) per
+    degree.  Between ``throttle_temp_C`` and ``shutdown_temp_C`` the clock is
+    throttled linearly to zero, and outside the operating range the ASICs
+    are idle.
+
+    Parameters
+    ----------
+    board_temp_C : array_like
+        Board temperature at each step, e.g. from
+        ``radiation.Thermal.board_temperature_history`` converted to °C.
+    dt : float or array_like
+        Step length in seconds, used to integrate over the orbit.
+
+    Returns
+    -------
+    dict
+        ``hashrate_factor`` (time-averaged effective/nominal hashrate),
+        ``efficiency_factor`` (hash-weighted J/TH multiplier), the fraction
+        of time spent throttled or idle, and the per-step ``hashrate_series``.
+    """
+    temps = np.asarray(board_temp_C, dtype=float)
+    weights = np.broadcast_to(np.asarray(dt, dtype=float), temps.shape)
+
+    excess = np.clip(temps - nominal_temp_C, 0.0, None)
+    factor = np.clip(1.0 - derate_per_C * excess, 0.0, 1.0)
+    span = max(shutdown_temp_C - throttle_temp_C, 1e-9)
+    throttle = np.clip((shutdown_temp_C - temps) / span, 0.0, 1.0)
+    factor = factor * throttle
+    idle = (temps >= shutdown_temp_C) | (temps < min_operating_temp_C)
+    factor = np.where(idle, 0.0, factor)
+    eff = 1.0 + efficiency_per_C * excess
+
+    total = weights.sum()
+    hashed = (factor * weights).sum()
+    return {
+        "hashrate_factor": float(hashed / total) if total else 0.0,
+        "efficiency_factor": (
+            float((eff * factor * weights).sum() / hashed) if hashed else 1.0
+        ),
+        "throttled_fraction": (
+            float(weights[(throttle < 1.0) & ~idle].sum() / total) if total else 0.0
+        ),
+        "idle_fraction": float(weights[idle].sum() / total) if total else 0.0,
+        "max_board_temp_C": float(temps.max()) if temps.size else None,
+        "hashrate_series": factor,
+    }
@@ -1,6 +1,177 @@
+import numpy as np
+
+SECONDS_PER_YEAR = 365.25 * 24 * 3600
+
+# Supported array attitude modes for the cosine pointing loss
+ATTITUDE_MODES = ("sun_tracking", "nadir", "inertial")
+
+
+def _periodic_interp(times_s, values, src_times_s):
+    """Interpolate a sampled history at ``times_s``, repeating it periodically.
+
+    The period is the sampled span plus one step, so a profile of whole
+    orbits wraps back onto its own start.
+    """
+    src_t = np.asarray(src_times_s, dtype=float)
+    period = src_t[-1] - src_t[0] + (src_t[1] - src_t[0] if len(src_t) > 1 else 0.0)
+    local_t = src_t[0] + np.mod(times_s - src_t[0], period) if period > 0 else times_s
+    return np.interp(local_t, src_t, np.asarray(values, dtype=float))
+
+
 class PowerModel:
-    def __init__(self, power_density_w_m2=200):
+    def __init__(
+        self,
+        power_density_w_m2=200,
+        area_m2=1.0,
+        attitude="sun_tracking",
+        temp_coeff_per_K=-0.0035,
+        ref_temp_K=301.15,
+        rad_coeff=0.05,
+        rad_ref_krad=10.0,
+        annual_degradation=0.005,
+        beta_angle_deg=0.0,
+    ):
+        if attitude not in ATTITUDE_MODES:
+            raise ValueError(f"Unknown attitude mode: {attitude}")
         self.power_density = power_density_w_m2
+        self.area_m2 = area_m2
+        self.attitude = attitude
+        # Silicon cells lose ~0.35 %/K above the 28 °C rating temperature
+        self.temp_coeff = temp_coeff_per_K
+        self.ref_temp_K = ref_temp_K
+        # Radiation damage follows P/P0 = 1 - C*log10(1 + D/Dx)
+        self.rad_coeff = rad_coeff
+        self.rad_ref_krad = rad_ref_krad
+        # Non-radiation aging (UV darkening, thermal cycling, contamination)
+        self.annual_degradation = annual_degradation
+        self.beta_angle_deg = beta_angle_deg
 
     def estimate_power(self, sunlight_fraction):
         return self.power_density * sunlight_fraction
+
+    def pointing_factor(self, times_s, orbit_period_s=None, illumination=None):
+        """Return the cosine pointing loss for the configured attitude mode.
+
+        ``sun_tracking`` arrays stay normal to the sun.  ``nadir`` arrays are
+        body mounted facing zenith, so the incidence angle sweeps through the
+        orbit and is referenced to orbit noon (opposite the eclipse centre
+        when an illumination mask is supplied).  ``inertial`` arrays are
+        pointed at the sun at ``t=0`` and drift with the seasonal sun motion.
+        """
+        times_s = np.asarray(times_s, dtype=float)
+        if self.attitude == "sun_tracking":
+            return np.ones_like(times_s)
+        if self.attitude == "inertial":
+            return np.clip(np.cos(2 * np.pi * times_s / SECONDS_PER_YEAR), 0.0, None)
+
+        if not orbit_period_s:
+            raise ValueError("orbit_period_s is required for nadir pointing")
+        phase = 2 * np.pi * np.mod(times_s, orbit_period_s) / orbit_period_s
+        noon = 0.0
+        if illumination is not None:
+            # The eclipse geometry repeats, so the first orbit is enough
+            first = times_s < times_s.flat[0] + orbit_period_s
+            dark = first & (np.asarray(illumination) == 0)
+            if dark.any():
+                midnight = np.arctan2(
+                    np.sin(phase[dark]).mean(), np.cos(phase[dark]).mean()
+                )
+                noon = midnight + np.pi
+        cos_inc = np.cos(np.radians(self.beta_angle_deg)) * np.cos(phase - noon)
+        return np.clip(cos_inc, 0.0, None)
+
+    def temperature_factor(self, times_s, cell_temp_K=None, cell_temp_times_s=None):
+        """Return the cell temperature derating for each time step.
+
+        ``cell_temp_K`` may be a scalar, an array aligned with ``times_s`` or
+        a thermal-model history sampled at ``cell_temp_times_s`` which is
+        repeated periodically over the timeline.
+        """
+        times_s = np.asarray(times_s, dtype=float)
+        if cell_temp_K is None:
+            return np.ones_like(times_s)
+        temps = np.asarray(cell_temp_K, dtype=float)
+        if cell_temp_times_s is not None:
+            temps = _periodic_interp(times_s, temps, cell_temp_times_s)
+        factor = 1.0 + self.temp_coeff * (temps - self.ref_temp_K)
+        return np.clip(np.broadcast_to(factor, times_s.shape), 0.0, None)
+
+    def radiation_factor(self, times_s, tid_krad_per_year=0.0):
+        """Return the remaining power fraction after accumulated TID."""
+        dose = tid_krad_per_year * np.asarray(times_s, dtype=float) / SECONDS_PER_YEAR
+        factor = 1.0 - self.rad_coeff * np.log10(1.0 + dose / self.rad_ref_krad)
+        return np.clip(factor, 0.0, 1.0)
+
+    def aging_factor(self, times_s):
+        """Return the non-radiation end-of-life derating for each time step."""
+        years = np.asarray(times_s, dtype=float) / SECONDS_PER_YEAR
+        return (1.0 - self.annual_degradation) ** years
+
+    def eol_factor(self, mission_years, tid_krad_per_year=0.0):
+        """Return the combined radiation and aging derating at end of life."""
+        t_eol = mission_years * SECONDS_PER_YEAR
+        return float(
+            self.radiation_factor(t_eol, tid_krad_per_year) * self.aging_factor(t_eol)
+        )
+
+    def power_timeseries(
+        self,
+        times_s,
+        illumination=None,
+        illumination_times_s=None,
+        orbit_period_s=None,
+        cell_temp_K=None,
+        cell_temp_times_s=None,
+        tid_krad_per_year=0.0,
+        return_factors=False,
+    ):
+        """Return array output power (W) evaluated over ``times_s``.
+
+        Parameters
+        ----------
+        times_s : array_like
+            Mission elapsed time in seconds, e.g. the time vector from
+            ``OrbitEnvironment.illumination_profile`` or a multi-year grid.
+        illumination : array_like, optional
+            Sunlit flag (or fraction) aligned with ``times_s``, or sampled at
+            ``illumination_times_s``.
+        illumination_times_s : array_like, optional
+            Sample times of a shorter mask (a few orbits from
+            ``OrbitEnvironment.illumination_profile``), which is interpolated
+            by time and repeated periodically over the timeline.
+        orbit_period_s : float, optional
+            Orbit period, required for ``nadir`` pointing.
+        cell_temp_K, cell_temp_times_s : array_like, optional
+            Cell temperatures, see :meth:`temperature_factor`.  The top layer
+            of ``run_thermal_eclipse_model``'s ``T_hist`` is a natural input.
+        tid_krad_per_year : float, optional
+            Dose rate, e.g. the ``estimated_tid_krad`` of
+            ``RadiationModel.estimate_tid`` divided by its ``years``.
+        return_factors : bool, optional
+            If ``True`` also return a dict of the individual derating arrays.
+        """
+        times_s = np.asarray(times_s, dtype=float)
+        if illumination is None:
+            illum = np.ones_like(times_s)
+        elif illumination_times_s is not None:
+            illum = _periodic_interp(times_s, illumination, illumination_times_s)
+        else:
+            illum = np.broadcast_to(
+                np.asarray(illumination, dtype=float), times_s.shape
+            )
+
+        factors = {
+            "illumination": illum,
+            "pointing": self.pointing_factor(times_s, orbit_period_s, illum),
+            "temperature": self.temperature_factor(
+                times_s, cell_temp_K, cell_temp_times_s
+            ),
+            "radiation": self.radiation_factor(times_s, tid_krad_per_year),
+            "aging": self.aging_factor(times_s),
+        }
+        power = np.full(times_s.shape, float(self.power_density * self.area_m2))
+        for factor in factors.values():
+            power *= factor
+        if return_factors:
+            return power, factors
+        return power
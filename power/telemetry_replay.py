@@ -0,0 +1,251 @@
+"""Telemetry replay and online parameter estimation for the solid state model."""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator, Optional, Tuple
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from power.solid_state_model import ModelParams, ModelState, step
+
+SIGMA = 5.670374419e-8  # Stefan-Boltzmann constant
+# Fitted heat capacity stays within these multiples of its starting value
+HEAT_CAP_RANGE = (0.1, 10.0)
+
+# Telemetry column names expected in the replay file
+DEFAULT_COLUMNS = {
+    "time": "time_s",
+    "solar": "solar_W",
+    "load": "load_W",
+    "throttle": "throttle",
+    "battery": "battery_Wh",
+    "temp": "asic_temp_K",
+}
+
+
+@dataclass
+class ReplayStep:
+    """Model prediction and filter estimate for one telemetry sample."""
+
+    time_s: float
+    predicted: ModelState
+    measured_battery_Wh: float
+    measured_temp_K: float
+    estimated_temp_K: float
+    emissivity: float
+    eff_heat_cap: float
+    temp_residual_K: float
+    battery_residual_Wh: float
+
+
+def iter_telemetry(
+    path: str,
+    columns: Optional[Dict[str, str]] = None,
+    chunksize: int = 10_000,
+) -> Iterator[Tuple[float, float, float, float, float, float]]:
+    """Yield telemetry rows from a CSV or Parquet file in fixed-size chunks.
+
+    Only ``chunksize`` rows are held in memory at a time.  Rows are yielded as
+    ``(time_s, solar_W, load_W, throttle, battery_Wh, asic_temp_K)``.
+    """
+
+    columns = {**DEFAULT_COLUMNS, **(columns or {})}
+    order = [
+        columns[k] for k in ("time", "solar", "load", "throttle", "battery", "temp")
+    ]
+
+    if os.path.splitext(path)[1].lower() in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError("Parquet replay requires the 'pyarrow' package") from exc
+        batches = (
+            batch.to_pandas()
+            for batch in pq.ParquetFile(path).iter_batches(
+                batch_size=chunksize, columns=order
+            )
+        )
+    else:
+        batches = pd.read_csv(path, usecols=order, chunksize=chunksize)
+
+    for chunk in batches:
+        yield from zip(*(chunk[c].to_numpy(dtype=float).tolist() for c in order))
+
+
+class ThermalParamEstimator:
+    """Extended Kalman filter for ASIC temperature, emissivity and heat capacity.
+
+    The filter state is ``[asic_temp_K, emissivity, eff_heat_cap]``.  The
+    temperature follows the solid state model dynamics while the parameters
+    are modelled as slow random walks, so they are fitted online from the
+    measured temperature alone.  Without thermal excitation the heat
+    capacity is unobservable, so it is clamped to ``HEAT_CAP_RANGE`` and
+    kept large enough for explicit Euler steps of the current ``dt`` to
+    stay stable.
+    """
+
+    def __init__(
+        self,
+        params: ModelParams,
+        initial_temp_K: float,
+        temp_var: float = 25.0,
+        emissivity_var: float = 0.01,
+        heat_cap_var: float = 2500.0,
+        process_var: Tuple[float, float, float] = (0.05, 1e-7, 1e-3),
+        meas_var: float = 0.25,
+    ):
+        self.params = params
+        self.x = np.array([initial_temp_K, params.emissivity, params.eff_heat_cap])
+        self.P = np.diag([temp_var, emissivity_var, heat_cap_var])
+        self.Q = np.diag(process_var)
+        self.R = meas_var
+        self.heat_cap_bounds = tuple(f * params.eff_heat_cap for f in HEAT_CAP_RANGE)
+        self.dt = 0.0
+
+    def predict(self, heat_in_W: float, dt: float) -> None:
+        p = self.params
+        T, eps, C = self.x
+        k_rad = SIGMA * p.panel_area
+        q_rad = eps * k_rad * (T**4 - p.env_temp**4)
+        net = heat_in_W - q_rad
+
+        F = np.array(
+            [
+                [
+                    1.0 - dt * eps * k_rad * 4.0 * T**3 / C,
+                    -dt * k_rad * (T**4 - p.env_temp**4) / C,
+                    -dt * net / C**2,
+                ],
+                [0.0, 1.0, 0.0],
+                [0.0, 0.0, 1.0],
+            ]
+        )
+        self.x[0] = min(T + dt * net / C, p.max_temp)
+        self.P = F @ self.P @ F.T + self.Q * dt
+        self.dt = dt
+
+    def update(self, measured_temp_K: float) -> float:
+        """Fuse a temperature measurement and return the innovation."""
+        innovation = measured_temp_K - self.x[0]
+        gain = self.P[:, 0] / (self.P[0, 0] + self.R)
+        self.x += gain * innovation
+        self.P -= np.outer(gain, self.P[0, :])
+        self.x[1] = min(max(self.x[1], 1e-3), 1.0)
+        # A step is monotone while C exceeds dt * dQ_rad/dT at the hottest
+        # allowed temperature
+        p = self.params
+        lo, hi = self.heat_cap_bounds
+        stable = self.dt * 4.0 * self.x[1] * SIGMA * p.panel_area * p.max_temp**3
+        self.x[2] = min(max(self.x[2], lo, stable), hi)
+        return innovation
+
+    def current_params(self) -> ModelParams:
+        return replace(
+            self.params, emissivity=float(self.x[1]), eff_heat_cap=float(self.x[2])
+        )
+
+
+def replay_telemetry(
+    path: str,
+    params: Optional[ModelParams] = None,
+    initial_state: Optional[ModelState] = None,
+    *,
+    columns: Optional[Dict[str, str]] = None,
+    chunksize: int = 10_000,
+    estimate: bool = True,
+    estimator_kwargs: Optional[dict] = None,
+) -> Iterator[ReplayStep]:
+    """Run the solid state model in lockstep with a telemetry stream.
+
+    Parameters
+    ----------
+    path : str
+        CSV or Parquet telemetry file, see :func:`iter_telemetry`.
+    params : ModelParams, optional
+        Starting model parameters.
+    initial_state : ModelState, optional
+        Starting model state.  Defaults to the first telemetry sample.
+    estimate : bool, optional
+        If ``True`` fit ``emissivity`` and ``eff_heat_cap`` online with
+        :class:`ThermalParamEstimator` and feed them back into the model.
+
+    Yields
+    ------
+    ReplayStep
+        One record per telemetry sample.  Nothing is accumulated, so memory
+        use is independent of the stream length.
+    """
+
+    params = params or ModelParams()
+    rows = iter_telemetry(path, columns=columns, chunksize=chunksize)
+    try:
+        t_prev, _, _, _, batt0, temp0 = next(rows)
+    except StopIteration:
+        return
+
+    state = initial_state or ModelState(batt0, temp0, 0.0)
+    estimator = (
+        ThermalParamEstimator(params, state.asic_temp_K, **(estimator_kwargs or {}))
+        if estimate
+        else None
+    )
+
+    for t, u1, u2, u3, batt, temp in rows:
+        dt = t - t_prev
+        t_prev = t
+        if dt <= 0:
+            continue
+        if estimator is not None:
+            estimator.predict(u2 + params.asic_power_max * u3, dt)
+            estimator.update(temp)
+            params = estimator.current_params()
+        state = step(state, u1, u2, u3, dt, params)
+        yield ReplayStep(
+            time_s=t,
+            predicted=state,
+            measured_battery_Wh=batt,
+            measured_temp_K=temp,
+            estimated_temp_K=(
+                float(estimator.x[0]) if estimator is not None else state.asic_temp_K
+            ),
+            emissivity=params.emissivity,
+            eff_heat_cap=params.eff_heat_cap,
+            temp_residual_K=temp - state.asic_temp_K,
+            battery_residual_Wh=batt - state.battery_Wh,
+        )
+
+
+def summarize_replay(steps: Iterator[ReplayStep]) -> dict:
+    """Consume a replay and return running residual statistics."""
+
+    n = 0
+    sq_temp = 0.0
+    sq_batt = 0.0
+    max_temp = 0.0
+    last = None
+    for last in steps:
+        n += 1
+        sq_temp += last.temp_residual_K**2
+        sq_batt += last.battery_residual_Wh**2
+        max_temp = max(max_temp, abs(last.temp_residual_K))
+
+    if last is None:
+        return {"samples": 0}
+    return {
+        "samples": n,
+        "duration_s": last.time_s,
+        "temp_rms_K": (sq_temp / n) ** 0.5,
+        "temp_max_abs_K": max_temp,
+        "battery_rms_Wh": (sq_batt / n) ** 0.5,
+        "emissivity": last.emissivity,
+        "eff_heat_cap": last.eff_heat_cap,
+    }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m power.telemetry_replay <telemetry.csv|.parquet>")
+    else:
+        print(summarize_replay(replay_telemetry(sys.argv[1])))
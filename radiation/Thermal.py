@@ -7,6 +7,51 @@ import io
 
 VERBOSE = True  # Set to True to enable detailed output
 
+LAYERS = [
+    {
+        "name": "Silicon solar cells",
+        "thickness": 0.0002,
+        "rho": 2320.0,
+        "cp": 800.0,
+        "k": 150.0,
+        "Q": 0.0,
+    },
+    {
+        "name": "Thermal compound 1",
+        "thickness": 0.001,
+        "rho": 2100.0,
+        "cp": 1000.0,
+        "k": 1.5,
+        "Q": 0.0,
+    },
+    {
+        "name": "FR4 circuit board",
+        "thickness": 0.003,
+        "rho": 1850.0,
+        "cp": 820.0,
+        "k": 150,
+        "Q": 9.0 / 0.003,
+    },
+    {
+        "name": "Thermal compound 2",
+        "thickness": 0.001,
+        "rho": 2100.0,
+        "cp": 1000.0,
+        "k": 1.5,
+        "Q": 0.0,
+    },
+    {
+        "name": "Aluminum radiator",
+        "thickness": 0.002,
+        "rho": 2700.0,
+        "cp": 877.0,
+        "k": 205.0,
+        "Q": 0.0,
+    },
+]
+
+PCB_LAYER_IDX = 2  # zero-based index for "FR4 circuit board"
+
 
 def run_thermal_eclipse_model(
     orbit_period_s=None,
@@ -17,48 +62,7 @@ def run_thermal_eclipse_model(
     illumination_profile=None,
     verbose=VERBOSE,
 ):
-    layers = [
-        {
-            "name": "Silicon solar cells",
-            "thickness": 0.0002,
-            "rho": 2320.0,
-            "cp": 800.0,
-            "k": 150.0,
-            "Q": 0.0,
-        },
-        {
-            "name": "Thermal compound 1",
-            "thickness": 0.001,
-            "rho": 2100.0,
-            "cp": 1000.0,
-            "k": 1.5,
-            "Q": 0.0,
-        },
-        {
-            "name": "FR4 circuit board",
-            "thickness": 0.003,
-            "rho": 1850.0,
-            "cp": 820.0,
-            "k": 150,
-            "Q": 9.0 / 0.003,
-        },
-        {
-            "name": "Thermal compound 2",
-            "thickness": 0.001,
-            "rho": 2100.0,
-            "cp": 1000.0,
-            "k": 1.5,
-            "Q": 0.0,
-        },
-        {
-            "name": "Aluminum radiator",
-            "thickness": 0.002,
-            "rho": 2700.0,
-            "cp": 877.0,
-            "k": 205.0,
-            "Q": 0.0,
-        },
-    ]
+    layers = LAYERS
 
     L_total = sum(layer["thickness"] for layer in layers)
     N = 31
@@ -154,7 +158,7 @@ def run_thermal_eclipse_model(
             print(f"[thermal] Step {n+1}/{n_steps}: in_sun={in_sun}, T0={T[0]:.2f}K")
 
     # --- Board (CCA) temperature extraction ---
-    pcb_layer_idx = 2  # zero-based index for "FR4 circuit board"
+    pcb_layer_idx = PCB_LAYER_IDX
     mask = (x >= boundaries[pcb_layer_idx]) & (x < boundaries[pcb_layer_idx + 1])
     pcb_temps = T_hist[:, mask]
     max_pcb_C = np.max(pcb_temps) - 273.15
@@ -189,3 +193,10 @@ def run_thermal_eclipse_model(
         thermal_buf.seek(0)
 
     return T_hist, x, thermal_buf, temp_stats
+
+
+def board_temperature_history(T_hist, x):
+    """Return the hottest FR4 board node temperature (K) at each time step."""
+    boundaries = np.cumsum([0.0] + [layer["thickness"] for layer in LAYERS])
+    mask = (x >= boundaries[PCB_LAYER_IDX]) & (x < boundaries[PCB_LAYER_IDX + 1])
+    return T_hist[:, mask].max(axis=1)
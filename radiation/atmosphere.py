@@ -0,0 +1,350 @@
+"""Statistical atmospheric loss for ground station links.
+
+Gaseous absorption follows a zenith oxygen plus water-vapour table scaled
+by the cosecant of elevation.  Rain attenuation follows the ITU-R P.618
+slant-path method: the attenuation exceeded 0.01 % of the time comes from
+the station's 0.01 % rain rate and the P.838 specific attenuation, and is
+scaled to any other exceedance percentage ``p``.  Sampling ``p`` uniformly
+therefore draws rain attenuation from its climatological distribution, so
+a Monte Carlo over weather realizations is one vectorised array
+expression.  Rain also raises the downlink sky noise temperature.
+
+Station climatology (0.01 % rain rate, probability of rain and surface
+water-vapour density) comes from ``data/station_climate.json``, from keys
+on the station itself, or from latitude-band defaults.
+"""
+
+import functools
+import json
+import os
+
+import numpy as np
+from scipy.special import ndtri
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# ITU-R P.838-3 horizontal polarisation coefficients: f (GHz), k, alpha
+RAIN_COEFFS = np.array(
+    [
+        (1.0, 0.0000259, 0.9691),
+        (2.0, 0.0000847, 1.0664),
+        (4.0, 0.0001071, 1.6009),
+        (6.0, 0.0007056, 1.5900),
+        (8.0, 0.004115, 1.3905),
+        (10.0, 0.01217, 1.2571),
+        (12.0, 0.02386, 1.1825),
+        (15.0, 0.04481, 1.1233),
+        (20.0, 0.09164, 1.0568),
+        (25.0, 0.1571, 0.9991),
+        (30.0, 0.2403, 0.9485),
+        (35.0, 0.3374, 0.9047),
+        (40.0, 0.4431, 0.8673),
+    ]
+)
+# Sea-level zenith gaseous attenuation: f (GHz), oxygen (dB), water vapour
+# (dB per g/m^3), condensed from ITU-R P.676 Annex 2
+GAS_ZENITH = np.array(
+    [
+        (1.0, 0.030, 0.0003),
+        (2.0, 0.032, 0.0007),
+        (4.0, 0.036, 0.0014),
+        (8.0, 0.045, 0.0027),
+        (12.0, 0.050, 0.0060),
+        (16.0, 0.058, 0.0150),
+        (20.0, 0.070, 0.0600),
+        (22.2, 0.075, 0.0900),
+        (26.0, 0.090, 0.0350),
+        (30.0, 0.110, 0.0250),
+        (40.0, 0.200, 0.0300),
+    ]
+)
+# Mean radiating temperature of rain for sky noise (K)
+T_MEDIUM_K = 275.0
+# Below this elevation the cosecant and P.618 path models break down
+MIN_ELEVATION_DEG = 5.0
+# P.618 exceedance scaling is defined from 0.001 % to 5 % of the time
+P_MIN_PCT, P_MAX_PCT = 0.001, 5.0
+# Log-normal spread of the surface water-vapour density, truncated so the
+# worst case loss is bounded
+WATER_VAPOUR_SIGMA = 0.3
+WATER_VAPOUR_CLIP = 5.0
+
+N_REALIZATIONS = 2000
+AVAILABILITY_PERCENTILES = (5, 50, 95)
+
+# (|latitude| upper bound, climate) used when a station has no entry
+DEFAULT_CLIMATES = (
+    (
+        23.0,
+        {
+            "rain_rate_001_mm_h": 90.0,
+            "rain_probability_pct": 7.0,
+            "water_vapour_g_m3": 19.0,
+        },
+    ),
+    (
+        45.0,
+        {
+            "rain_rate_001_mm_h": 45.0,
+            "rain_probability_pct": 4.0,
+            "water_vapour_g_m3": 11.0,
+        },
+    ),
+    (
+        90.0,
+        {
+            "rain_rate_001_mm_h": 25.0,
+            "rain_probability_pct": 5.0,
+            "water_vapour_g_m3": 7.0,
+        },
+    ),
+)
+CLIMATE_KEYS = ("rain_rate_001_mm_h", "rain_probability_pct", "water_vapour_g_m3")
+
+
+@functools.lru_cache(maxsize=1)
+def _climate_table():
+    with open(os.path.join(DATA_DIR, "station_climate.json")) as fh:
+        return json.load(fh)
+
+
+def station_climate(gs):
+    """Return the rain and water-vapour climatology for a station dict."""
+    lat = gs["location"].latitude.degrees
+    climate = next(c for bound, c in DEFAULT_CLIMATES if abs(lat) <= bound)
+    climate = {**climate, **_climate_table().get(gs["name"], {})}
+    climate.update({key: gs[key] for key in CLIMATE_KEYS if gs.get(key) is not None})
+    climate["latitude_deg"] = lat
+    climate["altitude_km"] = gs["location"].elevation.m / 1e3
+    return climate
+
+
+def rain_coefficients(freq_hz):
+    """Return P.838 ``(k, alpha)`` interpolated in log frequency."""
+    log_f = np.log(np.clip(np.asarray(freq_hz) / 1e9, 1.0, 40.0))
+    f, k, alpha = (
+        np.log(RAIN_COEFFS[:, 0]),
+        np.log(RAIN_COEFFS[:, 1]),
+        RAIN_COEFFS[:, 2],
+    )
+    return np.exp(np.interp(log_f, f, k)), np.interp(log_f, f, alpha)
+
+
+def gaseous_loss_dB(freq_hz, elevation_deg, water_vapour_g_m3):
+    """Return slant-path oxygen plus water-vapour absorption (dB)."""
+    f_ghz = np.asarray(freq_hz) / 1e9
+    oxygen = np.interp(f_ghz, GAS_ZENITH[:, 0], GAS_ZENITH[:, 1])
+    vapour = np.interp(f_ghz, GAS_ZENITH[:, 0], GAS_ZENITH[:, 2])
+    sin_el = np.sin(np.radians(np.maximum(elevation_deg, MIN_ELEVATION_DEG)))
+    return (oxygen + vapour * water_vapour_g_m3) / sin_el
+
+
+def rain_attenuation_dB(
+    freq_hz, elevation_deg, p_pct, rain_rate_001, latitude_deg, altitude_km=0.0
+):
+    """Return the P.618 rain attenuation (dB) exceeded ``p_pct`` % of the time.
+
+    All arguments broadcast; ``p_pct`` is clipped to the 0.001-5 % range
+    the scaling law covers.
+    """
+    f_ghz = np.asarray(freq_hz, dtype=float) / 1e9
+    el = np.radians(np.maximum(elevation_deg, MIN_ELEVATION_DEG))
+    sin_el, cos_el = np.sin(el), np.cos(el)
+    lat = np.abs(latitude_deg)
+    p = np.clip(p_pct, P_MIN_PCT, P_MAX_PCT)
+
+    h_rain = 0.36 + np.where(lat > 23.0, 5.0 - 0.075 * (lat - 23.0), 5.0)
+    height = np.maximum(h_rain - altitude_km, 0.0)
+    slant = height / sin_el
+    ground = slant * cos_el
+    k, alpha = rain_coefficients(freq_hz)
+    gamma = k * np.asarray(rain_rate_001, dtype=float) ** alpha
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r001 = 1.0 / (
+            1.0
+            + 0.78 * np.sqrt(ground * gamma / f_ghz)
+            - 0.38 * (1 - np.exp(-2 * ground))
+        )
+        zeta = np.arctan2(height, ground * r001)
+        path = np.where(zeta > el, ground * r001 / cos_el, slant)
+        chi = np.where(lat < 36.0, 36.0 - lat, 0.0)
+        v001 = 1.0 / (
+            1.0
+            + np.sqrt(sin_el)
+            * (
+                31.0
+                * (1 - np.exp(-np.degrees(el) / (1 + chi)))
+                * np.sqrt(path * gamma)
+                / f_ghz**2
+                - 0.45
+            )
+        )
+        a001 = gamma * path * v001
+        beta = np.where(
+            (p >= 1.0) | (lat >= 36.0),
+            0.0,
+            np.where(
+                np.degrees(el) >= 25.0,
+                -0.005 * (lat - 36.0),
+                -0.005 * (lat - 36.0) + 1.8 - 4.25 * sin_el,
+            ),
+        )
+        exponent = -(
+            0.655 + 0.033 * np.log(p) - 0.045 * np.log(a001) - beta * (1 - p) * sin_el
+        )
+        a_p = a001 * (p / 0.01) ** exponent
+    return np.where(a001 > 0, np.nan_to_num(a_p), 0.0)
+
+
+def sky_noise_loss_dB(attenuation_dB, T_sys):
+    """Return the C/N0 loss (dB) from the sky noise a lossy path adds."""
+    delta_t = T_MEDIUM_K * (1 - 10 ** (-np.asarray(attenuation_dB) / 10))
+    return 10 * np.log10(1 + delta_t / T_sys)
+
+
+def max_atmospheric_loss_dB(freq_hz, elevation_deg, climate, T_sys=None):
+    """Return the largest loss (dB) :func:`atmospheric_loss_samples` can draw."""
+    vapour = np.asarray(climate["water_vapour_g_m3"]) * np.exp(
+        WATER_VAPOUR_SIGMA * WATER_VAPOUR_CLIP - 0.5 * WATER_VAPOUR_SIGMA**2
+    )
+    rain = rain_attenuation_dB(
+        freq_hz,
+        elevation_deg,
+        P_MIN_PCT,
+        climate["rain_rate_001_mm_h"],
+        climate["latitude_deg"],
+        climate["altitude_km"],
+    )
+    loss = gaseous_loss_dB(freq_hz, elevation_deg, vapour)
+    loss = loss + np.where(np.asarray(climate["rain_probability_pct"]) > 0, rain, 0.0)
+    if T_sys is not None:
+        loss = loss + sky_noise_loss_dB(loss, T_sys)
+    return loss
+
+
+def atmospheric_loss_dB(freq_hz, elevation_deg, climate, p_pct, T_sys=None):
+    """Return the loss (dB) exceeded ``p_pct`` % of the time.
+
+    The water-vapour density is taken at its ``p_pct`` upper quantile and
+    rain, which only falls in the station's rain probability, at its P.618
+    attenuation for ``p_pct``, so ``p_pct=50`` is the median weather state
+    of :func:`atmospheric_loss_samples`.  Arguments broadcast; with
+    ``T_sys`` (downlinks) the added sky noise is included.
+    """
+    p = np.asarray(p_pct, dtype=float)
+    z = np.clip(ndtri(1 - p / 100.0), -WATER_VAPOUR_CLIP, WATER_VAPOUR_CLIP)
+    vapour = np.asarray(climate["water_vapour_g_m3"]) * np.exp(
+        WATER_VAPOUR_SIGMA * z - 0.5 * WATER_VAPOUR_SIGMA**2
+    )
+    rain = rain_attenuation_dB(
+        freq_hz,
+        elevation_deg,
+        p,
+        climate["rain_rate_001_mm_h"],
+        climate["latitude_deg"],
+        climate["altitude_km"],
+    )
+    loss = gaseous_loss_dB(freq_hz, elevation_deg, vapour)
+    loss = loss + np.where(p < np.asarray(climate["rain_probability_pct"]), rain, 0.0)
+    if T_sys is not None:
+        loss = loss + sky_noise_loss_dB(loss, T_sys)
+    return loss
+
+
+def atmospheric_loss_samples(
+    freq_hz, elevation_deg, climate, n_realizations=N_REALIZATIONS, rng=None, T_sys=None
+):
+    """Return ``(n_realizations, P)`` loss samples (dB) for ``P`` passes.
+
+    ``freq_hz`` and ``elevation_deg`` are per pass and ``climate`` maps
+    :data:`CLIMATE_KEYS` plus ``latitude_deg`` and ``altitude_km`` to
+    per-pass arrays (or scalars).  Each realization draws one weather state
+    per pass: an exceedance percentage for rain, which only falls in the
+    station's rain probability, and a water-vapour density.  With
+    ``T_sys`` (downlinks) the added sky noise is included.
+    """
+    rng = np.random.default_rng(rng)
+    n_pass = np.size(elevation_deg)
+
+    def per_pass(value):
+        return np.broadcast_to(np.asarray(value, dtype=float), (n_pass,))
+
+    freq, elev = per_pass(freq_hz), per_pass(elevation_deg)
+    oxygen = gaseous_loss_dB(freq, elev, 0.0)
+    vapour = gaseous_loss_dB(freq, elev, per_pass(climate["water_vapour_g_m3"]))
+    vapour = vapour - oxygen
+    spread = rng.standard_normal((n_realizations, n_pass), dtype=np.float32)
+    spread = np.clip(spread, -WATER_VAPOUR_CLIP, WATER_VAPOUR_CLIP)
+    spread = np.exp(WATER_VAPOUR_SIGMA * spread - 0.5 * WATER_VAPOUR_SIGMA**2)
+    loss = (oxygen + vapour * spread).astype(np.float32)
+
+    # Rain falls in a few percent of draws; evaluate P.618 only for those
+    p_pct = 100.0 * rng.random((n_realizations, n_pass), dtype=np.float32)
+    real, col = np.nonzero(p_pct < per_pass(climate["rain_probability_pct"]))
+    loss[real, col] += rain_attenuation_dB(
+        freq[col],
+        elev[col],
+        p_pct[real, col].astype(float),
+        per_pass(climate["rain_rate_001_mm_h"])[col],
+        per_pass(climate["latitude_deg"])[col],
+        per_pass(climate["altitude_km"])[col],
+    )
+    if T_sys is not None:
+        loss += sky_noise_loss_dB(loss, T_sys).astype(np.float32)
+    return loss
+
+
+def band_availability(
+    passes,
+    n_realizations=N_REALIZATIONS,
+    seed=0,
+    T_sys=290,
+    percentiles=AVAILABILITY_PERCENTILES,
+):
+    """Return link availability percentiles per band over weather realizations.
+
+    ``passes`` maps a band key to a dict of per-pass arrays: clear-sky
+    ``margin_dB``, ``duration_s``, ``elevation_deg``, ``freq_hz`` and the
+    climate arrays of :func:`atmospheric_loss_samples`.  Availability is
+    the share of pass time whose margin stays positive after atmospheric
+    loss, computed for every realization, and is reported per band key
+    with the clear-sky value alongside the percentiles.  Only passes whose
+    margin lies between zero and :func:`max_atmospheric_loss_dB` are
+    sampled; the rest close or fail in every realization.
+    """
+    rng = np.random.default_rng(seed)
+    out = {}
+    for band, rec in passes.items():
+        rec = {key: np.asarray(val) for key, val in rec.items()}
+        duration = rec["duration_s"].astype(float)
+        if not duration.sum():
+            continue
+        margin = rec["margin_dB"].astype(float)
+        sure = margin > max_atmospheric_loss_dB(
+            rec["freq_hz"], rec["elevation_deg"], rec, T_sys
+        )
+        open_ = (margin > 0) & ~sure
+        closed = np.full(n_realizations, duration[sure].sum())
+        if open_.any():
+            sub = {key: val[open_] for key, val in rec.items()}
+            loss = atmospheric_loss_samples(
+                sub["freq_hz"],
+                sub["elevation_deg"],
+                sub,
+                n_realizations,
+                rng,
+                T_sys,
+            )
+            closed += (margin[open_] > loss) @ duration[open_]
+        avail = 100.0 * closed / duration.sum()
+        out[band] = {
+            "clear sky": float(
+                f"{100.0 * duration[margin > 0].sum() / duration.sum():.2f}"
+            ),
+            **{
+                f"p{q}": float(f"{v:.2f}")
+                for q, v in zip(percentiles, np.percentile(avail, percentiles))
+            },
+        }
+    return out
@@ -0,0 +1,178 @@
+"""Disk-backed contact plans (ground station pass lists).
+
+A contact plan depends only on the TLE, the station location, the
+elevation mask and the time window, so pass records are stored per
+``(TLE, station, mask)`` in a compact ``.npz`` file and reused across
+processes.  Each file covers one contiguous window; a request overlapping
+it only searches the missing tail, and one inside the window already
+searched is served without a search.
+"""
+
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+PASS_FIELDS = ("rise_tt", "set_tt", "max_tt", "max_alt_deg")
+
+# Incomplete passes at the end of a search window are dropped and the
+# covered window is cut this long (days) before their rise, so extending
+# the window re-finds the rise event.
+RISE_MARGIN_DAYS = 60.0 / 86400.0
+
+
+def default_store_dir():
+    """Return ``$CONTACT_PLAN_DIR`` or a folder in the system temp directory."""
+    return os.environ.get("CONTACT_PLAN_DIR") or os.path.join(
+        tempfile.gettempdir(), "orbital_btc_contact_plans"
+    )
+
+
+def empty_plan(start_tt, end_tt):
+    plan = {name: np.empty(0) for name in PASS_FIELDS}
+    plan["start_tt"] = float(start_tt)
+    plan["end_tt"] = float(end_tt)
+    plan["searched_tt"] = float(end_tt)
+    return plan
+
+
+def events_to_plan(tt, events, start_tt, end_tt, alt_deg_at):
+    """Pair ``find_events`` output into pass records.
+
+    ``alt_deg_at`` maps an array of TT Julian dates to elevations (deg) and
+    is used for the culmination elevation.  A pass already in progress at
+    ``start_tt`` is skipped, as in a single ``find_events`` call; a pass
+    still open at ``end_tt`` shortens the covered window instead, while
+    ``searched_tt`` keeps ``end_tt`` so the same request is not searched
+    again.
+    """
+    tt = np.asarray(tt, dtype=float)
+    events = np.asarray(events, dtype=int)
+    rises, sets, culms = [], [], []
+    rise = None
+    culm = []
+    open_rise = None
+    for t, ev in zip(tt, events):
+        if ev == 0:
+            rise, culm = t, []
+        elif ev == 1 and rise is not None:
+            culm.append(t)
+        elif ev == 2 and rise is not None:
+            rises.append(rise)
+            sets.append(t)
+            culms.append(culm or [0.5 * (rise + t)])
+            rise = None
+    if rise is not None:
+        open_rise = rise
+
+    plan = empty_plan(start_tt, end_tt)
+    if open_rise is not None:
+        plan["end_tt"] = max(float(start_tt), open_rise - RISE_MARGIN_DAYS)
+    if not rises:
+        return plan
+
+    flat = np.concatenate([np.asarray(c, dtype=float) for c in culms])
+    owner = np.repeat(np.arange(len(culms)), [len(c) for c in culms])
+    alts = np.asarray(alt_deg_at(flat), dtype=float)
+    order = np.lexsort((-alts, owner))
+    first = np.unique(owner[order], return_index=True)[1]
+    best = order[first]
+
+    plan["rise_tt"] = np.array(rises)
+    plan["set_tt"] = np.array(sets)
+    plan["max_tt"] = flat[best]
+    plan["max_alt_deg"] = alts[best]
+    return plan
+
+
+def append_plan(plan, tail):
+    """Return ``plan`` extended by ``tail``, which starts at ``plan``'s end."""
+    keep = tail["rise_tt"] >= plan["end_tt"]
+    merged = {
+        name: np.concatenate([plan[name], tail[name][keep]]) for name in PASS_FIELDS
+    }
+    merged["start_tt"] = plan["start_tt"]
+    merged["end_tt"] = tail["end_tt"]
+    merged["searched_tt"] = tail["searched_tt"]
+    return merged
+
+
+def window_plan(plan, start_tt, end_tt):
+    """Return the passes that rise and set inside ``[start_tt, end_tt]``."""
+    mask = (plan["rise_tt"] >= start_tt) & (plan["set_tt"] <= end_tt)
+    out = {name: plan[name][mask] for name in PASS_FIELDS}
+    out["start_tt"] = float(start_tt)
+    out["end_tt"] = float(end_tt)
+    return out
+
+
+class ContactPlanStore:
+    """Directory of contact plan files, one per TLE, station and mask."""
+
+    def __init__(self, directory=None):
+        self.directory = directory or default_store_dir()
+
+    @staticmethod
+    def key(tle, lat_deg, lon_deg, elev_m, altitude_degrees):
+        ident = "|".join(
+            [
+                tle[0].strip(),
+                tle[1].strip(),
+                f"{lat_deg:.6f}",
+                f"{lon_deg:.6f}",
+                f"{elev_m:.1f}",
+                f"{altitude_degrees:.3f}",
+            ]
+        )
+        return hashlib.sha1(ident.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def load(self, key):
+        """Return the stored plan for ``key`` or ``None``."""
+        try:
+            with np.load(self._path(key)) as data:
+                plan = {name: data[name] for name in PASS_FIELDS}
+                plan["start_tt"] = float(data["start_tt"])
+                plan["end_tt"] = float(data["end_tt"])
+                plan["searched_tt"] = float(
+                    data["searched_tt"] if "searched_tt" in data else data["end_tt"]
+                )
+                return plan
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def save(self, key, plan):
+        """Write ``plan`` atomically; storage errors are ignored."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".npz")
+            with os.fdopen(fd, "wb") as fh:
+                np.savez(
+                    fh,
+                    **{name: plan[name] for name in PASS_FIELDS},
+                    start_tt=plan["start_tt"],
+                    end_tt=plan["end_tt"],
+                    searched_tt=plan["searched_tt"],
+                )
+            os.replace(tmp, self._path(key))
+        except OSError:
+            pass
+
+    @staticmethod
+    def missing(plan, start_tt, end_tt):
+        """Return ``(search_start, search_end, extend)`` or ``None`` if covered.
+
+        ``extend`` is ``True`` when only the tail after the stored window is
+        searched and appended; otherwise the window is recomputed.  A pass
+        left open at the stored end never completes inside a window that
+        ends by ``searched_tt``, so such requests count as covered.
+        """
+        if plan is not None and plan["start_tt"] <= start_tt:
+            if plan["searched_tt"] >= end_tt:
+                return None
+            if plan["end_tt"] >= start_tt:
+                return plan["end_tt"], end_tt, True
+        return start_tt, end_tt, False
@@ -0,0 +1,286 @@
+"""Ground station contention scheduling for a constellation.
+
+Every station can serve one satellite at a time, so overlapping passes of
+different satellites over the same station compete.  Passes are booked
+whole, highest priority first: the classic priority-queue greedy accepts
+the best remaining pass, drops every pass it overlaps at that station and
+repeats.  The same bookings are produced in parallel rounds: a pass whose
+priority beats every live pass it overlaps would be popped before any of
+them, so all such local maxima are accepted at once and their overlaps
+dropped.  Overlap queries use the passes sorted by station and rise time,
+where the passes overlapping pass ``i`` later in the order form the index
+range ``(i, hi_i)``, answered with sparse-table range maxima.  Each round
+is a handful of array passes over the live passes, so hundreds of
+satellites and stations over a month take seconds.
+
+Priorities are the pass data volume (``objective="volume"``) or its
+proportional-fair utility given the share of its demand each satellite has
+already been booked (``objective="fairness"``).  Fair priorities change as
+passes are booked, so those are booked one window (a day by default) at a
+time and refreshed in between, as a daily network schedule would be.
+"""
+
+import numpy as np
+
+from radiation.contact_windows import merge_intervals
+
+OBJECTIVES = ("volume", "fairness")
+# Served share of its own demand below which a satellite's fairness
+# utility stops growing, so starved satellites rank ahead but stay finite
+FAIRNESS_FLOOR = 0.01
+
+
+def constellation_contact_plans(tles, gs_list, t0, t1, **kwargs):
+    """Return ``plans[sat][station]`` for every TLE over the same stations.
+
+    Keyword arguments go to :func:`radiation.rf_model.station_contact_plans`,
+    so stored plans are reused across runs.
+    """
+    from radiation.rf_model import station_contact_plans
+
+    return [station_contact_plans(tle, gs_list, t0, t1, **kwargs) for tle in tles]
+
+
+def flatten_plans(plans, rates_bps=None, start_tt=-np.inf, end_tt=np.inf):
+    """Return flat pass arrays from ``plans[sat][station]`` contact plans.
+
+    ``rates_bps`` gives each satellite's downlink rate (default 1, so
+    volume is contact seconds).  Passes are clipped to ``[start_tt,
+    end_tt]``.  Returns a dict of ``sat``, ``station``, ``rise_tt``,
+    ``set_tt`` and ``volume`` arrays.
+    """
+    rise, fall, sat, station = [], [], [], []
+    for i, sat_plans in enumerate(plans):
+        for j, plan in enumerate(sat_plans):
+            rise.append(np.maximum(np.asarray(plan["rise_tt"], float), start_tt))
+            fall.append(np.minimum(np.asarray(plan["set_tt"], float), end_tt))
+            sat.append(i)
+            station.append(j)
+    counts = [len(r) for r in rise]
+    rates = np.ones(len(plans)) if rates_bps is None else np.asarray(rates_bps, float)
+    passes = {
+        "sat": np.repeat(np.array(sat, dtype=int), counts),
+        "station": np.repeat(np.array(station, dtype=int), counts),
+        "rise_tt": np.concatenate(rise) if rise else np.zeros(0),
+        "set_tt": np.concatenate(fall) if fall else np.zeros(0),
+    }
+    duration_s = (passes["set_tt"] - passes["rise_tt"]) * 86400
+    passes["volume"] = duration_s * rates[passes["sat"]]
+    return passes
+
+
+def _levels(lengths):
+    """Return ``floor(log2(lengths))`` for positive integer lengths."""
+    return np.frexp(np.maximum(lengths, 1))[1] - 1
+
+
+def _range_max(values, lo, hi):
+    """Return ``max(values[lo:hi])`` per query (``-inf`` for empty ranges)."""
+    out = np.full(len(lo), -np.inf)
+    length = hi - lo
+    level = _levels(length)
+    table = values.astype(float)
+    for k in range(int(level.max(initial=-1)) + 1):
+        if k:
+            half = 1 << (k - 1)
+            table = np.maximum(table[:-half], table[half:])
+        q = (level == k) & (length > 0)
+        out[q] = np.maximum(table[lo[q]], table[hi[q] - (1 << k)])
+    return out
+
+
+def _range_max_update(values, lo, hi):
+    """Return, per index, the max of ``values[j]`` over ranges ``[lo_j, hi_j)``
+    containing it (``-inf`` where none does)."""
+    n = len(values)
+    length = hi - lo
+    level = np.where(length > 0, _levels(length), -1)
+    top = int(level.max(initial=-1))
+    cur = np.full(n, -np.inf)
+    for k in range(top, -1, -1):
+        q = level == k
+        size = 1 << k
+        nxt = np.full(n, -np.inf)
+        np.maximum.at(nxt, lo[q], values[q])
+        np.maximum.at(nxt, hi[q] - size, values[q])
+        if k < top:
+            # Split each size-2k block of the level above into two halves
+            nxt = np.maximum(nxt, cur)
+            nxt[size:] = np.maximum(nxt[size:], cur[:-size])
+        cur = nxt
+    return cur
+
+
+def _priority(passes, idx, booked, demand, objective):
+    """Return the booking priority of passes ``idx``."""
+    volume = passes["volume"][idx]
+    if objective == "volume":
+        return volume
+    # Marginal gain in log(served share of demand) for the pass's satellite
+    sat = passes["sat"][idx]
+    return np.log1p(volume / (booked[sat] + FAIRNESS_FLOOR * demand[sat]))
+
+
+def schedule_contacts(
+    plans,
+    start_tt,
+    end_tt,
+    objective="volume",
+    rates_bps=None,
+    min_contact_s=0.0,
+    refresh_days=1.0,
+):
+    """Assign contended ground station passes to satellites.
+
+    Parameters
+    ----------
+    plans : list of list of dict
+        ``plans[sat][station]`` contact plans (``rise_tt`` / ``set_tt``
+        arrays), e.g. from :func:`radiation.rf_model.station_contact_plans`
+        with the same station list for every satellite.
+    start_tt, end_tt : float
+        Analysis window (TT Julian dates).
+    objective : str
+        ``"volume"`` books the largest passes first; ``"fairness"`` ranks
+        passes by their gain in log served share of the satellite's demand
+        (proportional fairness), so satellites with little of their own
+        contact booked win conflicts.
+    rates_bps : array_like, optional
+        Downlink rate per satellite used for pass volume.
+    min_contact_s : float
+        Passes shorter than this are not booked.
+    refresh_days : float
+        With ``"fairness"``, passes are booked window by window of this
+        length and the priorities refreshed from the bookings so far.
+
+    Returns
+    -------
+    dict
+        ``booked`` (bool per flattened pass) and the ``passes`` arrays,
+        per-satellite ``contact_fraction`` (union of booked passes over the
+        window), ``demand_fraction`` (union of all its passes),
+        ``booked_volume`` and ``station_utilization``, plus ``rounds``.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown scheduling objective: {objective}")
+    n_sat = len(plans)
+    n_st = max((len(p) for p in plans), default=0)
+    passes = flatten_plans(plans, rates_bps, start_tt, end_tt)
+
+    # Station-major time keys; passes overlapping pass i later in the
+    # order are (i, hi_i)
+    span = end_tt - start_tt + 1.0
+    key = passes["station"] * span + (passes["rise_tt"] - start_tt)
+    order = np.argsort(key)
+    passes = {name: val[order] for name, val in passes.items()}
+    n = len(order)
+    hi = np.searchsorted(
+        key[order], passes["station"] * span + (passes["set_tt"] - start_tt)
+    )
+    hi = np.maximum(hi, np.arange(n) + 1)
+
+    alive = (passes["set_tt"] - passes["rise_tt"]) * 86400 >= min_contact_s
+    booked = np.zeros(n, dtype=bool)
+    booked_volume = np.zeros(n_sat)
+    demand = np.bincount(passes["sat"], weights=passes["volume"], minlength=n_sat)
+
+    # Static priorities need a single booking window over everything
+    refresh = refresh_days if objective == "fairness" else span
+    epoch = ((passes["rise_tt"] - start_tt) // refresh).astype(int)
+    n_epoch = int(epoch.max(initial=-1)) + 1
+    by_epoch = np.argsort(epoch, kind="stable")
+    bounds = np.searchsorted(epoch[by_epoch], np.arange(n_epoch + 1))
+    longest = (passes["set_tt"] - passes["rise_tt"]).max(initial=0.0)
+    reach = int(np.ceil(longest / refresh))
+    rounds = 0
+    for e in range(n_epoch):
+        # Later passes that may overlap this window's bookings compete as
+        # blockers only; dropping passes keeps every forward overlap range
+        # contiguous in the working order
+        work = np.sort(by_epoch[bounds[e] : bounds[min(e + reach + 1, n_epoch)]])
+        cutoff = start_tt + (e + 1) * refresh + longest
+        work = work[alive[work] & (passes["rise_tt"][work] < cutoff)]
+        current = epoch[work] == e
+        while current.any():
+            rounds += 1
+            c_lo = np.arange(1, len(work) + 1)
+            c_hi = np.searchsorted(work, hi[work])
+            prio = np.where(
+                current,
+                _priority(passes, work, booked_volume, demand, objective),
+                -np.inf,
+            )
+            ahead = _range_max(prio, c_lo, c_hi)
+            behind = _range_max_update(prio, c_lo, c_hi)
+            # Ties go to the earlier pass in station/rise order
+            win = current & (prio >= ahead) & (prio > behind)
+            booked[work[win]] = True
+            np.add.at(
+                booked_volume, passes["sat"][work[win]], passes["volume"][work[win]]
+            )
+
+            # Passes overlapping a winner, ahead of or behind it
+            wins = np.r_[0, np.cumsum(win)]
+            covered = np.zeros(len(work) + 1, dtype=int)
+            np.add.at(covered, c_lo[win], 1)
+            np.add.at(covered, c_hi[win], -1)
+            clash = (wins[c_hi] > wins[c_lo]) | (np.cumsum(covered)[:-1] > 0)
+            drop = win | clash
+            alive[work[drop]] = False
+            work, current = work[~drop], current[~drop]
+
+    window_s = (end_tt - start_tt) * 86400
+    # Satellite-major order, so the unions below sort presorted data
+    by_sat = np.argsort(passes["sat"] * span + (passes["rise_tt"] - start_tt))
+    contact_s = _union_by_sat(passes, by_sat[booked[by_sat]], n_sat, start_tt, span)
+    demand_s = _union_by_sat(passes, by_sat, n_sat, start_tt, span)
+    return {
+        "passes": passes,
+        "booked": booked,
+        "rounds": rounds,
+        "objective": objective,
+        "contact_fraction": contact_s / window_s,
+        "demand_fraction": demand_s / window_s,
+        "booked_volume": booked_volume,
+        "station_utilization": np.bincount(
+            passes["station"][booked],
+            weights=(passes["set_tt"] - passes["rise_tt"])[booked] * 86400,
+            minlength=n_st,
+        )
+        / window_s,
+    }
+
+
+def _union_by_sat(passes, idx, n_sat, start_tt, span):
+    """Return each satellite's covered time (s) over passes ``idx``."""
+    # Shifting each satellite by a window length keeps groups disjoint
+    offset = passes["sat"][idx] * span - start_tt
+    starts, ends = merge_intervals(
+        passes["rise_tt"][idx] + offset, passes["set_tt"][idx] + offset
+    )
+    group = np.floor(starts / span).astype(int)
+    return np.bincount(group, weights=(ends - starts) * 86400, minlength=n_sat)
+
+
+def schedule_summary(result, names=None):
+    """Format :func:`schedule_contacts` output for reports."""
+    names = names or [f"sat {i}" for i in range(len(result["contact_fraction"]))]
+    frac = result["contact_fraction"]
+    demand = result["demand_fraction"]
+    return {
+        "objective": result["objective"],
+        "Mean effective contact %": (
+            float(f"{100 * frac.mean():.2f}") if len(frac) else 0.0
+        ),
+        "Min effective contact %": (
+            float(f"{100 * frac.min():.2f}") if len(frac) else 0.0
+        ),
+        "Contact lost to contention %": (
+            float(f"{100 * (1 - frac.sum() / demand.sum()):.2f}")
+            if demand.sum()
+            else 0.0
+        ),
+        "Effective contact % by satellite": {
+            name: float(f"{100 * f:.2f}") for name, f in zip(names, frac)
+        },
+    }
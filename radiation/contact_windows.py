@@ -0,0 +1,118 @@
+"""Overlap-aware union of ground station contact intervals.
+
+Passes from different stations overlap in time, so summing pass durations
+double counts contact.  These helpers merge intervals with a sort and a
+running maximum (a vectorised sweep line), which is ``O(P log P)`` in the
+number of passes ``P``.
+"""
+
+import numpy as np
+
+
+def merge_intervals(starts, ends, tolerance=0.0):
+    """Return the union of ``[start, end]`` intervals as sorted disjoint arrays.
+
+    Intervals separated by no more than ``tolerance`` are joined.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    if not starts.size:
+        return starts, ends
+    order = np.argsort(starts, kind="stable")
+    s = starts[order]
+    e = np.maximum.accumulate(ends[order])
+    # A new merged interval begins where a start lies past every earlier end
+    new = np.empty(len(s), dtype=bool)
+    new[0] = True
+    new[1:] = s[1:] > e[:-1] + tolerance
+    first = np.flatnonzero(new)
+    last = np.append(first[1:] - 1, len(s) - 1)
+    return s[first], e[last]
+
+
+def covered_time(starts, ends):
+    """Return the total time covered by at least one interval."""
+    m_start, m_end = merge_intervals(starts, ends)
+    return float((m_end - m_start).sum())
+
+
+def gap_stats(m_start, m_end, window_start, window_end):
+    """Return statistics of the gaps between merged intervals in a window.
+
+    Gaps before the first and after the last contact are included.
+    """
+    bounds_start = np.concatenate(
+        [[window_start], np.clip(m_end, window_start, window_end)]
+    )
+    bounds_end = np.concatenate(
+        [np.clip(m_start, window_start, window_end), [window_end]]
+    )
+    gaps = bounds_end - bounds_start
+    gaps = gaps[gaps > 0]
+    if not gaps.size:
+        return {"count": 0, "max": 0.0, "mean": 0.0, "median": 0.0}
+    return {
+        "count": int(gaps.size),
+        "max": float(gaps.max()),
+        "mean": float(gaps.mean()),
+        "median": float(np.median(gaps)),
+    }
+
+
+def unique_contribution(starts, ends, groups):
+    """Return the time each group covers while no other group does.
+
+    All interval end points are sorted into elementary segments; a
+    cumulative sum of ``+1``/``-1`` markers gives each group's coverage
+    count per segment.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    labels, group_idx = np.unique(np.asarray(groups), return_inverse=True)
+    if not starts.size:
+        return {label: 0.0 for label in labels}
+
+    bounds = np.unique(np.concatenate([starts, ends]))
+    seg_len = np.diff(bounds)
+    first = np.searchsorted(bounds, starts)
+    last = np.searchsorted(bounds, ends)
+
+    delta = np.zeros((len(labels), len(bounds)))
+    np.add.at(delta, (group_idx, first), 1)
+    np.add.at(delta, (group_idx, last), -1)
+    covering = np.cumsum(delta, axis=1)[:, :-1] > 0
+
+    alone = covering & (covering.sum(axis=0) == 1)
+    return {label: float((seg_len * alone[g]).sum()) for g, label in enumerate(labels)}
+
+
+def contact_union(
+    starts, ends, groups=None, window_start=None, window_end=None, tolerance=0.0
+):
+    """Summarise overlapping contact intervals.
+
+    Returns the covered time, the summed (double counted) time, their
+    difference, gap statistics over the window (defaulting to the span of
+    the intervals) and, when ``groups`` is given, each group's unique
+    contribution.  Times are in the units of the inputs; ``tolerance``
+    joins intervals that only miss each other by rounding.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    m_start, m_end = merge_intervals(starts, ends, tolerance)
+    covered = float((m_end - m_start).sum())
+    summed = float((ends - starts).sum())
+    if window_start is None:
+        window_start = float(starts.min()) if starts.size else 0.0
+    if window_end is None:
+        window_end = float(ends.max()) if ends.size else window_start
+
+    result = {
+        "covered": covered,
+        "summed": summed,
+        "overlap": summed - covered,
+        "gaps": gap_stats(m_start, m_end, window_start, window_end),
+    }
+    if groups is not None:
+        result["unique_by_group"] = unique_contribution(starts, ends, groups)
+    return result
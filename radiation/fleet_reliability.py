@@ -0,0 +1,185 @@
+"""Array-backed ASIC fleet survival model.
+
+The fleet is tracked as counts per failure state rather than per-ASIC
+objects, so multi-million ASIC satellites cost the same to simulate as a
+CubeSat.  States are ``healthy``, ``degraded`` (hash cores lost to a
+single-event functional interrupt until the next power cycle) and
+``failed``.
+"""
+
+import numpy as np
+
+STATES = ("healthy", "degraded", "failed")
+# Fraction of nominal hashrate delivered by an ASIC in each state
+STATE_HASH_WEIGHTS = np.array([1.0, 0.5, 0.0])
+
+# Single-event upsets per ASIC per day for each RadiationModel SEU rating
+SEU_RATE_PER_DAY = {
+    "low": 1e-3,
+    "low-medium": 3e-3,
+    "medium": 1e-2,
+    "high": 3e-2,
+    "extreme": 1e-1,
+}
+
+BOLTZMANN_EV = 8.617333262e-5  # eV/K
+HOURS_PER_YEAR = 365.25 * 24
+
+
+class FleetReliabilityModel:
+    def __init__(
+        self,
+        asic_count,
+        seu_rating="low",
+        tid_krad_per_year=0.0,
+        tid_tolerance_krad=20.0,
+        board_temp_C=55.0,
+        asics_per_board=100,
+        sefi_fraction=0.01,
+        sel_fraction=1e-4,
+        recovery_per_step=0.9,
+        base_fit=200.0,
+        activation_energy_ev=0.7,
+        ref_temp_C=55.0,
+        tid_weibull_shape=4.0,
+        board_fit=500.0,
+    ):
+        self.asic_count = int(asic_count)
+        self.seu_per_day = SEU_RATE_PER_DAY.get(seu_rating, SEU_RATE_PER_DAY["medium"])
+        self.tid_krad_per_year = tid_krad_per_year
+        self.tid_tolerance_krad = tid_tolerance_krad
+        self.asics_per_board = max(int(asics_per_board), 1)
+        # Share of upsets that leave the part degraded (SEFI) or destroyed (SEL)
+        self.sefi_fraction = sefi_fraction
+        self.sel_fraction = sel_fraction
+        self.recovery_per_step = recovery_per_step
+        self.tid_weibull_shape = tid_weibull_shape
+        # Random wear-out (FIT = failures per 1e9 device hours), accelerated
+        # by board temperature with an Arrhenius factor
+        accel = np.exp(
+            activation_energy_ev
+            / BOLTZMANN_EV
+            * (1.0 / (ref_temp_C + 273.15) - 1.0 / (board_temp_C + 273.15))
+        )
+        self.thermal_accel = float(accel)
+        self.asic_fail_per_hour = base_fit * 1e-9 * accel
+        self.board_fail_per_hour = board_fit * 1e-9 * accel
+
+    @classmethod
+    def from_radiation(cls, rad_info, asic_count, **kwargs):
+        """Build a model from a ``RadiationModel.estimate_tid`` result."""
+        years = rad_info.get("years") or 1
+        return cls(
+            asic_count,
+            seu_rating=rad_info.get("seu_rating", "medium"),
+            tid_krad_per_year=rad_info.get("estimated_tid_krad", 0.0) / years,
+            **kwargs,
+        )
+
+    def _tid_survival(self, years):
+        dose = self.tid_krad_per_year * np.asarray(years, dtype=float)
+        return np.exp(-((dose / self.tid_tolerance_krad) ** self.tid_weibull_shape))
+
+    def transition_matrices(self, n_steps, step=0.25):
+        """Return ``(n_steps, 3, 3)`` per-step state transition matrices."""
+        step_days = step * 365.25
+        step_hours = step * HOURS_PER_YEAR
+        edges = np.arange(n_steps + 1) * step
+
+        seu = self.seu_per_day * step_days
+        p_degrade = 1.0 - np.exp(-seu * self.sefi_fraction)
+        p_sel = 1.0 - np.exp(-seu * self.sel_fraction)
+        p_wear = 1.0 - np.exp(-self.asic_fail_per_hour * step_hours)
+        surv = self._tid_survival(edges)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p_tid = np.where(surv[:-1] > 0, 1.0 - surv[1:] / surv[:-1], 1.0)
+        p_fail = 1.0 - (1.0 - p_sel) * (1.0 - p_wear) * (1.0 - p_tid)
+
+        M = np.zeros((n_steps, 3, 3))
+        M[:, 0, 1] = p_degrade * (1.0 - p_fail)
+        M[:, 0, 2] = p_fail
+        M[:, 0, 0] = 1.0 - M[:, 0, 1] - M[:, 0, 2]
+        M[:, 1, 0] = self.recovery_per_step * (1.0 - p_fail)
+        M[:, 1, 2] = p_fail
+        M[:, 1, 1] = 1.0 - M[:, 1, 0] - M[:, 1, 2]
+        M[:, 2, 2] = 1.0
+        return M
+
+    def board_failure_prob(self, step=0.25):
+        """Return the probability a board (and all its ASICs) fails in one step."""
+        return 1.0 - np.exp(-self.board_fail_per_hour * step * HOURS_PER_YEAR)
+
+    def expected_survival(self, mission_years, step=0.25):
+        """Propagate expected state counts over quarterly (or ``step``) steps.
+
+        Returns a dict with ``years`` (step end times), ``counts``
+        (``(n_steps + 1, 3)`` expected counts including ``t=0``) and
+        ``hashrate_curve``: the mean hashrate fraction over each step, aligned
+        with ``project_revenue_curve``.
+        """
+        n_steps = int(mission_years / step)
+        M = self.transition_matrices(n_steps, step)
+        board_keep = 1.0 - self.board_failure_prob(step)
+
+        counts = np.zeros((n_steps + 1, 3))
+        counts[0, 0] = self.asic_count
+        for i in range(n_steps):
+            nxt = counts[i] @ M[i]
+            lost = nxt[:2] * (1.0 - board_keep)
+            nxt[:2] -= lost
+            nxt[2] += lost.sum()
+            counts[i + 1] = nxt
+
+        frac = counts @ STATE_HASH_WEIGHTS / max(self.asic_count, 1)
+        return {
+            "years": (np.arange(n_steps) + 1) * step,
+            "counts": counts,
+            "hashrate_fraction": frac,
+            "hashrate_curve": 0.5 * (frac[:-1] + frac[1:]),
+        }
+
+    def monte_carlo(self, mission_years, step=0.25, n_trials=1000, seed=None):
+        """Monte Carlo of ASIC state transitions and whole-board failures.
+
+        Each trial holds integer counts per state plus the number of live
+        boards; all trials advance together with vectorised binomial and
+        multinomial draws.  Returns the hashrate fraction percentiles over
+        time alongside the raw ``(n_trials, n_steps + 1)`` curves.
+        """
+        rng = np.random.default_rng(seed)
+        n_steps = int(mission_years / step)
+        M = self.transition_matrices(n_steps, step)
+        p_board = self.board_failure_prob(step)
+        n_boards = -(-self.asic_count // self.asics_per_board)
+
+        counts = np.zeros((n_trials, 3), dtype=np.int64)
+        counts[:, 0] = self.asic_count
+        boards = np.full(n_trials, n_boards, dtype=np.int64)
+        frac = np.empty((n_trials, n_steps + 1))
+        frac[:, 0] = counts @ STATE_HASH_WEIGHTS / max(self.asic_count, 1)
+
+        for i in range(n_steps):
+            nxt = np.zeros_like(counts)
+            for src in (0, 1):
+                nxt += rng.multinomial(counts[:, src], M[i, src])
+            nxt[:, 2] += counts[:, 2]
+
+            lost_boards = rng.binomial(boards, p_board)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                p_lost = np.where(boards > 0, lost_boards / boards, 0.0)
+            boards -= lost_boards
+            for src in (0, 1):
+                lost = rng.binomial(nxt[:, src], p_lost)
+                nxt[:, src] -= lost
+                nxt[:, 2] += lost
+            counts = nxt
+            frac[:, i + 1] = counts @ STATE_HASH_WEIGHTS / max(self.asic_count, 1)
+
+        curves = 0.5 * (frac[:, :-1] + frac[:, 1:])
+        return {
+            "years": (np.arange(n_steps) + 1) * step,
+            "hashrate_curves": curves,
+            "p05": np.percentile(curves, 5, axis=0),
+            "p50": np.percentile(curves, 50, axis=0),
+            "p95": np.percentile(curves, 95, axis=0),
+        }
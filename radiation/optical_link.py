@@ -0,0 +1,258 @@
+"""Optical (laser) space-to-ground downlink budget and cloud availability.
+
+The budget follows the usual free-space optical form: diffraction-limited
+transmit and receive aperture gains, free-space loss at the laser
+wavelength, the mean Gaussian-beam pointing loss for a Rician pointing
+error (static bias plus jitter), aerosol extinction scaled by airmass, and
+a scintillation fade allowance.  Scintillation uses the Hufnagel-Valley
+5/7 turbulence profile above the station, the Andrews-Phillips plane-wave
+scintillation index (valid from weak to strong turbulence) reduced by
+aperture averaging, and the log-normal fade not exceeded more than
+``FADE_PROBABILITY`` of the time.  The link closes when the received power
+exceeds the terminal sensitivity in photons per bit at its data rate.
+
+Clouds block the link outright, so availability is the share of
+geometric contact that is both cloud free and above sensitivity.  Monthly
+cloud-free line-of-sight probabilities come from the
+``cloud_free_pct_monthly`` entries of ``data/station_climate.json`` (see
+:func:`radiation.atmosphere.station_climate`), falling back to
+latitude-band defaults.  Passes of one station within ``CLOUD_CELL_HOURS``
+share a cloud draw, and the Monte Carlo over realizations is a single
+Bernoulli array.
+"""
+
+import functools
+import json
+import os
+
+import numpy as np
+from scipy.special import erfcinv
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+H_PLANCK = 6.62607015e-34
+C_LIGHT = 2.99792458e8
+
+# Zenith aerosol plus molecular extinction at 1550 nm, clear rural air
+# (23 km visibility), and the aerosol scale height it decays with
+ZENITH_EXTINCTION_DB = 0.3
+AEROSOL_SCALE_HEIGHT_KM = 1.2
+# Hufnagel-Valley 5/7: ground turbulence strength (m^-2/3) and rms wind
+HV_GROUND_CN2 = 1.7e-14
+HV_WIND_M_S = 21.0
+# Top of the turbulent layer; sets the downlink intensity correlation width
+TURBULENCE_TOP_M = 20e3
+FADE_PROBABILITY = 1e-3
+MIN_ELEVATION_DEG = 5.0
+
+CLOUD_CELL_HOURS = 6.0
+N_REALIZATIONS = 2000
+AVAILABILITY_PERCENTILES = (5, 50, 95)
+# (|latitude| upper bound, annual cloud-free %) used without a table entry
+DEFAULT_CLOUD_FREE_PCT = ((23.0, 30.0), (45.0, 45.0), (90.0, 30.0))
+
+
+@functools.lru_cache(maxsize=1)
+def optical_terminals():
+    """Return the optical terminal catalog keyed by name."""
+    with open(os.path.join(DATA_DIR, "optical_terminals.json")) as fh:
+        return {rec["name"]: rec for rec in json.load(fh)}
+
+
+def optical_terminal(terminal):
+    """Return a terminal dict from a catalog name or a dict of overrides.
+
+    A dict naming a catalog terminal (``"name"``) overrides its fields;
+    any other dict is used as is.
+    """
+    if isinstance(terminal, str):
+        return dict(optical_terminals()[terminal])
+    base = optical_terminals().get(terminal.get("name"), {})
+    return {**base, **terminal}
+
+
+def aperture_gain_dB(diameter_m, wavelength_m):
+    """Return the diffraction-limited gain (dB) of a circular aperture."""
+    return 20 * np.log10(np.pi * np.asarray(diameter_m) / wavelength_m)
+
+
+def pointing_loss_dB(tx_gain_dB, jitter_rad, bias_rad):
+    """Return the mean Gaussian-beam pointing loss (dB).
+
+    The beam falls off as ``exp(-G theta^2 / 4)`` for on-axis gain ``G``;
+    averaging over a bias plus circular Gaussian jitter (``jitter_rad``
+    per axis) gives a closed form.
+    """
+    g = 10 ** (np.asarray(tx_gain_dB) / 10)
+    spread = 1 + 0.5 * g * jitter_rad**2
+    mean = np.exp(-0.25 * g * bias_rad**2 / spread) / spread
+    return -10 * np.log10(mean)
+
+
+def extinction_loss_dB(elevation_deg, altitude_km=0.0):
+    """Return clear-air extinction (dB) along the slant path."""
+    sin_el = np.sin(np.radians(np.maximum(elevation_deg, MIN_ELEVATION_DEG)))
+    zenith = ZENITH_EXTINCTION_DB * np.exp(
+        -np.asarray(altitude_km) / AEROSOL_SCALE_HEIGHT_KM
+    )
+    return zenith / sin_el
+
+
+@functools.lru_cache(maxsize=64)
+def _hv_moment(station_m, ground_cn2, wind_m_s):
+    """Return the integral of ``Cn2(h) (h - h0)^(5/6)`` above a station."""
+    h = np.linspace(station_m, station_m + TURBULENCE_TOP_M, 4001)
+    cn2 = (
+        0.00594 * (wind_m_s / 27.0) ** 2 * (1e-5 * h) ** 10 * np.exp(-h / 1000.0)
+        + 2.7e-16 * np.exp(-h / 1500.0)
+        + ground_cn2 * np.exp(-h / 100.0)
+    )
+    return float(np.trapz(cn2 * (h - station_m) ** (5 / 6), h))
+
+
+def scintillation_fade_dB(
+    elevation_deg,
+    wavelength_m,
+    aperture_m,
+    altitude_km=0.0,
+    ground_cn2=HV_GROUND_CN2,
+    wind_m_s=HV_WIND_M_S,
+    probability=FADE_PROBABILITY,
+):
+    """Return the downlink scintillation fade (dB) exceeded ``probability``.
+
+    ``altitude_km`` must be a scalar (one station); elevations broadcast.
+    """
+    zenith_sec = 1 / np.sin(np.radians(np.maximum(elevation_deg, MIN_ELEVATION_DEG)))
+    k = 2 * np.pi / wavelength_m
+    moment = _hv_moment(round(float(altitude_km) * 1e3), ground_cn2, wind_m_s)
+    rytov = 2.25 * k ** (7 / 6) * zenith_sec ** (11 / 6) * moment
+    s = rytov ** (6 / 5)
+    index = (
+        np.exp(
+            0.49 * rytov / (1 + 1.11 * s) ** (7 / 6)
+            + 0.51 * rytov / (1 + 0.69 * s) ** (5 / 6)
+        )
+        - 1
+    )
+    width = aperture_m**2 / (wavelength_m * TURBULENCE_TOP_M * zenith_sec)
+    index = index / (1 + 1.1 * width ** (7 / 6))
+    var = np.log1p(index)
+    # Log-normal irradiance with unit mean: the fade quantile in dB
+    return 10 / np.log(10) * (0.5 * var + np.sqrt(2 * var) * erfcinv(2 * probability))
+
+
+def optical_link_budget(
+    distance_m, elevation_deg, terminal, ground_aperture_m=None, altitude_km=0.0
+):
+    """Return the optical downlink budget for a terminal.
+
+    ``terminal`` is a catalog name or dict (see :func:`optical_terminal`);
+    ``ground_aperture_m`` defaults to the terminal's ``ground_aperture_m``.
+    Distances and elevations broadcast.  Returns a dict of the budget terms
+    in dB, ``P_rx_dBm``, ``required_dBm`` and ``link_margin_dB``.
+    """
+    term = optical_terminal(terminal)
+    wavelength = term["wavelength_nm"] * 1e-9
+    aperture = ground_aperture_m or term["ground_aperture_m"]
+    tx_gain = aperture_gain_dB(term["tx_aperture_m"], wavelength)
+    rx_gain = aperture_gain_dB(aperture, wavelength)
+    path = 20 * np.log10(4 * np.pi * np.asarray(distance_m, dtype=float) / wavelength)
+    pointing = pointing_loss_dB(
+        tx_gain, term["pointing_jitter_urad"] * 1e-6, term["pointing_bias_urad"] * 1e-6
+    )
+    extinction = extinction_loss_dB(elevation_deg, altitude_km)
+    fade = scintillation_fade_dB(elevation_deg, wavelength, aperture, altitude_km)
+    P_rx_dBm = (
+        10 * np.log10(term["tx_power_W"] * 1e3)
+        + tx_gain
+        - term["tx_optics_loss_dB"]
+        - pointing
+        - path
+        - extinction
+        - fade
+        + rx_gain
+        - term["rx_optics_loss_dB"]
+    )
+    photon_J = H_PLANCK * C_LIGHT / wavelength
+    required_W = term["sensitivity_photons_per_bit"] * photon_J * term["data_rate_bps"]
+    required_dBm = 10 * np.log10(required_W * 1e3)
+    return {
+        "tx_gain_dB": tx_gain,
+        "rx_gain_dB": rx_gain,
+        "path_loss_dB": path,
+        "pointing_loss_dB": pointing,
+        "extinction_dB": extinction,
+        "scintillation_fade_dB": fade,
+        "P_rx_dBm": P_rx_dBm,
+        "required_dBm": required_dBm,
+        "link_margin_dB": P_rx_dBm - required_dBm,
+    }
+
+
+def cloud_free_probability(climate, month):
+    """Return the cloud-free line-of-sight probability for months 1-12.
+
+    ``climate`` is a :func:`radiation.atmosphere.station_climate` dict;
+    ``cloud_free_pct_monthly`` wins over an annual ``cloud_free_pct``,
+    then the latitude-band default.
+    """
+    month = np.asarray(month, dtype=int)
+    if climate.get("cloud_free_pct_monthly") is not None:
+        pct = np.asarray(climate["cloud_free_pct_monthly"], dtype=float)[month - 1]
+    elif climate.get("cloud_free_pct") is not None:
+        pct = np.full(month.shape, float(climate["cloud_free_pct"]))
+    else:
+        lat = abs(climate["latitude_deg"])
+        pct = np.full(
+            month.shape, next(p for bound, p in DEFAULT_CLOUD_FREE_PCT if lat <= bound)
+        )
+    return pct / 100.0
+
+
+def optical_availability(
+    passes,
+    data_rate_bps,
+    n_realizations=N_REALIZATIONS,
+    seed=0,
+    percentiles=AVAILABILITY_PERCENTILES,
+):
+    """Return optical downlink availability and volume over cloud realizations.
+
+    ``passes`` holds per-pass arrays: geometric ``contact_s`` above the
+    terminal's minimum elevation, ``usable_s`` of it above sensitivity,
+    ``cloud_free`` probability and an integer ``cell`` shared by passes
+    that see the same clouds.  Each realization draws every cell clear or
+    overcast once.
+    """
+    rec = {key: np.asarray(val) for key, val in passes.items()}
+    contact = rec["contact_s"].astype(float)
+    usable = rec["usable_s"].astype(float)
+    if not contact.sum():
+        return {}
+    cells, cell_idx = np.unique(rec["cell"], return_inverse=True)
+    cell_p = np.zeros(len(cells))
+    # A cell's probability is that of its passes (same station and month)
+    cell_p[cell_idx] = rec["cloud_free"]
+    rng = np.random.default_rng(seed)
+    clear = rng.random((n_realizations, len(cells)), dtype=np.float32) < cell_p
+    usable_s = clear[:, cell_idx] @ usable
+    avail = 100.0 * usable_s / contact.sum()
+    volume_GB = usable_s * data_rate_bps / 8 / 1e9
+    return {
+        "Contact above min elevation (hr)": float(f"{contact.sum() / 3600:.2f}"),
+        "Mean cloud-free probability (%)": float(
+            f"{100 * (rec['cloud_free'] @ contact) / contact.sum():.1f}"
+        ),
+        "Availability (%)": {
+            "clear sky": float(f"{100.0 * usable.sum() / contact.sum():.2f}"),
+            **{
+                f"p{q}": float(f"{v:.2f}")
+                for q, v in zip(percentiles, np.percentile(avail, percentiles))
+            },
+        },
+        "Downlink data (GB)": {
+            f"p{q}": float(f"{v:.1f}")
+            for q, v in zip(percentiles, np.percentile(volume_GB, percentiles))
+        },
+    }
@@ -0,0 +1,229 @@
+"""Coarse-to-fine ground station pass prediction.
+
+``EarthSatellite.find_events`` walks every station over the whole window.
+Here the satellite is propagated once on a coarse grid shared by all
+stations, and a KD-tree query of the satellite's horizon footprint (see
+:mod:`radiation.station_db`) keeps only the stations that could reach the
+elevation mask around each sample.  Only those runs are resampled finely.
+Culminations are refined by golden-section search and rise/set times by
+bisection, all vectorised over every candidate of every station at once.
+The output has the same ``(tt, events)`` layout as ``find_events``.
+"""
+
+import numpy as np
+from skyfield.sgp4lib import theta_GMST1982
+
+from radiation.station_db import StationDatabase, horizon_range_km
+
+DAY_S = 86400.0
+OMEGA_EARTH_RAD_S = 7.2921159e-5
+# Refinement samples per coarse grid interval
+FINE_SAMPLES = 10
+TOLERANCE_S = 0.05
+_GOLDEN = (np.sqrt(5.0) - 1.0) / 2.0
+
+
+def _pef_track(sat, ts, t0_tt, t1_tt):
+    """Return a function mapping TT dates to pseudo Earth-fixed positions.
+
+    SGP4 output is rotated by GMST alone, as the SGP4 reference code does;
+    precession, nutation and polar motion move the station by metres,
+    far below the timing tolerance.  The TT to UTC and UT1 offsets are
+    interpolated from daily knots so no ``Time`` is built per evaluation.
+    """
+    knots = np.linspace(t0_tt, t1_tt, max(int(np.ceil(t1_tt - t0_tt)), 1) + 1)
+    t = ts.tt_jd(knots)
+    ut1_off = knots - t.ut1
+    utc_off = ut1_off + t.dut1 / DAY_S
+
+    def positions(t_tt, velocity=False):
+        t_tt = np.asarray(t_tt, dtype=float)
+        utc = t_tt - np.interp(t_tt, knots, utc_off)
+        whole = np.floor(utc)
+        _err, r, v = sat.model.sgp4_array(whole, utc - whole)
+        ut1 = t_tt - np.interp(t_tt, knots, ut1_off)
+        whole = np.floor(ut1)
+        theta, _ = theta_GMST1982(whole, ut1 - whole)
+        c, s = np.cos(theta), np.sin(theta)
+        pef = np.stack(
+            [c * r[:, 0] + s * r[:, 1], -s * r[:, 0] + c * r[:, 1], r[:, 2]], -1
+        )
+        return (pef, np.linalg.norm(v, axis=1)) if velocity else pef
+
+    return positions
+
+
+def _pair_elevation(track, t_tt, stations, idx):
+    """Return elevations (deg) of station ``idx[i]`` at time ``t_tt[i]``."""
+    if not len(t_tt):
+        return np.zeros(0)
+    pos, up = stations
+    rho = track(t_tt) - pos[idx]
+    sin_alt = np.einsum("nk,nk->n", rho, up[idx]) / np.linalg.norm(rho, axis=1)
+    return np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+
+
+def _coarse_step_days(sat):
+    # The same sampling find_events uses: 1/20 of an orbit, at most 6 hours
+    orbits_per_day = sat.model.no_kozai / (2 * np.pi) * 1440.0
+    return min(0.05 / max(orbits_per_day, 1.0), 0.25)
+
+
+def _candidate_runs(track, t0_tt, t1_tt, n, db, altitude_degrees):
+    """Return ``(station, first, last)`` grid index runs that may reach the mask.
+
+    The grid has ``n`` intervals over the window.  Each grid sample queries
+    ``db`` for stations within the horizon footprint, widened by how far
+    the satellite can move over the Earth in half an interval.
+    """
+    grid = np.linspace(t0_tt, t1_tt, n + 1)
+    sat_km, speed = track(grid, velocity=True)
+    r = np.linalg.norm(sat_km, axis=1)
+    # Earth-fixed speed bound: inertial speed plus the frame rotation
+    drift_km = 0.5 * np.nanmax(speed + OMEGA_EARTH_RAD_S * r) * (grid[1] - grid[0])
+    drift_km *= DAY_S
+    sample, station = db.query_pairs(
+        sat_km, horizon_range_km(r, altitude_degrees) + drift_km
+    )
+
+    # A hit at sample i covers intervals i-1 and i; one more interval each
+    # side keeps culminations off the run edges
+    interval = (sample[:, None] + np.arange(-2, 2)).ravel()
+    station = np.repeat(station, 4)
+    ok = (interval >= 0) & (interval < n)
+    station, interval = np.divmod(np.unique(station[ok] * n + interval[ok]), n)
+    if not station.size:
+        return station, interval, interval
+    starts = np.r_[True, (station[1:] != station[:-1]) | (np.diff(interval) != 1)]
+    ends = np.r_[starts[1:], True]
+    return station[starts], interval[starts], interval[ends] + 1
+
+
+def _fine_samples(runs, per_interval):
+    """Return run, station and fine grid index of every refinement sample."""
+    station, first, last = runs
+    n = (last - first) * per_interval + 1
+    owner = np.repeat(np.arange(len(n)), n)
+    k = np.arange(owner.size) - np.repeat(np.cumsum(n) - n, n)
+    return owner, station[owner], first[owner] * per_interval + k
+
+
+def _refine_maxima(track, stations, idx, lo, hi, tol_days):
+    """Golden-section search for the elevation maximum in each bracket."""
+    if not len(lo):
+        return lo, lo
+    width = max(float((hi - lo).max()), tol_days)
+    iters = int(np.ceil(np.log(tol_days / width) / np.log(_GOLDEN)))
+    c = hi - _GOLDEN * (hi - lo)
+    d = lo + _GOLDEN * (hi - lo)
+    fc = _pair_elevation(track, c, stations, idx)
+    fd = _pair_elevation(track, d, stations, idx)
+    for _ in range(iters):
+        left = fc >= fd
+        hi = np.where(left, d, hi)
+        lo = np.where(left, lo, c)
+        # One new probe per bracket; the surviving probe is reused
+        x = np.where(left, hi - _GOLDEN * (hi - lo), lo + _GOLDEN * (hi - lo))
+        fx = _pair_elevation(track, x, stations, idx)
+        c, d = np.where(left, x, d), np.where(left, c, x)
+        fc, fd = np.where(left, fx, fd), np.where(left, fc, fx)
+    t = 0.5 * (lo + hi)
+    return t, _pair_elevation(track, t, stations, idx)
+
+
+def _refine_crossings(track, stations, idx, lo, hi, rising, altitude_degrees, tol_days):
+    """Bisect each bracket for the time the elevation crosses the mask."""
+    if not len(lo):
+        return lo
+    iters = int(np.ceil(np.log2(max(float((hi - lo).max()), tol_days) / tol_days)))
+    for _ in range(iters):
+        mid = 0.5 * (lo + hi)
+        up = _pair_elevation(track, mid, stations, idx) >= altitude_degrees
+        # Keep the half whose ends still straddle the mask
+        go_left = up == rising
+        hi = np.where(go_left, mid, hi)
+        lo = np.where(go_left, lo, mid)
+    return 0.5 * (lo + hi)
+
+
+def screen_station_events(
+    sat,
+    gs_list,
+    t0,
+    t1,
+    altitude_degrees=10.0,
+    fine_samples=FINE_SAMPLES,
+    tolerance_s=TOLERANCE_S,
+):
+    """Return ``find_events``-style ``(tt, events)`` arrays per station.
+
+    Events are ``0`` rise, ``1`` culmination above ``altitude_degrees`` and
+    ``2`` set, as TT Julian dates to within ``tolerance_s``.  As with
+    ``find_events``, a pass already up at ``t0`` has no rise and one still
+    up at ``t1`` has no set.  ``gs_list`` may also be a
+    :class:`~radiation.station_db.StationDatabase`, whose tree is reused.
+    """
+    ts = t0.ts
+    tol = tolerance_s / DAY_S
+    db = gs_list if isinstance(gs_list, StationDatabase) else StationDatabase(gs_list)
+    stations = (db.positions_km, db.up)
+    empty = (np.zeros(0), np.zeros(0, dtype=int))
+    tt0, tt1 = float(t0.tt), float(t1.tt)
+    track = _pef_track(sat, ts, tt0, tt1)
+    n = max(int(np.ceil((tt1 - tt0) / _coarse_step_days(sat))), 1)
+    runs = _candidate_runs(track, tt0, tt1, n, db, altitude_degrees)
+    if not len(runs[0]):
+        return [empty for _ in range(len(db))]
+
+    # Runs share the fine grid, so each fine time is propagated once
+    owner, idx, k = _fine_samples(runs, fine_samples)
+    k_unique, k_inv = np.unique(k, return_inverse=True)
+    t_unique = tt0 + k_unique * ((tt1 - tt0) / (n * fine_samples))
+    pos, up = stations
+    rho = track(t_unique)[k_inv] - pos[idx]
+    sin_alt = np.einsum("nk,nk->n", rho, up[idx]) / np.linalg.norm(rho, axis=1)
+    alt = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+    t = t_unique[k_inv]
+
+    # Interior local maxima of each run, refined and kept above the mask
+    same = owner[1:-1] == owner[:-2]
+    same &= owner[1:-1] == owner[2:]
+    peak = np.flatnonzero(same & (alt[1:-1] >= alt[:-2]) & (alt[1:-1] > alt[2:])) + 1
+    t_max, alt_max = _refine_maxima(
+        track, stations, idx[peak], t[peak - 1], t[peak + 1], tol
+    )
+    keep = alt_max >= altitude_degrees
+    t_max, max_owner, max_idx = t_max[keep], owner[peak][keep], idx[peak][keep]
+
+    # Insert the culminations so every pass above the mask is bracketed
+    order = np.lexsort((np.concatenate([t, t_max]), np.concatenate([owner, max_owner])))
+    s_t = np.concatenate([t, t_max])[order]
+    s_owner = np.concatenate([owner, max_owner])[order]
+    s_idx = np.concatenate([idx, max_idx])[order]
+    s_up = np.concatenate([alt, np.full(len(t_max), np.inf)])[order] >= altitude_degrees
+
+    cross = np.flatnonzero((s_up[1:] != s_up[:-1]) & (s_owner[1:] == s_owner[:-1]))
+    rising = ~s_up[cross]
+    t_cross = _refine_crossings(
+        track,
+        stations,
+        s_idx[cross],
+        s_t[cross],
+        s_t[cross + 1],
+        rising,
+        altitude_degrees,
+        tol,
+    )
+
+    ev_t = np.concatenate([t_max, t_cross])
+    ev_code = np.concatenate([np.ones(len(t_max), dtype=int), np.where(rising, 0, 2)])
+    ev_station = np.concatenate([max_idx, s_idx[cross]])
+    inside = (ev_t >= tt0) & (ev_t <= tt1)
+    ev_t, ev_code, ev_station = ev_t[inside], ev_code[inside], ev_station[inside]
+
+    out = []
+    for j in range(len(db)):
+        mine = ev_station == j
+        o = np.argsort(ev_t[mine], kind="stable")
+        out.append((ev_t[mine][o], ev_code[mine][o]))
+    return out
@@ -0,0 +1,235 @@
+"""GEO relay inter-satellite link (ISL) visibility and margin model.
+
+The user satellite and a configurable set of GEO relays are placed in the
+Earth-fixed frame for a whole time array at once.  A relay is usable when
+the straight line to it clears the Earth (plus a grazing altitude) and the
+ISL budget from :func:`radiation.rf_model.calc_link_budget_array` closes.
+"""
+
+import io
+
+import numpy as np
+from radiation.rf_model import (
+    analysis_window,
+    calc_link_budget_array,
+    get_pyplot,
+    modulation_code,
+)
+from radiation.sky_pool import get_satellite, get_timescale, satellite_itrs_km
+
+R_EARTH_KM = 6378.137
+R_GEO_KM = 42164.0
+MU_EARTH_KM3_S2 = 398600.4418
+OMEGA_EARTH_RAD_S = 7.2921159e-5
+# Rays passing lower than this over the surface are treated as blocked
+GRAZING_ALTITUDE_KM = 100.0
+
+DEFAULT_GEO_RELAYS = [
+    {"name": "GEO Relay 41W", "longitude_deg": -41.0},
+    {"name": "GEO Relay 174W", "longitude_deg": -174.0},
+    {"name": "GEO Relay 85E", "longitude_deg": 85.0},
+]
+
+# S-band return link from the user satellite to a relay single-access antenna
+DEFAULT_ISL = {
+    "freq_hz": 2.2875e9,
+    "tx_power_W": 5.0,
+    "tx_gain_dBi": 6.0,
+    "rx_gain_dBi": 36.0,
+    "T_sys": 600.0,
+    "data_rate_bps": 10000,
+    "modulation": "QPSK",
+    "BER_thresh": 1e-5,
+}
+
+
+def satellite_ecef_km(
+    times_s, tle=None, altitude_km=None, inclination_deg=None, start_time=None
+):
+    """Return ``(N, 3)`` Earth-fixed satellite positions (km).
+
+    With a TLE the positions come from SGP4 starting at the analysis window
+    of ``start_time``; otherwise a circular orbit of ``altitude_km`` and
+    ``inclination_deg`` is propagated analytically.
+    """
+    times_s = np.asarray(times_s, dtype=float)
+    if tle:
+        ts = get_timescale()
+        t0, _ = analysis_window(ts, 1, start_time)
+        t = ts.tt_jd(t0.tt + times_s / 86400.0)
+        return satellite_itrs_km(get_satellite(tle), t)
+
+    r = R_EARTH_KM + float(altitude_km or 500.0)
+    inc = np.radians(float(inclination_deg or 0.0))
+    n = np.sqrt(MU_EARTH_KM3_S2 / r**3)
+    u = n * times_s
+    eci = r * np.stack(
+        [np.cos(u), np.sin(u) * np.cos(inc), np.sin(u) * np.sin(inc)], axis=-1
+    )
+    theta = OMEGA_EARTH_RAD_S * times_s
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    return np.stack(
+        [
+            cos_t * eci[:, 0] + sin_t * eci[:, 1],
+            -sin_t * eci[:, 0] + cos_t * eci[:, 1],
+            eci[:, 2],
+        ],
+        axis=-1,
+    )
+
+
+def orbit_period_s(tle=None, altitude_km=None):
+    """Return the orbit period (s) from a TLE or a circular altitude."""
+    if tle:
+        return 2 * np.pi / get_satellite(tle).model.no_kozai * 60
+    r = R_EARTH_KM + float(altitude_km or 500.0)
+    return 2 * np.pi * np.sqrt(r**3 / MU_EARTH_KM3_S2)
+
+
+def relay_ecef_km(relays=None):
+    """Return ``(R, 3)`` Earth-fixed positions of geostationary relays."""
+    lon = np.radians([r["longitude_deg"] for r in relays or DEFAULT_GEO_RELAYS])
+    return R_GEO_KM * np.stack([np.cos(lon), np.sin(lon), np.zeros_like(lon)], -1)
+
+
+def line_of_sight(sat_km, relay_km, blockage_km=R_EARTH_KM + GRAZING_ALTITUDE_KM):
+    """Return ``(N, R)`` line-of-sight flags and ranges (km).
+
+    The ray is blocked when its closest approach to the Earth centre lies
+    inside ``blockage_km``.
+    """
+    p = sat_km[:, None, :]
+    d = relay_km[None, :, :] - p
+    d2 = np.einsum("nrk,nrk->nr", d, d)
+    s = np.clip(-np.einsum("nrk,nrk->nr", p, d) / d2, 0.0, 1.0)
+    closest = p + s[..., None] * d
+    clear = np.einsum("nrk,nrk->nr", closest, closest) > blockage_km**2
+    return clear, np.sqrt(d2)
+
+
+def relay_link_timeseries(
+    times_s,
+    tle=None,
+    altitude_km=None,
+    inclination_deg=None,
+    relays=None,
+    link=None,
+    start_time=None,
+):
+    """Evaluate relay visibility and ISL margins over ``times_s``.
+
+    Returns a dict with ``(N, R)`` arrays ``los``, ``range_km`` and
+    ``margin_dB`` (NaN when blocked) plus the per-sample ``best_margin_dB``
+    and ``best_relay`` (``-1`` when no relay is in view).
+    """
+    link = {**DEFAULT_ISL, **(link or {})}
+    relays = relays or DEFAULT_GEO_RELAYS
+    sat_km = satellite_ecef_km(times_s, tle, altitude_km, inclination_deg, start_time)
+    los, range_km = line_of_sight(sat_km, relay_ecef_km(relays))
+
+    lb = calc_link_budget_array(
+        range_km * 1e3,
+        link["freq_hz"],
+        link["tx_power_W"],
+        link["tx_gain_dBi"],
+        link["rx_gain_dBi"],
+        link["data_rate_bps"],
+        modulation_code(link["modulation"]),
+        link["T_sys"],
+        link["BER_thresh"],
+    )
+    margin = np.where(los, lb["link_margin_dB"], np.nan)
+    any_los = los.any(axis=1)
+    best_relay = np.full(len(margin), -1)
+    best_relay[any_los] = np.nanargmax(margin[any_los], axis=1)
+    best = np.full(len(margin), np.nan)
+    best[any_los] = margin[any_los, best_relay[any_los]]
+    return {
+        "times_s": np.asarray(times_s, dtype=float),
+        "los": los,
+        "range_km": range_km,
+        "margin_dB": margin,
+        "best_margin_dB": best,
+        "best_relay": best_relay,
+    }
+
+
+def relay_rf_summary(
+    tle=None,
+    altitude_km=None,
+    inclination_deg=None,
+    duration_days=1,
+    dt=60,
+    relays=None,
+    link=None,
+    start_time=None,
+    return_contacts=False,
+):
+    """Return relay availability in the ``full_rf_visibility_simulation`` style.
+
+    ``return_contacts=True`` also returns the usable relay samples as
+    uplink/downlink contacts, as :func:`full_rf_visibility_simulation` does.
+    """
+    relays = relays or DEFAULT_GEO_RELAYS
+    times = np.arange(0, duration_days * 86400, dt, dtype=float)
+    res = relay_link_timeseries(
+        times, tle, altitude_km, inclination_deg, relays, link, start_time
+    )
+    usable = res["best_margin_dB"] > 0
+    availability = 100.0 * usable.mean() if len(usable) else 0.0
+    per_relay = 100.0 * (res["margin_dB"] > 0).mean(axis=0)
+    chosen = res["best_relay"][usable]
+    summary = {
+        "mode": "relay",
+        "Downlink % of mission": f"{availability:.2f}%",
+        "Uplink % of mission": f"{availability:.2f}%",
+        "Relay availability by satellite (%)": {
+            r["name"]: float(f"{p:.2f}") for r, p in zip(relays, per_relay)
+        },
+        "Relay handovers": int(np.count_nonzero(np.diff(chosen))) if len(chosen) else 0,
+    }
+    if usable.any():
+        summary["Best relay margin (dB)"] = float(
+            f"{np.nanmax(res['best_margin_dB']):.2f}"
+        )
+        summary["Worst usable relay margin (dB)"] = float(
+            f"{res['best_margin_dB'][usable].min():.2f}"
+        )
+    if return_contacts:
+        window = (times[usable], times[usable] + dt)
+        return summary, {
+            "uplink": window,
+            "downlink": window,
+            "duration_s": len(times) * dt,
+        }
+    return summary
+
+
+def relay_margin_plot_to_buffer(
+    tle=None,
+    altitude_km=None,
+    inclination_deg=None,
+    dt=60,
+    relays=None,
+    link=None,
+    start_time=None,
+):
+    """Return a plot of the best relay ISL margin over one orbit."""
+    period_s = orbit_period_s(tle, altitude_km)
+    times = np.arange(0, period_s + dt, dt, dtype=float)
+    res = relay_link_timeseries(
+        times, tle, altitude_km, inclination_deg, relays, link, start_time
+    )
+    hours = times / 3600.0
+    plt = get_pyplot()
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.plot(hours, res["best_margin_dB"])
+    ax.set_xlabel("Time (hr)")
+    ax.set_ylabel("Relay Link Margin (dB)")
+    ax.set_title("GEO Relay Margin Over One Orbit")
+    plt.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    buf.seek(0)
+    return buf
@@ -0,0 +1,283 @@
+"""Columnar RF hardware catalog with frequency interval indexes.
+
+Antennas and modems are compiled into flat arrays plus one stabbing-query
+index per part kind, so looking up every part covering a frequency (or a
+batch of frequencies) is a binary search instead of a scan over the
+catalog dictionaries.
+"""
+
+import numpy as np
+
+# IEEE radar band edges (Hz) used to key parts by band
+BAND_EDGES = (
+    ("HF", 3e6),
+    ("VHF", 30e6),
+    ("UHF", 300e6),
+    ("L", 1e9),
+    ("S", 2e9),
+    ("C", 4e9),
+    ("X", 8e9),
+    ("Ku", 12e9),
+    ("K", 18e9),
+    ("Ka", 27e9),
+    ("V", 40e9),
+    ("W", 75e9),
+    ("mm", 110e9),
+)
+
+
+def band_name(freq_hz):
+    """Return the IEEE band name containing ``freq_hz``."""
+    edges = np.array([edge for _name, edge in BAND_EDGES])
+    idx = np.searchsorted(edges, freq_hz, side="right") - 1
+    return BAND_EDGES[max(int(idx), 0)][0]
+
+
+class IntervalIndex:
+    """Stabbing-query index over closed ``[lo, hi]`` intervals.
+
+    The interval end points split the frequency axis into elementary slots:
+    one per end point and one per open gap between consecutive end points.
+    Interval ``[b_a, b_b]`` covers the contiguous slot range ``2a .. 2b``,
+    so the items covering each slot are stored once in CSR form and a query
+    is a single ``searchsorted``.
+    """
+
+    def __init__(self, lo, hi, item_ids):
+        lo = np.asarray(lo, dtype=float)
+        hi = np.asarray(hi, dtype=float)
+        item_ids = np.asarray(item_ids, dtype=np.int64)
+        self.bounds = np.unique(np.concatenate([lo, hi]))
+        n_slots = max(2 * len(self.bounds) - 1, 0)
+
+        first = 2 * np.searchsorted(self.bounds, lo)
+        last = 2 * np.searchsorted(self.bounds, hi)
+        lengths = np.maximum(last - first + 1, 0)
+        items = np.repeat(item_ids, lengths)
+        starts = np.repeat(first - np.cumsum(lengths) + lengths, lengths)
+        slots = starts + np.arange(lengths.sum())
+
+        # Parts with several ranges may cover a slot twice
+        n_items = int(item_ids.max()) + 1 if len(item_ids) else 1
+        keys = np.unique(slots * n_items + items)
+        self.items = keys % n_items
+        self.item_slots = keys // n_items
+        counts = np.bincount(self.item_slots, minlength=n_slots)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def slots(self, freqs_hz):
+        """Return the slot of each frequency, ``-1`` outside every interval."""
+        freqs = np.asarray(freqs_hz, dtype=float)
+        n = len(self.bounds)
+        pos = np.searchsorted(self.bounds, freqs, side="left")
+        on_bound = (pos < n) & (self.bounds[np.minimum(pos, n - 1)] == freqs)
+        slot = np.where(on_bound, 2 * pos, 2 * pos - 1)
+        return np.where(on_bound | ((pos > 0) & (pos < n)), slot, -1)
+
+    def query(self, freq_hz):
+        """Return the item ids (ascending) covering ``freq_hz``."""
+        if not len(self.bounds):
+            return self.items
+        slot = int(self.slots(freq_hz))
+        if slot < 0:
+            return self.items[:0]
+        return self.items[self.offsets[slot] : self.offsets[slot + 1]]
+
+    def query_many(self, freqs_hz):
+        """Return a list of item id arrays, one per frequency."""
+        slots = self.slots(np.ravel(freqs_hz)) if len(self.bounds) else []
+        empty = self.items[:0]
+        return [
+            (self.items[self.offsets[s] : self.offsets[s + 1]] if s >= 0 else empty)
+            for s in np.atleast_1d(slots)
+        ]
+
+
+def _antenna_ranges(ant):
+    frange = ant.get("frequency_range")
+    return [tuple(frange)] if frange else []
+
+
+def _modem_ranges(modem, mtype):
+    key = "tx_frequency_range" if mtype == "transmitter" else "rx_frequency_range"
+    frange = modem.get(key) or modem.get("frequency_range")
+    if isinstance(frange, list):
+        return [fr for fr in frange if isinstance(fr, tuple)]
+    if isinstance(frange, tuple):
+        return [frange]
+    return []
+
+
+def _build_index(parts, ranges_of):
+    lo, hi, ids = [], [], []
+    for i, part in enumerate(parts):
+        for fr in ranges_of(part):
+            lo.append(fr[0])
+            hi.append(fr[1])
+            ids.append(i)
+    return IntervalIndex(lo, hi, ids)
+
+
+class RFCatalog:
+    """Antenna and modem catalog compiled for frequency lookups.
+
+    Parameters
+    ----------
+    antennas, modems : list of dict
+        Parts in the ``rf_model.antennas`` / ``rf_model.modems_sdrs``
+        schema.  Query results keep catalog order, so ties resolve the same
+        way as a linear scan.
+    """
+
+    def __init__(self, antennas, modems):
+        self.antennas = list(antennas)
+        self.modems = list(modems)
+
+        self.antenna_names = np.array([a["name"] for a in self.antennas], dtype=object)
+        self.antenna_gain = np.array(
+            [a.get("gain", 0.0) for a in self.antennas], dtype=float
+        )
+        self.antenna_band = np.array(
+            [self._part_band(_antenna_ranges(a)) for a in self.antennas], dtype=object
+        )
+        self.modem_names = np.array([m["name"] for m in self.modems], dtype=object)
+        self.modem_type = np.array(
+            [m.get("type", "") for m in self.modems], dtype=object
+        )
+
+        self._antenna_index = _build_index(self.antennas, _antenna_ranges)
+        self._modem_index = {}
+        self._modem_band = {}
+
+        # Highest-gain antenna per elementary slot for vectorised lookups
+        # (the first one in catalog order on ties)
+        idx = self._antenna_index
+        self._slot_best_antenna = np.full(len(idx.offsets) - 1, -1, dtype=np.int64)
+        if len(idx.items):
+            gain = self.antenna_gain[idx.items]
+            slot_max = np.full(len(idx.offsets) - 1, -np.inf)
+            np.maximum.at(slot_max, idx.item_slots, gain)
+            top = np.flatnonzero(gain == slot_max[idx.item_slots])
+            slots, first = np.unique(idx.item_slots[top], return_index=True)
+            self._slot_best_antenna[slots] = idx.items[top[first]]
+
+    @staticmethod
+    def _part_band(ranges):
+        if not ranges:
+            return None
+        lo, hi = ranges[0]
+        return band_name(0.5 * (lo + hi))
+
+    def _modem_parts(self, mtype):
+        if mtype not in self._modem_index:
+            ids = [i for i, m in enumerate(self.modems) if mtype in m.get("type", "")]
+            ranges = {i: _modem_ranges(self.modems[i], mtype) for i in ids}
+            self._modem_index[mtype] = _build_index(
+                range(len(self.modems)), lambda i: ranges.get(i, [])
+            )
+            self._modem_band[mtype] = np.array(
+                [self._part_band(ranges.get(i, [])) for i in range(len(self.modems))],
+                dtype=object,
+            )
+        return self._modem_index[mtype], self._modem_band[mtype]
+
+    def antenna_ids(self, freq_hz, band=None):
+        ids = self._antenna_index.query(freq_hz)
+        if band is not None:
+            ids = ids[self.antenna_band[ids] == band]
+        return ids
+
+    def modem_ids(self, freq_hz, mtype="transmitter", band=None):
+        index, bands = self._modem_parts(mtype)
+        ids = index.query(freq_hz)
+        if band is not None:
+            ids = ids[bands[ids] == band]
+        return ids
+
+    def antennas_for_freq(self, freq_hz, band=None):
+        """Return the antennas whose range covers ``freq_hz``."""
+        return [self.antennas[i] for i in self.antenna_ids(freq_hz, band)]
+
+    def modems_for_freq(self, freq_hz, mtype="transmitter", band=None):
+        """Return the ``mtype`` modems whose range covers ``freq_hz``."""
+        return [self.modems[i] for i in self.modem_ids(freq_hz, mtype, band)]
+
+    def best_antenna_ids(self, freqs_hz):
+        """Return the highest-gain antenna id per frequency (``-1`` if none)."""
+        slots = self._antenna_index.slots(freqs_hz)
+        if not len(self._slot_best_antenna):
+            return np.full(np.shape(slots), -1, dtype=np.int64)
+        best = self._slot_best_antenna[np.maximum(slots, 0)]
+        return np.where(slots >= 0, best, -1)
+
+    def best_antenna(self, freq_hz):
+        """Return the highest-gain antenna covering ``freq_hz`` or ``None``."""
+        idx = int(self.best_antenna_ids(freq_hz))
+        return self.antennas[idx] if idx >= 0 else None
+
+    def parts_in_band(self, band):
+        """Return ``(antennas, transmitters, receivers)`` keyed to ``band``."""
+        tx_bands = self._modem_parts("transmitter")[1]
+        rx_bands = self._modem_parts("receiver")[1]
+        return (
+            [a for a, b in zip(self.antennas, self.antenna_band) if b == band],
+            [m for m, b in zip(self.modems, tx_bands) if b == band],
+            [m for m, b in zip(self.modems, rx_bands) if b == band],
+        )
+
+    @classmethod
+    def from_csv(cls, antenna_path, modem_path):
+        """Load a catalog from CSV files for hardware trade studies.
+
+        Antenna rows need ``name, gain, freq_min_hz, freq_max_hz`` (plus an
+        optional ``type``).  Modem rows need ``name, type, modulations``
+        (``;`` separated) and ``tx_freq_min_hz, tx_freq_max_hz`` and/or
+        ``rx_freq_min_hz, rx_freq_max_hz``; ``transmit_power_w`` is
+        optional.  Repeated names add further frequency ranges to a part.
+        """
+        import pandas as pd
+
+        antennas = {}
+        for row in pd.read_csv(antenna_path).to_dict("records"):
+            rng = (float(row["freq_min_hz"]), float(row["freq_max_hz"]))
+            if row["name"] in antennas:
+                ant = antennas[row["name"]]
+                ant.setdefault("extra_ranges", []).append(rng)
+                continue
+            antennas[row["name"]] = {
+                "name": row["name"],
+                "frequency_range": rng,
+                "gain": float(row["gain"]),
+                "type": row.get("type", ""),
+            }
+
+        modems = {}
+        for row in pd.read_csv(modem_path).to_dict("records"):
+            modem = modems.setdefault(
+                row["name"],
+                {
+                    "type": row["type"],
+                    "name": row["name"],
+                    "modulations": str(row.get("modulations", "")).split(";"),
+                },
+            )
+            power = row.get("transmit_power_w")
+            if power is not None and not pd.isna(power):
+                modem["transmit_power_W"] = float(power)
+            for prefix in ("tx", "rx"):
+                lo = row.get(f"{prefix}_freq_min_hz")
+                hi = row.get(f"{prefix}_freq_max_hz")
+                if lo is None or pd.isna(lo) or pd.isna(hi):
+                    continue
+                modem.setdefault(f"{prefix}_frequency_range", []).append(
+                    (float(lo), float(hi))
+                )
+
+        # Antennas with several ranges are split into one part per range so
+        # they keep the ``frequency_range`` tuple schema
+        ant_list = []
+        for ant in antennas.values():
+            extra = ant.pop("extra_ranges", [])
+            ant_list.append(ant)
+            ant_list.extend({**ant, "frequency_range": rng} for rng in extra)
+        return cls(ant_list, list(modems.values()))
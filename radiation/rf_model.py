@@ -1,247 +1,49 @@
 import numpy as np
-from scipy.special import erfc
-from skyfield.api import Topos, EarthSatellite, load
+from scipy.special import erfc, erfcinv
+from skyfield.nutationlib import iau2000b_radians
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import datetime
 import io
-import matplotlib
+import json
+import os
 
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from radiation.atmosphere import (
+    CLIMATE_KEYS,
+    N_REALIZATIONS,
+    atmospheric_loss_dB,
+    band_availability,
+    station_climate,
+)
+from radiation.contact_plan import (
+    ContactPlanStore,
+    append_plan,
+    events_to_plan,
+    window_plan,
+)
+from radiation.contact_windows import contact_union, merge_intervals
+from radiation.optical_link import (
+    CLOUD_CELL_HOURS,
+    cloud_free_probability,
+    optical_availability,
+    optical_link_budget,
+    optical_terminal,
+)
+from radiation.pass_screen import screen_station_events
+from radiation.rf_catalog import RFCatalog
+from radiation.sky_pool import (
+    elevation_and_range,
+    get_satellite,
+    get_timescale,
+    satellite_itrs_km,
+    satellite_itrs_state,
+    station_topos,
+    station_vectors,
+)
+from radiation.station_db import StationDatabase
 
 VERBOSE = True  # Set to False for silent operation except summary
 
-antennas = [
-    # VHF (30 MHz - 300 MHz)
-    {
-        "name": "FAKE VHF Yagi Antenna",
-        "frequency_range": (30e6, 300e6),
-        "gain": 7,
-        "type": "Yagi-Uda",
-    },
-    # UHF (300 MHz - 1 GHz)
-    {
-        "name": "FAKE UHF Log-Periodic Dipole Array",
-        "frequency_range": (300e6, 1e9),
-        "gain": 10,
-        "type": "Log-Periodic",
-    },
-    {
-        "name": "FAKE UHF Patch Antenna",
-        "frequency_range": (300e6, 1e9),
-        "gain": 8,
-        "type": "Patch",
-    },
-    # L-Band (1 GHz - 2 GHz)
-    {
-        "name": "FAKE L-Band Helical Antenna",
-        "frequency_range": (1e9, 2e9),
-        "gain": 12,
-        "type": "Helical",
-    },
-    {
-        "name": "FALCCON - RW",
-        "frequency_range": (1e9, 2e9),
-        "gain": 21,
-        "type": "Dipole Array",
-    },
-    {
-        "name": "L Band Patch Antenna - Printech",
-        "frequency_range": (1.563e9, 1.587e9),
-        "gain": 5,
-        "type": "Patch",
-    },
-    # S-Band (2 GHz - 4 GHz)
-    {
-        "name": "AC-2000 - AAC",
-        "frequency_range": (2e9, 2.3e9),
-        "gain": 5.2,
-        "type": "Parabolic Dish",
-        "vswr": {
-            "frequency": [2e9, 2.3e9],  # Frequencies in Hz
-            "vswr_values": [1.5, 1.5],  # VSWR values
-        },
-    },
-    {
-        "name": "SANT S-band Patch Antenna - AAC",
-        "frequency_range": (2.2e9, 2.29e9),
-        "gain": 7,
-        "type": "Patch",
-        "connector": "SMA_P",
-        "s11_dB": -15,
-    },
-    {
-        "name": "Quad S Band Antenna - IQ Tech",
-        "frequency_range": (1.98e9, 2.5e9),
-        "gain": 11,
-        "type": "Patch Array",
-        "vswr": {
-            "frequency": [1.98e9, 2.5e9],  # Frequencies in Hz
-            "vswr_values": [1.8, 1.8],  # VSWR values, check data sheet
-        },
-    },
-    {
-        "name": "S-Band Antenna Commercial - Enduro",
-        "frequency_range": (2.025e9, 2.11e9),
-        "gain": 7,
-        "type": "Patch array",
-        "vswr": {
-            "frequency": [2.025e9, 2.11e9],  # Frequencies in Hz
-            "vswr_values": [1.8, 1.8],  # VSWR values, check data sheet
-        },
-    },
-    {
-        "name": "S-Band Antenna Wideband - Enduro",
-        "frequency_range": (2.2e9, 2.29e9),
-        "gain": 5,
-        "type": "Patch array",
-        "vswr": {
-            "frequency": [2.025e9, 2.11e9],  # Frequencies in Hz
-            "vswr_values": [1.8, 1.8],  # VSWR values, check data sheet
-        },
-    },
-    # C-Band (4 GHz - 8 GHz)
-    {
-        "name": "FAKE C-Band Horn Antenna",
-        "frequency_range": (4e9, 8e9),
-        "gain": 18,
-        "type": "Horn",
-    },
-    # X-Band (8 GHz - 12 GHz)
-    {
-        "name": "X-Band Patch Antenna - Enduro",
-        "frequency_range": (8.025e9, 8.4e9),
-        "gain": 6,
-        "type": "Patch",
-    },
-    {
-        "name": "4x4 X-Band Patch Array - Enduro",
-        "frequency_range": (8.025e9, 8.4e9),
-        "gain": 16,
-        "type": "Patch Array",
-    },
-    {
-        "name": "XANT X-Band Patch Antenna - Cubecom",
-        "frequency_range": [8e9, 8.4e9],  # Frequency range in Hz
-        "gain": 8,
-        "type": "Patch",
-        "return_loss": {
-            "frequency": [8.0e9, 8.1e9, 8.2e9, 8.3e9, 8.4e9],  # Frequencies in Hz
-            "return_loss_dB": [-21, -20, -18, -16, -17],  # Return loss in dB
-        },
-    },
-    {
-        "name": "XPLANT X-band Payload Antenna - Cubecom",
-        "frequency_range": (8.5e9, 9.6e9),
-        "gain": 8,
-        "type": "Patch Array",
-        "return_loss": {
-            "frequency": [8.50e9, 8.75e9, 8.90e9, 9.00e9, 9.25e9, 9.50e9],
-            "return_loss_dB": [-10, -20, -15, -25, -30, -10],
-        },
-    },
-    {
-        "name": "High Gain X-Band Antenna - Anywaves",
-        "frequency_range": (7.9e9, 8.5e9),
-        "gain": 15.5,
-        "type": "Patch array",
-        "return_loss": {
-            "frequency": [7.9e9, 8.5e9],
-            "return_loss_dB": [-10, -10],  # made up, no data
-        },
-    },
-    {
-        "name": "High-Gain X-Band Patch Array - Printech",
-        "frequency_range": [7.5e9, 8.5e9],  # Frequency range in Hz
-        "gain": 20.7,  # Gain in dB
-        "type": "Patch Array",
-        "vswr": {
-            "frequency": [
-                7.5e9,
-                7.6e9,
-                7.7e9,
-                7.8e9,
-                7.9e9,
-                8.0e9,
-                8.1e9,
-                8.2e9,
-                8.3e9,
-                8.4e9,
-            ],  # Frequencies in Hz
-            "vswr_values": [
-                1.3,
-                1.4,
-                1.2,
-                1.5,
-                1.3,
-                1.6,
-                1.2,
-                1.8,
-                1.4,
-                2.5,
-            ],  # VSWR values
-        },
-    },
-    {
-        "name": "Lens Horn Antenna - Anteral",
-        "frequency_range": (8.2e9, 12.4e9),
-        "gain": 30.4,
-        "type": "Lens Horn",
-        "s11_dB": -18,
-    },  # not trusted?
-    # Ku-Band (12 GHz - 18 GHz)
-    {
-        "name": "FAKE Ku-Band Microstrip Antenna",
-        "frequency_range": (12e9, 18e9),
-        "gain": 23,
-        "type": "Microstrip",
-    },
-    # K-Band (18 GHz - 27 GHz)
-    {
-        "name": "FAKE K-Band Waveguide Antenna",
-        "frequency_range": (18e9, 27e9),
-        "gain": 25,
-        "type": "Waveguide",
-    },
-    {
-        "name": "K-Band 4x4 Patch Array - Enduro",
-        "frequency_range": (17.7e9, 20.2e9),
-        "gain": 16,
-        "type": "Waveguide",
-    },
-    # Ka-Band (27 GHz - 40 GHz)
-    {
-        "name": "FAKE Ka-Band Horn Antenna",
-        "frequency_range": (27e9, 40e9),
-        "gain": 30,
-        "type": "Horn",
-    },
-    {
-        "name": "PAN-5151-64-KA - ReliaSat",
-        "frequency_range": (27e9, 31e9),
-        "gain": 20,
-        "type": "Panel Array",
-    },
-    {
-        "name": "4x4 X-Band Patch Array - Enduro",
-        "frequency_range": (8.025e9, 8.4e9),
-        "gain": 16,
-        "type": "Patch Array",
-    },
-    # Above 40 GHz (EHF - Millimeter Wave Frequencies)
-    {
-        "name": "FAKE EHF Lens Antenna",
-        "frequency_range": (40e9, 60e9),
-        "gain": 35,
-        "type": "Lens",
-    },
-    {
-        "name": "FAKE Terahertz Horn Antenna",
-        "frequency_range": (60e9, 100e9),
-        "gain": 40,
-        "type": "Horn",
-    },
-]
-
 
 def interpolate_return_loss(frequency, antenna_data):
     freq_points = antenna_data["return_loss"]["frequency"]
@@ -268,142 +70,6 @@ modulation_bits_per_symbol = {
     "FSK": 1,
 }
 
-modems_sdrs = [
-    {
-        "type": "receiver",
-        "name": "RX-2000 S-Band Receiver - AAC",
-        "data_rate": (9.6, 153.6),  # kbps
-        "modulations": ["FM", "GFSK"],
-        "receive_sensitivity_dBm": -110,  # -117 @ 9.6kbps
-        "rx_frequency_range": (2000e6, 2400e6),  # Hz
-        "rx_ant_con": "SMA",
-        "interface": "Micro-D",
-    },
-    {
-        "type": "transceiver",
-        "name": "UHF Transceiver II - Enduro",
-        "data_rate": (0.1, 19.2),  # kbps
-        "modulations": ["OOK", "GMSK", "2FSK", "4FSK", "4GFSK"],
-        "transmit_power_W": [1, 2],  # Watts
-        "receive_sensitivity_dBm": -121,
-        "rx_frequency_range": (400e6, 403e6),  # Hz
-        "tx_frequency_range": (430e6, 440e6),  # Hz
-        "rx_ant_con": "SMA",
-        "tx_ant_con": "SMA",
-        "interface": ["RS485", "UART", "I2C", "USB-C"],
-    },
-    {
-        "type": "transceiver",
-        "name": "S Band Transceiver - Enduro",
-        "data_rate": (0.1, 125),  # kbps
-        "modulations": ["FSK", "MSK", "GFSK", "GMSK"],
-        "transmit_power_W": (0.4, 2),  # Watts
-        "receive_sensitivity_dBm": -121,
-        "rx_frequency_range": (2025e6, 2110e6),  # Hz
-        "tx_frequency_range": (2200e6, 2290e6),  # Hz
-        "rx_ant_con": "SMP",
-        "tx_ant_con": "SMP",
-        "interface": ["RS-485", "RS-485/422", "USB-C"],
-    },
-    {
-        "type": "transceiver",
-        "name": "AX100 - GOMSpace",
-        "data_rate": (0.1, 38.4),  # kbps
-        "modulations": ["GFSK", "GMSK"],
-        "transmit_power_W": 1,  # Watts
-        "receive_sensitivity_dBm": -137,
-        "rx_frequency_range": (430e6, 440e6),  # Hz
-        "tx_frequency_range": (430e6, 440e6),  # Hz
-        "rx_ant_con": "MCX",
-        "interface": "CSP",
-    },
-    {
-        "type": "transceiver",
-        "name": "NanoCom AX2150 - GOMSpace",
-        "data_rate": (2.4, 90),  # kbps
-        "modulations": ["GFSK", "GMSK"],
-        "transmit_power_W": (0.008, 0.5),  # Watts
-        "receive_sensitivity_dBm": -113,
-        "rx_frequency_range": (2025e6, 2110e6),  # Hz
-        "tx_frequency_range": (2200e6, 2290e6),  # Hz
-        "rx_ant_con": "SMP",
-        "interface": "CSP",
-    },
-    {
-        "type": "transceiver",
-        "name": "TOTEM SDR - Alen Space",
-        "data_rate": (200, 56000),  # kbps
-        "modulations": ["GFSK", "GMSK"],
-        "transmit_power_W": (0.1, 3),  # Watts
-        "receive_sensitivity_dBm": -89,  # AD9364 transceiver data sheet, assumptions
-        "rx_frequency_range": (70e6, 60000e6),  # Hz
-        "tx_frequency_range": (70e6, 60000e6),  # Hz
-        "rx_ant_con": "MMCX",
-        "tx_ant_con": "MMCX",
-        "interface": ["UART", "I2C", "JTAG", "ETHERNET", "CAN"],
-    },
-    {
-        "type": "transmitter",
-        "name": "S Band Transmitter - Enduro",
-        "data_rate": 20000,  # ksps - check data sheet
-        "modulations": ["QPSK", "8PSK", "16APSK"],
-        "transmit_power_W": (0.5, 2),
-        "frequency_range": [(2200e6, 2290e6), (2400e6, 2450e6)],
-        "tx_ant_con": "SMA",
-        "interface": ["UART", "RS-485", "LVDS"],
-    },
-    {
-        "type": "transmitter",
-        "name": "X Band Transmitter - Enduro",
-        "data_rate": 150000,  # kbps
-        "modulations": ["QPSK", "8PSK", "16APSK", "32APSK"],
-        "transmit_power_W": (0.5, 2),
-        "frequency_range": [(7900e6, 8400e6)],
-        "tx_ant_con": "SMA",
-        "interface": ["UART", "RS-485", "LVDS"],
-    },
-    {
-        "type": "transmitter",
-        "name": "K Band Transmitter - Enduro",
-        "data_rate": 1000000,  # kbps
-        "modulations": ["QPSK", "8PSK", "16APSK", "32APSK", "256APSK"],
-        "transmit_power_W": (0.5, 2),
-        "frequency_range": [(25500e6, 27000e6)],
-        "tx_ant_con": "K-connector",
-        "interface": ["CAN", "Ethernet", "ESPS-RS-485", "LVDS"],
-    },
-    {
-        "type": "transmitter",
-        "name": "XTX X-Band Transmitter - Cubecom",
-        "data_rate": (2500, 25000),  # kbps - check symbol rate data sheet
-        "modulations": ["QPSK", "8PSK", "16APSK"],
-        "transmit_power_W": (0, 2),
-        "frequency_range": [(8025e6, 8400e6)],
-        "tx_ant_con": "SMP",
-        "interface": ["CAN", "I2C", "SpaceWire", "LVDS"],
-    },
-    {
-        "type": "transmitter",
-        "name": "HDRTX X-Band Gigabit Transmitter - Cubecom",
-        "data_rate": (50000, 200000),  # kbps - check symbol rate data sheet
-        "modulations": ["8PSK", "16APSK", "32APSK"],
-        "transmit_power_W": (0, 2),
-        "frequency_range": [(8025e6, 8400e6)],
-        "tx_ant_con": "SMP",
-        "interface": ["CAN", "SpaceWire", "8B10B"],
-    },
-    {
-        "type": "transmitter",
-        "name": "TX-2400 S-Band Transmitter - AAC",
-        "data_rate": (56, 6000),  # kbps
-        "modulations": ["FM", "FSK"],
-        "transmit_power_W": (1, 10),  # Different models
-        "frequency_range": [(2000e6, 2400e6)],
-        "tx_ant_con": "SMA",
-        "interface": "Micro-D",
-    },
-]
-
 # Dictionary of TLEs for different orbital lanes
 satellite_tles = {
     "LEO": {
@@ -440,403 +106,264 @@ satellite_tles = {
     },
 }
 
-# connectors, p dictates precision.
-rf_connectors = {
-    "SMA": {
-        "frequency_range": (0, 18e9),  # Hz
-        "impedance": 50,
-        "gender": {
-            "male": {"contact": "pin", "thread_type": "outer"},
-            "female": {"contact": "socket", "thread_type": "inner"},
-        },
-        "power_handling": "0.5 W (average)",
-        "compatible_with": ["3.5 mm", "2.92 mm (K-connector)"],
-    },
-    "SMA_P": {
-        "frequency_range": (0, 26.5e9),  # Hz
-        "impedance": 50,
-        "gender": {
-            "male": {"contact": "pin", "thread_type": "outer"},
-            "female": {"contact": "socket", "thread_type": "inner"},
-        },
-        "power_handling": "0.5 W (average)",
-        "compatible_with": ["3.5 mm", "2.92 mm (K-connector)"],
-    },
-    "N-Type": {
-        "frequency_range": (0, 11e9),  # Hz
-        "impedance": 50,
-        "gender": {
-            "male": {"contact": "pin", "thread_type": "outer"},
-            "female": {"contact": "socket", "thread_type": "inner"},
-        },
-        "power_handling": "150 W (average)",
-        "compatible_with": ["Weatherproof N-Type"],
-    },
-    "N-Type_P": {
-        "frequency_range": (0, 18e9),  # Hz
-        "impedance": 50,
-        "gender": {
-            "male": {"contact": "pin", "thread_type": "outer"},
-            "female": {"contact": "socket", "thread_type": "inner"},
-        },
-        "power_handling": "150 W (average)",
-        "compatible_with": ["Weatherproof N-Type"],
-    },
-    "Micro-D": {
-        "frequency_range": (0, 3e9),  # Hz
-        "pins_sockets": {
-            "9-pin": {"type": "male/female"},
-            "15-pin": {"type": "male/female"},
-            "25-pin": {"type": "male/female"},
-        },
-        "applications": [
-            "Aerospace and defense",
-            "Satellite communication",
-            "High-reliability systems",
-        ],
-        "mounting": ["Panel mount", "Cable mount"],
-        "notes": "Designed for compact, high-reliability connections.",
-    },
-    "2.92 mm (K-Connector)": {
-        "frequency_range": "DC to 40 GHz",
-        "impedance": 50,
-        "gender": {
-            "male": {"contact": "pin", "precision": "high"},
-            "female": {"contact": "socket", "precision": "high"},
-        },
-        "applications": [
-            "Precision measurements",
-            "High-frequency radar",
-            "Satellite payload testing",
-        ],
-        "compatible_with": ["SMA", "3.5 mm"],
-        "notes": "Provides excellent performance at high frequencies and is compatible with SMA and 3.5 mm connectors.",
-    },
+# Hardware catalogs and the ground segment live in ``radiation/data`` and
+# are parsed on first access (see ``__getattr__``), so importing this module
+# does not build them.  Units: frequencies in Hz, ``data_rate`` in kbps,
+# ``transmit_power_W`` in W, ``uEIRP`` in dBW and ``*_gt`` in dB/K.
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+# Keys whose ``[lo, hi]`` pairs are restored to tuples after JSON parsing
+_RANGE_KEYS = {
+    "frequency_range",
+    "rx_frequency_range",
+    "tx_frequency_range",
+    "data_rate",
+    "transmit_power_W",
+    "sup_freq",
+    "sdown_fr",
+    "xdown_fr",
+    "kadown_fr",
 }
 
-# Ground stations with Skyfield Topos and additional properties
-ground_segment = [
-    {
-        "name": "VIASAT PENDER",
-        "network": "VIASAT",
-        "location": Topos(
-            latitude_degrees=49.1, longitude_degrees=-123.9, elevation_m=30
-        ),
-        "sup_freq": (2025e6, 2110e6),
-        "uEIRP": 53.2,  # dBW
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 17,  # dB/K
-        "xdown_fr": (8025e6, 8400e6),
-        "xdown_gt": 30,  # dB/K
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "VIASAT GUILDFORD",
-        "network": "VIASAT",
-        "location": Topos(
-            latitude_degrees=51.2, longitude_degrees=-0.6, elevation_m=70
-        ),
-        "sup_freq": (2025e6, 2110e6),
-        "uEIRP": 53.2,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 17,
-        "xdown_fr": (8025e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "VIASAT ALICE",
-        "network": "VIASAT",
-        "location": Topos(
-            latitude_degrees=-23.7, longitude_degrees=133.9, elevation_m=600
-        ),
-        "sup_freq": (2025e6, 2110e6),
-        "uEIRP": 65.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (8025e6, 8400e6),
-        "xdown_gt": 32,
-        "kadown_fr": (25500e6, 27000e6),
-        "kadown_gt": 34.5,
-    },
-    {
-        "name": "VIASAT GHANA",
-        "network": "VIASAT",
-        "location": Topos(
-            latitude_degrees=5.6, longitude_degrees=-0.2, elevation_m=50
-        ),  # Placeholder coordinates
-        "sup_freq": (2025e6, 2110e6),
-        "uEIRP": 65.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (8025e6, 8400e6),
-        "xdown_gt": 32,
-        "kadown_fr": (25500e6, 27000e6),
-        "kadown_gt": 34.5,
-    },
-    {
-        "name": "ATLAS PAUMALU",
-        "network": "ATLAS",
-        "location": Topos(
-            latitude_degrees=21.6, longitude_degrees=-158.0, elevation_m=100
-        ),  # Placeholder coordinates
-        "sup_freq": (2025e6, 2120e6),
-        "uEIRP": 50.0,
-        "sdown_fr": (2200e6, 2300e6),
-        "sdown_gt": 21,
-        "xdown_fr": (7900e6, 8500e6),
-        "xdown_gt": 31,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Alaska 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=64.2008, longitude_degrees=-149.4937, elevation_m=100
-        ),  # Placeholder coordinates for Alaska
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,  # Assumed value based on capabilities
-        "sdown_fr": (2200e6, 2290e6),  # S-band downlink
-        "sdown_gt": 18,  # Placeholder value
-        "xdown_fr": (7750e6, 8400e6),  # X-band downlink
-        "xdown_gt": 30,  # Placeholder value
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Bahrain 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=26.0667, longitude_degrees=50.5577, elevation_m=50
-        ),  # Placeholder coordinates for Bahrain
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,  # Assumed value based on capabilities
-        "sdown_fr": (2200e6, 2290e6),  # S-band downlink
-        "sdown_gt": 18,  # Placeholder value
-        "xdown_fr": (7750e6, 8400e6),  # X-band downlink
-        "xdown_gt": 30,  # Placeholder value
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Cape Town 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=-33.9249, longitude_degrees=18.4241, elevation_m=50
-        ),  # Placeholder coordinates for Cape Town
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,  # Assumed value based on capabilities
-        "sdown_fr": (2200e6, 2290e6),  # S-band downlink
-        "sdown_gt": 18,  # Placeholder value
-        "xdown_fr": (7750e6, 8400e6),  # X-band downlink
-        "xdown_gt": 30,  # Placeholder value
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Dubbo 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=-32.2569, longitude_degrees=148.6011, elevation_m=50
-        ),  # Placeholder coordinates for Dubbo
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,  # Assumed value based on capabilities
-        "sdown_fr": (2200e6, 2290e6),  # S-band downlink
-        "sdown_gt": 18,  # Placeholder value
-        "xdown_fr": (7750e6, 8400e6),  # X-band downlink
-        "xdown_gt": 30,  # Placeholder value
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Hawaii 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=19.8968, longitude_degrees=-155.5828, elevation_m=100
-        ),  # Placeholder coordinates for Hawaii
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,  # Assumed value based on capabilities
-        "sdown_fr": (2200e6, 2290e6),  # S-band downlink
-        "sdown_gt": 18,  # Placeholder value
-        "xdown_fr": (7750e6, 8400e6),  # X-band downlink
-        "xdown_gt": 30,  # Placeholder value
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Ireland 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=53.1424, longitude_degrees=-7.6921, elevation_m=50
-        ),  # Placeholder coordinates for Ireland
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (7750e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Ohio 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=40.4173, longitude_degrees=-82.9071, elevation_m=50
-        ),  # Placeholder coordinates for Ohio
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (7750e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Oregon 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=43.8041, longitude_degrees=-120.5542, elevation_m=100
-        ),  # Placeholder coordinates for Oregon
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (7750e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Punta Arenas 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=-53.1638, longitude_degrees=-70.9171, elevation_m=50
-        ),  # Placeholder coordinates for Punta Arenas
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (7750e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Seoul 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=37.5665, longitude_degrees=126.9780, elevation_m=50
-        ),  # Placeholder coordinates for Seoul
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (7750e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Singapore 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=1.3521, longitude_degrees=103.8198, elevation_m=50
-        ),  # Placeholder coordinates for Singapore
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (7750e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-    {
-        "name": "AWS Stockholm 1",
-        "network": "AWS",
-        "location": Topos(
-            latitude_degrees=59.3293, longitude_degrees=18.0686, elevation_m=50
-        ),  # Placeholder coordinates for Stockholm
-        "sup_freq": (2025e6, 2110e6),  # S-band uplink
-        "uEIRP": 53.0,
-        "sdown_fr": (2200e6, 2290e6),
-        "sdown_gt": 18,
-        "xdown_fr": (7750e6, 8400e6),
-        "xdown_gt": 30,
-        "kadown_fr": None,
-        "kadown_gt": None,
-    },
-]
 
-# Map networks to their ground stations for easy filtering
-ground_stations_by_network = {}
-for gs in ground_segment:
-    ground_stations_by_network.setdefault(gs["network"], []).append(gs)
+def _as_range(value):
+    if isinstance(value, list):
+        if value and all(isinstance(v, list) for v in value):
+            return [tuple(v) for v in value]
+        return tuple(value)
+    return value
+
+
+def _load_data_file(name):
+    with open(os.path.join(DATA_DIR, name)) as fh:
+        records = json.load(fh)
+    if isinstance(records, list):
+        return [
+            {
+                key: _as_range(val) if key in _RANGE_KEYS else val
+                for key, val in rec.items()
+            }
+            for rec in records
+        ]
+    return {
+        name: {
+            key: _as_range(val) if key in _RANGE_KEYS else val
+            for key, val in rec.items()
+        }
+        for name, rec in records.items()
+    }
+
+
+def _load_ground_segment():
+    stations = []
+    for rec in _load_data_file("ground_stations.json"):
+        gs = {"name": rec.pop("name"), "network": rec.pop("network")}
+        gs["location"] = station_topos(
+            rec.pop("latitude_deg"), rec.pop("longitude_deg"), rec.pop("elevation_m")
+        )
+        gs.update(rec)
+        stations.append(gs)
+    return stations
+
+
+def _group_by_network(stations):
+    by_network = {}
+    for gs in stations:
+        by_network.setdefault(gs["network"], []).append(gs)
+    return by_network
+
+
+_CATALOG_LOADERS = {
+    "antennas": lambda: _load_data_file("antennas.json"),
+    "modems_sdrs": lambda: _load_data_file("modems.json"),
+    "rf_connectors": lambda: _load_data_file("rf_connectors.json"),
+    "ground_segment": _load_ground_segment,
+    "ground_stations_by_network": lambda: _group_by_network(_catalog("ground_segment")),
+}
+
+
+def _catalog(name):
+    """Return a module-level catalog, loading it from disk on first use.
+
+    Loaded (or reassigned) catalogs are stored as ordinary module globals,
+    so later lookups never reach ``__getattr__``.
+    """
+    if name not in globals():
+        globals()[name] = _CATALOG_LOADERS[name]()
+    return globals()[name]
+
+
+def __getattr__(name):
+    if name in _CATALOG_LOADERS:
+        return _catalog(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def ground_station_networks():
+    """Return the sorted network names without building station ``Topos``."""
+    return sorted({rec["network"] for rec in _load_data_file("ground_stations.json")})
 
-# ... [Your big antennas, modems_sdrs, ground_segment dictionaries go here, unchanged] ...
-# If you omitted them for brevity, add them back above this function.
 
 c = 3e8
 k = 1.38e-23
+MU_EARTH_M3_S2 = 3.986004418e14
+OMEGA_EARTH_RAD_S = 7.2921159e-5
 
 
 def calculate_fspl(distance_m, frequency_hz):
     return 20 * np.log10((4 * np.pi * distance_m * frequency_hz) / c)
 
 
+# Integer modulation codes for the array link budget.  Unknown modulations
+# map to -1 (one bit per symbol, BER of 1 like the scalar fallback).
+MODULATION_CODES = tuple(modulation_bits_per_symbol) + ("FM",)
+_MODULATION_INDEX = {name: code for code, name in enumerate(MODULATION_CODES)}
+
+# BER = a * erfc(sqrt(b * Eb/N0)) per modulation; NaN marks no closed form
+_BER_COEFFS = {
+    "BPSK": (0.5, 1.0),
+    "OOK": (0.5, 1.0),
+    "GMSK": (0.5, 1.0),
+    "GFSK": (0.5, 1.0),
+    "FSK": (0.5, 1.0),
+    "MSK": (0.5, 1.0),
+    "QPSK": (0.5, 1.0),
+    "8PSK": (1.0, 1.5 * np.log2(8) / (8 - 1)),
+    "16QAM": (3 / 8, 4 / 5),
+    "16APSK": (3 / 8, 4 / 5),
+    "32APSK": (1.0, 0.068),
+    "256APSK": (1.0, 0.0156),
+}
+# Lookup tables indexed by code + 1 so that code -1 (unknown) hits row 0
+_BITS_BY_CODE = np.array(
+    [1] + [modulation_bits_per_symbol.get(m, 1) for m in MODULATION_CODES],
+    dtype=float,
+)
+_BER_A_BY_CODE = np.array(
+    [np.nan] + [_BER_COEFFS.get(m, (np.nan, np.nan))[0] for m in MODULATION_CODES]
+)
+_BER_B_BY_CODE = np.array(
+    [np.nan] + [_BER_COEFFS.get(m, (np.nan, np.nan))[1] for m in MODULATION_CODES]
+)
+
+LINK_BUDGET_DTYPE = np.dtype(
+    [
+        ("P_rx_dBm", "f8"),
+        ("SNR_dB", "f8"),
+        ("Eb_N0_dB", "f8"),
+        ("BER", "f8"),
+        ("link_margin_dB", "f8"),
+    ]
+)
+
+
+def modulation_code(modulation):
+    """Return the integer code(s) for a modulation name or sequence of names."""
+    if isinstance(modulation, str):
+        return _MODULATION_INDEX.get(modulation, -1)
+    return np.array([_MODULATION_INDEX.get(m, -1) for m in modulation], dtype=int)
+
+
+def compute_BER_array(Eb_N0_dB, modulation_codes):
+    """Return the bit error rate for arrays of Eb/N0 (dB) and modulation codes."""
+    idx = np.asarray(modulation_codes) + 1
+    a = _BER_A_BY_CODE[idx]
+    b = _BER_B_BY_CODE[idx]
+    Eb_N0 = 10 ** (np.asarray(Eb_N0_dB, dtype=float) / 10)
+    with np.errstate(invalid="ignore"):
+        ber = a * erfc(np.sqrt(b * Eb_N0))
+    return np.where(np.isnan(a), 1.0, ber)
+
+
 def compute_BER(Eb_N0_dB, modulation):
-    Eb_N0 = 10 ** (Eb_N0_dB / 10)
-    if modulation in ["BPSK", "OOK", "GMSK", "GFSK", "FSK", "MSK"]:
-        return 0.5 * erfc(np.sqrt(Eb_N0))
-    elif modulation == "QPSK":
-        return 0.5 * erfc(np.sqrt(Eb_N0))
-    elif modulation == "8PSK":
-        return erfc(np.sqrt(1.5 * Eb_N0 * np.log2(8) / (8 - 1)))
-    elif modulation in ["16QAM", "16APSK"]:
-        return (3 / 8) * erfc(np.sqrt((4 / 5) * Eb_N0))
-    elif modulation == "32APSK":
-        return erfc(np.sqrt(0.068 * Eb_N0))
-    elif modulation == "256APSK":
-        return erfc(np.sqrt(0.0156 * Eb_N0))
-    else:
-        return 1.0
+    ber = compute_BER_array(Eb_N0_dB, modulation_code(modulation))
+    return float(ber) if np.ndim(ber) == 0 else ber
+
+
+def required_EbN0_dB(modulation_codes, BER_thresh=1e-5):
+    """Return the Eb/N0 (dB) at which each modulation reaches ``BER_thresh``.
+
+    Modulations without a BER model return ``inf`` (never usable).
+    """
+    idx = np.asarray(modulation_codes) + 1
+    a = _BER_A_BY_CODE[idx]
+    b = _BER_B_BY_CODE[idx]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        Eb_N0 = erfcinv(BER_thresh / a) ** 2 / b
+        req = 10 * np.log10(Eb_N0)
+    return np.where(np.isnan(a), np.inf, req)
+
+
+def calc_link_budget_array(
+    distance_m,
+    freq_hz,
+    tx_power_W,
+    tx_gain_dBi,
+    rx_gain_dBi,
+    data_rate_bps,
+    modulation_codes,
+    T_sys=290,
+    BER_thresh=1e-5,
+):
+    """Array version of :func:`calc_link_budget`.
+
+    All inputs broadcast against each other, e.g. distances shaped
+    ``(time, station, 1)`` against per-configuration arrays shaped
+    ``(config,)``, and modulations are given as :func:`modulation_code`
+    integers.  Returns a structured array with ``LINK_BUDGET_DTYPE`` fields
+    of the broadcast shape.
+    """
+    idx = np.asarray(modulation_codes) + 1
+    bits_per_symbol = _BITS_BY_CODE[idx]
+    fspl_dB = calculate_fspl(np.asarray(distance_m, dtype=float), freq_hz)
+    P_tx_dBm = 10 * np.log10(np.asarray(tx_power_W, dtype=float) * 1e3)
+    P_rx_dBm = P_tx_dBm + tx_gain_dBi + rx_gain_dBi - fspl_dB
+    bandwidth_Hz = data_rate_bps / bits_per_symbol
+    P_noise_dBm = 10 * np.log10(k * T_sys * bandwidth_Hz) + 30
+    SNR_dB = P_rx_dBm - P_noise_dBm
+    bits_dB = 10 * np.log10(bits_per_symbol)
+    Eb_N0_dB = SNR_dB - bits_dB
+
+    out = np.empty(np.shape(Eb_N0_dB), dtype=LINK_BUDGET_DTYPE)
+    out["P_rx_dBm"] = P_rx_dBm
+    out["SNR_dB"] = SNR_dB
+    out["Eb_N0_dB"] = Eb_N0_dB
+    out["BER"] = compute_BER_array(Eb_N0_dB, modulation_codes)
+    out["link_margin_dB"] = SNR_dB - (bits_dB + BER_thresh)
+    return out
+
+
+_rf_catalog = None
+_rf_catalog_key = None
+
+
+def get_rf_catalog():
+    """Return ``antennas`` and ``modems_sdrs`` compiled into an ``RFCatalog``."""
+    global _rf_catalog, _rf_catalog_key
+    ants, modems = _catalog("antennas"), _catalog("modems_sdrs")
+    key = (id(ants), len(ants), id(modems), len(modems))
+    if _rf_catalog is None or key != _rf_catalog_key:
+        _rf_catalog = RFCatalog(ants, modems)
+        _rf_catalog_key = key
+    return _rf_catalog
+
+
+def load_rf_catalog(antenna_path, modem_path):
+    """Replace the hardware catalogs with parts loaded from CSV files."""
+    global antennas, modems_sdrs
+    catalog = RFCatalog.from_csv(antenna_path, modem_path)
+    antennas = catalog.antennas
+    modems_sdrs = catalog.modems
+    invalidate_link_constants()
+    return catalog
 
 
 def select_antennas_for_freq(freq_hz):
-    return [
-        ant
-        for ant in antennas
-        if ant["frequency_range"][0] <= freq_hz <= ant["frequency_range"][1]
-    ]
+    return get_rf_catalog().antennas_for_freq(freq_hz)
 
 
 def select_modems_for_freq_and_type(freq_hz, mtype="transmitter"):
-    hits = []
-    for modem in modems_sdrs:
-        if mtype in modem["type"]:
-            key = (
-                "tx_frequency_range" if mtype == "transmitter" else "rx_frequency_range"
-            )
-            frange = modem.get(key) or modem.get("frequency_range")
-            if not frange:
-                continue
-            if isinstance(frange, list):
-                match = any(
-                    fr[0] <= freq_hz <= fr[1] for fr in frange if isinstance(fr, tuple)
-                )
-            else:
-                if isinstance(frange, tuple):
-                    match = frange[0] <= freq_hz <= frange[1]
-                else:
-                    match = False
-            if match:
-                hits.append(modem)
-    return hits
+    return get_rf_catalog().modems_for_freq(freq_hz, mtype)
 
 
 def calc_link_budget(
@@ -869,6 +396,716 @@ def calc_link_budget(
     }
 
 
+# Ground station band keys: (frequency range, G/T) per downlink band and the
+# uplink frequency range
+DOWNLINK_BANDS = (
+    ("sdown_fr", "sdown_gt"),
+    ("xdown_fr", "xdown_gt"),
+    ("kadown_fr", "kadown_gt"),
+)
+UPLINK_BANDS = (("sup_freq", None),)
+BAND_LABELS = {"sdown_fr": "S", "xdown_fr": "X", "kadown_fr": "Ka", "sup_freq": "S"}
+GS_UPLINK_EIRP_W = 50
+GS_UPLINK_GAIN_DBI = 20
+
+# Station fields a link constant table row is built from
+_STATION_LINK_KEYS = ("name",) + tuple(
+    key for pair in DOWNLINK_BANDS + UPLINK_BANDS for key in pair if key
+)
+
+_link_constant_cache = {}
+_link_constant_fingerprint = None
+
+
+def _catalog_fingerprint():
+    """Return what the cached link constant tables depend on.
+
+    The hardware catalogs are held by reference and length, so reassigning
+    or reloading one is seen even if a freed ``id`` is reused.  Stations
+    contribute the name and band fields each row is built from, so in-place
+    station edits are seen too.  Edits inside a hardware entry need
+    :func:`invalidate_link_constants`.
+    """
+    hardware = tuple(
+        (cat, len(cat)) for cat in (_catalog("antennas"), _catalog("modems_sdrs"))
+    )
+    stations = tuple(
+        tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (gs.get(key) for key in _STATION_LINK_KEYS)
+        )
+        for gs in _catalog("ground_segment")
+    )
+    return hardware, stations
+
+
+def _same_fingerprint(new, old):
+    """Return ``True`` if ``new`` and ``old`` fingerprints match."""
+    if old is None or new[1] != old[1]:
+        return False
+    return all(a is b and n == m for (a, n), (b, m) in zip(new[0], old[0]))
+
+
+def invalidate_link_constants():
+    """Drop the cached link constant tables, e.g. after editing a catalog."""
+    global _link_constant_fingerprint, _rf_catalog
+    _link_constant_cache.clear()
+    _link_constant_fingerprint = None
+    _rf_catalog = None
+
+
+def _band_link_constant(gs, band, gt_key, direction, data_rate_bps, T_sys, BER_thresh):
+    """Return the best link option for one station band, or ``None``.
+
+    Distance only enters the link budget through FSPL, so the margin of an
+    option is ``constant - 20*log10(distance_m)`` where ``constant`` is the
+    margin at 1 m.  The best option is therefore the same at every range.
+    """
+    frange = gs.get(band)
+    if not frange:
+        return None
+    midf = (frange[0] + frange[1]) / 2
+    ant_list = select_antennas_for_freq(midf)
+    if not ant_list:
+        return None
+    ant = max(ant_list, key=lambda a: a["gain"])
+
+    options = []
+    if direction == "down":
+        tx_power = 2
+        for m in select_modems_for_freq_and_type(midf, "transmitter"):
+            if isinstance(m.get("transmit_power_W"), (list, tuple)):
+                tx_power = max(m["transmit_power_W"])
+            elif isinstance(m.get("transmit_power_W"), (int, float)):
+                tx_power = m["transmit_power_W"]
+            for mod in m.get("modulations", []):
+                options.append((m, mod, tx_power, ant["gain"], gs.get(gt_key)))
+    else:
+        for m in select_modems_for_freq_and_type(midf, "receiver"):
+            for mod in m.get("modulations", []):
+                options.append(
+                    (m, mod, GS_UPLINK_EIRP_W, GS_UPLINK_GAIN_DBI, ant["gain"])
+                )
+    if not options:
+        return None
+
+    _modems, mods, tx_powers, tx_gains, rx_gains = zip(*options)
+    lb = calc_link_budget_array(
+        1.0,
+        midf,
+        np.array(tx_powers, dtype=float),
+        np.array(tx_gains, dtype=float),
+        np.array(rx_gains, dtype=float),
+        data_rate_bps,
+        modulation_code(mods),
+        T_sys,
+        BER_thresh,
+    )
+    best_idx = int(np.argmax(lb["link_margin_dB"]))
+    best = (lb["link_margin_dB"][best_idx], options[best_idx])
+
+    constant, (modem, mod, tx_power, tx_gain, rx_gain) = best
+    return {
+        "constant_dB": float(constant),
+        "band": band,
+        "midf": midf,
+        "ant": ant,
+        "modem": modem,
+        "mod": mod,
+        "tx_power_W": tx_power,
+        "tx_gain_dBi": tx_gain,
+        "rx_gain_dBi": rx_gain,
+    }
+
+
+def link_constant_table(direction, data_rate_bps, T_sys=290, BER_thresh=1e-5):
+    """Return the best link constant per ground station for a direction.
+
+    The result maps station name to ``{"bands": {band: entry}, "best":
+    entry}`` where ``best`` is the band with the highest constant (or
+    ``None``).  Tables are cached per ``(direction, rate, T_sys,
+    BER_thresh)`` and rebuilt when ``antennas`` or ``modems_sdrs`` are
+    reassigned, reloaded or change length, when a station's name or band
+    fields change, or after :func:`invalidate_link_constants`.
+    """
+    global _link_constant_fingerprint, _rf_catalog
+    fingerprint = _catalog_fingerprint()
+    if not _same_fingerprint(fingerprint, _link_constant_fingerprint):
+        _link_constant_cache.clear()
+        _link_constant_fingerprint = fingerprint
+        _rf_catalog = None
+
+    key = (direction, data_rate_bps, T_sys, BER_thresh)
+    table = _link_constant_cache.get(key)
+    if table is None:
+        bands = DOWNLINK_BANDS if direction == "down" else UPLINK_BANDS
+        table = {}
+        for gs in _catalog("ground_segment"):
+            entries = {}
+            for band, gt_key in bands:
+                entry = _band_link_constant(
+                    gs, band, gt_key, direction, data_rate_bps, T_sys, BER_thresh
+                )
+                if entry is not None:
+                    entries[band] = entry
+            best = max(entries.values(), key=lambda e: e["constant_dB"], default=None)
+            table[gs["name"]] = {"bands": entries, "best": best}
+        _link_constant_cache[key] = table
+    return table
+
+
+def link_margin(entry, distance_m):
+    """Return the link margin (dB) of a link constant entry at ``distance_m``."""
+    return entry["constant_dB"] - 20 * np.log10(distance_m)
+
+
+def _entry_link_budget(entry, distance_m, data_rate_bps, T_sys, BER_thresh):
+    """Return the full ``calc_link_budget`` result for a link constant entry."""
+    return calc_link_budget(
+        distance_m,
+        entry["midf"],
+        entry["tx_power_W"],
+        entry["tx_gain_dBi"],
+        entry["rx_gain_dBi"],
+        data_rate_bps,
+        entry["mod"],
+        T_sys,
+        BER_thresh,
+    )
+
+
+# Elevation bins (deg) for the pass-integrated volume histogram
+ELEVATION_BINS = np.arange(0, 100, 10)
+
+
+def rate_ladder(modem):
+    """Return the selectable data rates (bps) of a modem, doubling per step.
+
+    ``data_rate`` is given in kbps, either as one rate or a ``(min, max)``
+    range.
+    """
+    rate = modem.get("data_rate")
+    if isinstance(rate, (list, tuple)):
+        lo, hi = min(rate), max(rate)
+        if lo <= 0:
+            return np.array([hi * 1e3])
+        steps = lo * 2.0 ** np.arange(int(np.floor(np.log2(hi / lo))) + 1)
+        return np.unique(np.append(steps, hi)) * 1e3
+    if isinstance(rate, (int, float)) and rate > 0:
+        return np.array([rate * 1e3])
+    return np.empty(0)
+
+
+def _acm_options(gs, BER_thresh):
+    """Return downlink ACM options.
+
+    Each option is ``(freq, tx_W, tx_gain, rx_gain, code, req, ladder,
+    tracking_hz, rate_hz_s)``, the last two being the modem Doppler limits.
+    """
+    options = []
+    for band, gt_key in DOWNLINK_BANDS:
+        frange = gs.get(band)
+        if not frange:
+            continue
+        midf = (frange[0] + frange[1]) / 2
+        ant_list = select_antennas_for_freq(midf)
+        if not ant_list:
+            continue
+        ant = max(ant_list, key=lambda a: a["gain"])
+        tx_power = 2
+        for m in select_modems_for_freq_and_type(midf, "transmitter"):
+            if isinstance(m.get("transmit_power_W"), (list, tuple)):
+                tx_power = max(m["transmit_power_W"])
+            elif isinstance(m.get("transmit_power_W"), (int, float)):
+                tx_power = m["transmit_power_W"]
+            ladder = rate_ladder(m)
+            if not len(ladder):
+                continue
+            for mod in m.get("modulations", []):
+                code = modulation_code(mod)
+                req = float(required_EbN0_dB(code, BER_thresh))
+                if np.isfinite(req):
+                    options.append(
+                        (midf, tx_power, ant["gain"], gs.get(gt_key), code, req, ladder)
+                        + doppler_limits(m)
+                    )
+    return options
+
+
+# Carrier tracking limits for modems that do not list their own
+# ``doppler_tracking_hz`` / ``doppler_rate_hz_s``
+DEFAULT_DOPPLER_TRACKING_HZ = 250e3
+DEFAULT_DOPPLER_RATE_HZ_S = 2e3
+
+
+def doppler_limits(modem):
+    """Return a modem's ``(tracking range, tracking rate)`` limits (Hz, Hz/s)."""
+    return (
+        float(modem.get("doppler_tracking_hz", DEFAULT_DOPPLER_TRACKING_HZ)),
+        float(modem.get("doppler_rate_hz_s", DEFAULT_DOPPLER_RATE_HZ_S)),
+    )
+
+
+def pass_samples(starts_tt, ends_tt, dt=10):
+    """Split passes into equal slices and return their midpoints.
+
+    Returns ``(pass_idx, t_tt, weight_s)``; every pass gets at least one
+    slice of at most ``dt`` seconds.
+    """
+    starts_tt = np.asarray(starts_tt, dtype=float)
+    ends_tt = np.asarray(ends_tt, dtype=float)
+    dur_s = (ends_tt - starts_tt) * 86400.0
+    n = np.maximum(np.ceil(dur_s / dt).astype(int), 1)
+    pass_idx = np.repeat(np.arange(len(n)), n)
+    k = np.arange(n.sum()) - np.repeat(np.cumsum(n) - n, n)
+    frac = (k + 0.5) / n[pass_idx]
+    t_tt = starts_tt[pass_idx] + frac * (ends_tt - starts_tt)[pass_idx]
+    return pass_idx, t_tt, (dur_s / n)[pass_idx]
+
+
+def doppler_profile(sat, gs, t_tt, ts):
+    """Return topocentric geometry and range dynamics at TT dates ``t_tt``.
+
+    One Earth-fixed state evaluation gives the range rate from the relative
+    velocity.  Range acceleration follows from the two-body acceleration
+    with the Coriolis and centrifugal terms of the rotating frame, so no
+    extra time samples are needed.  The Doppler shift at carrier ``f`` is
+    ``-f * range_rate / c`` and its rate ``-f * range_accel / c``.
+    """
+    t = ts.tt_jd(np.asarray(t_tt, dtype=float))
+    # The truncated IAU 2000B nutation series is ample for link geometry
+    t._nutation_angles_radians = iau2000b_radians(t)
+    pos, vel = satellite_itrs_state(sat, t)
+    gs_km, up = station_vectors([gs])
+    rho = pos - gs_km[0] * 1e3
+    dist = np.linalg.norm(rho, axis=1)
+    range_rate = np.einsum("nk,nk->n", rho, vel) / dist
+
+    omega = np.array([0.0, 0.0, OMEGA_EARTH_RAD_S])
+    gravity = -MU_EARTH_M3_S2 * pos / np.linalg.norm(pos, axis=1)[:, None] ** 3
+    accel = gravity - 2 * np.cross(omega, vel) - np.cross(omega, np.cross(omega, pos))
+    range_accel = (
+        np.einsum("nk,nk->n", vel, vel)
+        + np.einsum("nk,nk->n", rho, accel)
+        - range_rate**2
+    ) / dist
+    return {
+        "alt_deg": np.degrees(np.arcsin(np.clip(rho @ up[0] / dist, -1.0, 1.0))),
+        "distance_m": dist,
+        "range_rate_m_s": range_rate,
+        "range_accel_m_s2": range_accel,
+    }
+
+
+def doppler_within_limits(profile, freq_hz, tracking_hz, rate_hz_s):
+    """Return whether Doppler and Doppler rate stay inside tracking limits.
+
+    ``freq_hz`` and the limits broadcast against a trailing option axis, so
+    the result has shape ``(samples,) + np.shape(freq_hz)``.
+    """
+    f = np.asarray(freq_hz, dtype=float) / c
+    rr = np.asarray(profile["range_rate_m_s"])[..., None]
+    ra = np.asarray(profile["range_accel_m_s2"])[..., None]
+    ok = (np.abs(rr * f) <= tracking_hz) & (np.abs(ra * f) <= rate_hz_s)
+    return ok if np.ndim(freq_hz) else ok[..., 0]
+
+
+def doppler_trimmed_intervals(sat, gs, passes_tt, ts, entry, dt=10):
+    """Return the slices of passes a link option's modem can track.
+
+    ``passes_tt`` holds ``(rise_tt, set_tt)`` pairs and ``entry`` is a
+    :func:`link_constant_table` entry.  Returns the kept slice intervals
+    (TT days), the contact lost to Doppler limits (s) and the peak Doppler
+    shift (Hz) and rate (Hz/s) seen on kept slices.
+    """
+    starts, ends = np.asarray(passes_tt, dtype=float).reshape(-1, 2).T
+    _pass_idx, t_tt, weight = pass_samples(starts, ends, dt)
+    profile = doppler_profile(sat, gs, t_tt, ts)
+    ok = doppler_within_limits(profile, entry["midf"], *doppler_limits(entry["modem"]))
+    half = 0.5 * weight[ok] / 86400.0
+    scale = entry["midf"] / c
+    return {
+        "start_tt": t_tt[ok] - half,
+        "end_tt": t_tt[ok] + half,
+        "trimmed_s": float(weight[~ok].sum()),
+        "peak_doppler_hz": float(
+            np.abs(profile["range_rate_m_s"][ok]).max(initial=0.0) * scale
+        ),
+        "peak_doppler_rate_hz_s": float(
+            np.abs(profile["range_accel_m_s2"][ok]).max(initial=0.0) * scale
+        ),
+    }
+
+
+def integrate_pass_throughput(
+    sat,
+    gs,
+    passes,
+    ts,
+    dt=10,
+    T_sys=290,
+    BER_thresh=1e-5,
+    climate=None,
+    exceedance_pct=None,
+):
+    """Integrate adaptive coding and modulation downlink volume over passes.
+
+    Parameters
+    ----------
+    sat : EarthSatellite
+    gs : dict
+        Ground station from ``ground_segment``.
+    passes : sequence of (start, end)
+        Pass rise and set times as skyfield ``Time`` objects.
+    dt : float, optional
+        Target sample spacing (s); every pass gets at least one sample.
+    climate : dict, optional
+        Station climatology (see :func:`radiation.atmosphere.station_climate`).
+    exceedance_pct : float, optional
+        With ``climate``, every sample's Eb/N0 is reduced by the atmospheric
+        loss exceeded this share of the time at its elevation and band (see
+        :func:`radiation.atmosphere.atmospheric_loss_dB`).
+
+    Each pass is split into equal slices sampled at their midpoints and all
+    samples of the station are evaluated in one topocentric call.  At every
+    sample the highest ladder rate of any modem/modulation meeting
+    ``BER_thresh`` and inside that modem's Doppler tracking limits is
+    selected.  Returns per-pass volumes (bits) and usable contact (s), the
+    peak rate, the volume per elevation bin, the contact lost only to
+    Doppler limits (``doppler_trimmed_s``) and the raw samples
+    (``sample_tt``, ``sample_s``, ``sample_bits``, ``sample_alt_deg``) for
+    merging stations.
+    """
+    n_pass = len(passes)
+    hist = np.zeros(len(ELEVATION_BINS) - 1)
+    if not n_pass:
+        return {
+            "volume_bits": np.zeros(0),
+            "contact_s": np.zeros(0),
+            "peak_rate_bps": 0.0,
+            "volume_by_elevation_bits": hist,
+            "doppler_trimmed_s": 0.0,
+            "sample_tt": np.zeros(0),
+            "sample_s": np.zeros(0),
+            "sample_bits": np.zeros(0),
+            "sample_alt_deg": np.zeros(0),
+        }
+
+    pass_idx, t_tt, weight = pass_samples(
+        [p[0].tt for p in passes], [p[1].tt for p in passes], dt
+    )
+    profile = doppler_profile(sat, gs, t_tt, ts)
+    alt_deg = profile["alt_deg"]
+    rate = np.zeros(len(t_tt))
+    untracked_rate = np.zeros(len(t_tt))
+    options = _acm_options(gs, BER_thresh)
+    if options:
+        freqs, powers, tx_gains, rx_gains, codes, req, ladders, track, slew = zip(
+            *options
+        )
+        # At 1 bps Eb/N0 equals the received power over kT, so the highest
+        # rate meeting the threshold is 10**((Eb/N0_1bps - required) / 10)
+        lb = calc_link_budget_array(
+            profile["distance_m"][:, None],
+            np.array(freqs),
+            np.array(powers, dtype=float),
+            np.array(tx_gains, dtype=float),
+            np.array(rx_gains, dtype=float),
+            1.0,
+            np.array(codes),
+            T_sys,
+            BER_thresh,
+        )
+        eb_n0 = lb["Eb_N0_dB"]
+        if climate is not None and exceedance_pct is not None:
+            eb_n0 = eb_n0 - atmospheric_loss_dB(
+                np.array(freqs), alt_deg[:, None], climate, exceedance_pct, T_sys
+            )
+        r_max = 10 ** ((eb_n0 - np.array(req)) / 10)
+        tracked = doppler_within_limits(
+            profile, np.array(freqs), np.array(track), np.array(slew)
+        )
+        for j, ladder in enumerate(ladders):
+            step = np.searchsorted(ladder, r_max[:, j], side="right") - 1
+            best = np.where(step >= 0, ladder[np.maximum(step, 0)], 0.0)
+            np.maximum(untracked_rate, best, out=untracked_rate)
+            np.maximum(rate, np.where(tracked[:, j], best, 0.0), out=rate)
+
+    bits = rate * weight
+    hist, _ = np.histogram(
+        np.clip(alt_deg, ELEVATION_BINS[0], ELEVATION_BINS[-1]),
+        bins=ELEVATION_BINS,
+        weights=bits,
+    )
+    return {
+        "volume_bits": np.bincount(pass_idx, weights=bits, minlength=n_pass),
+        "contact_s": np.bincount(
+            pass_idx, weights=weight * (rate > 0), minlength=n_pass
+        ),
+        "peak_rate_bps": float(rate.max()),
+        "volume_by_elevation_bits": hist,
+        "doppler_trimmed_s": float(weight[(untracked_rate > 0) & (rate == 0)].sum()),
+        "sample_tt": t_tt,
+        "sample_s": weight,
+        "sample_bits": bits,
+        "sample_alt_deg": alt_deg,
+    }
+
+
+def _add_weather_passes(records, sat, gs, mid_passes, ts, entries, climate):
+    """Append one station's pass midpoints per band for :func:`band_availability`.
+
+    ``mid_passes`` holds ``(tt, range_m, duration_s)`` tuples; elevations
+    are evaluated for all of them at once.
+    """
+    mid_tt, dist_m, duration_s = (
+        np.array(col, dtype=float) for col in zip(*mid_passes)
+    )
+    t = ts.tt_jd(mid_tt)
+    t._nutation_angles_radians = iau2000b_radians(t)
+    alt_deg = elevation_and_range(satellite_itrs_km(sat, t), [gs])[0][:, 0]
+    for band, entry in entries.items():
+        rec = records.setdefault(BAND_LABELS[band], {})
+        cols = {
+            "margin_dB": link_margin(entry, dist_m),
+            "duration_s": duration_s,
+            "elevation_deg": alt_deg,
+            "freq_hz": np.full(len(mid_tt), entry["midf"]),
+            **{
+                key: np.full(len(mid_tt), climate[key])
+                for key in (*CLIMATE_KEYS, "latitude_deg", "altitude_km")
+            },
+        }
+        for key, col in cols.items():
+            rec.setdefault(key, []).append(col)
+
+
+def _add_optical_passes(records, sat, j, gs, passes_tt, ts, terminal, climate, dt):
+    """Append one station's optical pass records for :func:`optical_availability`.
+
+    Passes are sliced every ``dt`` seconds; a slice counts as contact above
+    the terminal's minimum elevation and as usable where the optical budget
+    also closes.  Passes share a cloud cell with the station's other passes
+    in the same ``CLOUD_CELL_HOURS`` block.
+    """
+    aperture = gs.get("optical_aperture_m", terminal["ground_aperture_m"])
+    if not aperture or not passes_tt:
+        return
+    starts, ends = np.asarray(passes_tt, dtype=float).reshape(-1, 2).T
+    pass_idx, t_tt, weight = pass_samples(starts, ends, dt)
+    t = ts.tt_jd(t_tt)
+    t._nutation_angles_radians = iau2000b_radians(t)
+    alt_deg, dist_m = elevation_and_range(satellite_itrs_km(sat, t), [gs])
+    alt_deg, dist_m = alt_deg[:, 0], dist_m[:, 0]
+    up = alt_deg >= terminal["min_elevation_deg"]
+    budget = optical_link_budget(
+        dist_m[up], alt_deg[up], terminal, aperture, climate["altitude_km"]
+    )
+    closes = np.zeros(len(t_tt), dtype=bool)
+    closes[up] = budget["link_margin_dB"] > 0
+
+    n = len(starts)
+    mid = ts.tt_jd(0.5 * (starts + ends))
+    cols = {
+        "contact_s": np.bincount(pass_idx, weights=weight * up, minlength=n),
+        "usable_s": np.bincount(pass_idx, weights=weight * closes, minlength=n),
+        "cloud_free": cloud_free_probability(climate, mid.utc.month),
+        # Station index and the absolute cloud block (< 1e8 for any TT date)
+        "cell": j * 10**8 + (mid.tt * 24 // CLOUD_CELL_HOURS).astype(np.int64),
+    }
+    for key, col in cols.items():
+        records.setdefault(key, []).append(col)
+
+
+def _pass_search_task(task):
+    """Return ``(tt, event)`` arrays of one station over one time window."""
+    tle, lat_deg, lon_deg, elev_m, tt0, tt1, altitude_degrees = task
+    ts = get_timescale()
+    sat = get_satellite(tle)
+    gloc = station_topos(lat_deg, lon_deg, elev_m)
+    t_events, events = sat.find_events(
+        gloc, ts.tt_jd(tt0), ts.tt_jd(tt1), altitude_degrees=altitude_degrees
+    )
+    return np.asarray(t_events.tt, dtype=float), np.asarray(events, dtype=int)
+
+
+def pass_search_workers(workers=None):
+    """Resolve the pass search worker count.
+
+    ``workers`` wins, then the ``RF_PASS_WORKERS`` environment variable,
+    then the CPU count.
+    """
+    if workers is None:
+        workers = os.environ.get("RF_PASS_WORKERS") or os.cpu_count() or 1
+    try:
+        return max(int(workers), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def find_station_events(
+    tle,
+    gs_list,
+    t0,
+    t1,
+    altitude_degrees=10.0,
+    workers=None,
+    chunks=None,
+    pass_search="screen",
+):
+    """Find rise, culmination and set events for every station.
+
+    ``pass_search="screen"`` (default) screens all stations at once on a
+    coarse grid and refines only candidate passes (see
+    :func:`radiation.pass_screen.screen_station_events`), giving the same
+    events as ``find_events`` to a fraction of a second.
+    ``pass_search="find_events"`` runs skyfield's ``find_events`` per
+    station, split over a process pool.  Each station's window is cut into
+    ``chunks`` equal time slices (default: enough to give every worker two
+    tasks).  A pass crossing a slice boundary yields its rise in one slice
+    and its set in the next, so concatenating slices in time order
+    reproduces the serial event list.  Results are merged in station then
+    slice order, independent of worker scheduling.  One worker, or a pool
+    that cannot start, runs the same tasks serially.
+
+    Returns a list of ``(tt, events)`` arrays aligned with ``gs_list``.
+    """
+    if pass_search == "screen":
+        return screen_station_events(
+            get_satellite(tle), gs_list, t0, t1, altitude_degrees=altitude_degrees
+        )
+    if pass_search != "find_events":
+        raise ValueError(f"Unknown pass search: {pass_search}")
+    workers = pass_search_workers(workers)
+    if chunks is None:
+        chunks = max(1, -(-2 * workers // max(len(gs_list), 1))) if workers > 1 else 1
+    edges = np.linspace(t0.tt, t1.tt, chunks + 1)
+    tasks = [
+        (
+            tuple(tle),
+            gs["location"].latitude.degrees,
+            gs["location"].longitude.degrees,
+            gs["location"].elevation.m,
+            edges[i],
+            edges[i + 1],
+            altitude_degrees,
+        )
+        for gs in gs_list
+        for i in range(chunks)
+    ]
+
+    results = None
+    if workers > 1 and len(tasks) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                results = list(pool.map(_pass_search_task, tasks))
+        except (OSError, PermissionError, NotImplementedError, BrokenProcessPool):
+            results = None
+    if results is None:
+        results = [_pass_search_task(task) for task in tasks]
+
+    merged = []
+    for j in range(len(gs_list)):
+        parts = results[j * chunks : (j + 1) * chunks]
+        tt = np.concatenate([p[0] for p in parts])
+        ev = np.concatenate([p[1] for p in parts])
+        # An event landing exactly on a slice edge is reported by both slices
+        keep = np.ones(len(tt), dtype=bool)
+        keep[1:] = (np.diff(tt) > 0) | (ev[1:] != ev[:-1])
+        merged.append((tt[keep], ev[keep]))
+    return merged
+
+
+def station_contact_plans(
+    tle,
+    gs_list,
+    t0,
+    t1,
+    altitude_degrees=10.0,
+    workers=None,
+    store=None,
+    ts=None,
+    pass_search="screen",
+):
+    """Return a contact plan (pass records) per station over ``[t0, t1]``.
+
+    Plans are served from ``store`` (a :class:`ContactPlanStore`, default
+    directory when ``None``; pass ``False`` to disable caching).  Stations
+    whose stored window already covers the request cost a file read;
+    otherwise only the missing tail (or the whole window) is searched with
+    :func:`find_station_events` and written back.
+    """
+    if store is None:
+        store = ContactPlanStore()
+    ts = ts or get_timescale()
+    sat = get_satellite(tle)
+    tt0, tt1 = float(t0.tt), float(t1.tt)
+
+    keys, plans, todo = [], [], {}
+    for j, gs in enumerate(gs_list):
+        loc = gs["location"]
+        key = ContactPlanStore.key(
+            tle,
+            loc.latitude.degrees,
+            loc.longitude.degrees,
+            loc.elevation.m,
+            altitude_degrees,
+        )
+        plan = store.load(key) if store else None
+        keys.append(key)
+        plans.append(plan)
+        need = ContactPlanStore.missing(plan, tt0, tt1)
+        if need is not None:
+            todo.setdefault(need, []).append(j)
+
+    for (a, b, extend), idx in todo.items():
+        found = find_station_events(
+            tle,
+            [gs_list[j] for j in idx],
+            ts.tt_jd(a),
+            ts.tt_jd(b),
+            altitude_degrees=altitude_degrees,
+            workers=workers,
+            pass_search=pass_search,
+        )
+        for j, (tt, events) in zip(idx, found):
+            diff = sat - gs_list[j]["location"]
+            fresh = events_to_plan(
+                tt,
+                events,
+                a,
+                b,
+                lambda t, diff=diff: diff.at(ts.tt_jd(t)).altaz()[0].degrees,
+            )
+            plans[j] = append_plan(plans[j], fresh) if extend else fresh
+            if store:
+                store.save(keys[j], plans[j])
+
+    return [window_plan(plan, tt0, tt1) for plan in plans]
+
+
+def analysis_window(ts, duration_days, start_time=None):
+    """Return the ``(t0, t1)`` analysis window as skyfield times.
+
+    The window starts at 00:00 UTC on the day of ``start_time`` (a
+    ``datetime`` or ISO string, default now) and spans ``duration_days``.
+    Naive times are taken as UTC; aware ones, and ISO strings with an
+    offset or a trailing ``Z``, are converted to UTC first.
+    """
+    if start_time is None:
+        start_time = datetime.datetime.utcnow()
+    elif isinstance(start_time, str):
+        if start_time.endswith(("Z", "z")):
+            start_time = start_time[:-1] + "+00:00"
+        start_time = datetime.datetime.fromisoformat(start_time)
+    if start_time.tzinfo is not None:
+        start_time = start_time.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    end_time = start_time + datetime.timedelta(days=duration_days)
+    t0 = ts.utc(start_time.year, start_time.month, start_time.day)
+    t1 = ts.utc(end_time.year, end_time.month, end_time.day)
+    return t0, t1
+
+
 def full_rf_visibility_simulation(
     tle=None,
     uplink_bps=5000,
@@ -877,7 +1114,59 @@ def full_rf_visibility_simulation(
     verbose=True,
     print_results=None,
     networks=None,
+    acm=False,
+    acm_dt=10,
+    workers=None,
+    start_time=None,
+    contact_store=None,
+    return_contacts=False,
+    pass_search="screen",
+    weather_realizations=N_REALIZATIONS,
+    weather_seed=0,
+    weather_exceedance_pct=50.0,
+    optical=None,
 ):
+    """Simulate ground station passes and the data moved over them.
+
+    By default each pass is credited ``downlink_bps`` when the midpoint
+    margin is positive, for the ``acm_dt`` slices whose Doppler shift and
+    rate the selected modem can track (see
+    :func:`doppler_trimmed_intervals`).  With ``acm=True`` the downlink is
+    instead integrated over each pass with adaptive coding and modulation
+    (see :func:`integrate_pass_throughput`), sampled every ``acm_dt``
+    seconds.
+
+    Station passes are found with ``pass_search`` (``"screen"`` or
+    ``"find_events"`` in a process pool of ``workers`` processes, see
+    :func:`find_station_events`) and are cached on disk by
+    :func:`station_contact_plans` (``contact_store=False`` disables this).
+    ``start_time`` (``datetime`` or ISO string) pins the analysis window,
+    which otherwise starts on the current UTC day.
+
+    Downlink crediting, contact time and volume (pass margins and the ACM
+    rate ladder) are derated by the gaseous, rain and sky noise loss
+    exceeded ``weather_exceedance_pct`` % of the time in the station
+    climatology (see :func:`radiation.atmosphere.atmospheric_loss_dB`); the
+    default of 50 is median weather and ``None`` keeps clear sky.  The
+    uplink is always clear-sky.  Every downlink band a station offers is
+    also evaluated at each pass midpoint under ``weather_realizations``
+    Monte Carlo draws of the same losses (see
+    :func:`radiation.atmosphere.band_availability`), reported as
+    availability percentiles per band; ``0`` skips this.
+
+    ``optical`` (an optical terminal name or dict, see
+    :func:`radiation.optical_link.optical_terminal`) adds an optical
+    downlink at every station: passes are sliced every ``acm_dt`` seconds
+    through :func:`radiation.optical_link.optical_link_budget` and cloud
+    cover is drawn from the station climatology for the same
+    ``weather_realizations`` (see
+    :func:`radiation.optical_link.optical_availability`).
+
+    With ``return_contacts=True`` a second dict is returned holding the
+    credited ``"uplink"`` and ``"downlink"`` contact ``(starts, ends)`` in
+    seconds from the window start and the window ``"duration_s"``, e.g. for
+    :func:`radiation.work_queue.simulate_work_queue`.
+    """
     if print_results is not None:
         verbose = print_results
     if tle is None:
@@ -885,21 +1174,29 @@ def full_rf_visibility_simulation(
             "1 25544U 98067A   23314.54692130  .00007237  00000-0  13252-3 0  9992",
             "2 25544  51.6425 282.3050 0002927 134.1747  13.9034 15.49925521424794",
         ]
-    ts = load.timescale()
-    start_time = datetime.datetime.utcnow()
-    end_time = start_time + datetime.timedelta(days=duration_days)
-    t0 = ts.utc(start_time.year, start_time.month, start_time.day)
-    t1 = ts.utc(end_time.year, end_time.month, end_time.day)
-    sat = EarthSatellite(tle[0], tle[1], "user_sat", ts)
+    ts = get_timescale()
+    t0, t1 = analysis_window(ts, duration_days, start_time)
+    sat = get_satellite(tle)
 
-    total_data_down = 0.0
-    total_data_up = 0.0
-    total_downlink_contact_s = 0.0
-    total_uplink_contact_s = 0.0
     passes_analyzed = 0
     best_down_margin_dB = None
     best_up_margin_dB = None
     min_pass_duration = 60
+    peak_acm_rate_bps = 0.0
+    doppler_trimmed_s = 0.0
+    peak_doppler_hz = 0.0
+    peak_doppler_rate_hz_s = 0.0
+    # Contact intervals (TT days) credited per link, merged after the loop
+    down_start, down_end, down_net = [], [], []
+    up_start, up_end, up_net = [], [], []
+    # ACM downlink: bits per acm_dt bin from the best station in each bin
+    n_bins = int(np.ceil((t1.tt - t0.tt) * 86400 / acm_dt)) + 1
+    bin_bits = np.zeros(n_bins)
+    bin_alt = np.zeros(n_bins)
+    # Per-band pass midpoint records for the weather Monte Carlo
+    weather_passes = {}
+    optical_passes = {}
+    terminal = optical_terminal(optical) if optical else None
 
     T_sys_gs = 290
     T_sys_sat = 290
@@ -910,23 +1207,39 @@ def full_rf_visibility_simulation(
     if networks:
         if isinstance(networks, str):
             networks = [networks]
-        gs_list = [g for g in ground_segment if g["network"] in networks]
+        gs_list = [g for g in _catalog("ground_segment") if g["network"] in networks]
     else:
-        gs_list = ground_segment
+        gs_list = _catalog("ground_segment")
+
+    down_table = link_constant_table("down", downlink_bps, T_sys_gs, BER_thresh_dn)
+    up_table = link_constant_table("up", uplink_bps, T_sys_sat, BER_thresh_up)
+
+    plans = station_contact_plans(
+        tle,
+        gs_list,
+        t0,
+        t1,
+        altitude_degrees=10.0,
+        workers=workers,
+        store=contact_store,
+        ts=ts,
+        pass_search=pass_search,
+    )
 
-    for gs in gs_list:
+    for j, (gs, plan) in enumerate(zip(gs_list, plans)):
         gloc = gs["location"]
-        t_events, events = sat.find_events(gloc, t0, t1, altitude_degrees=10.0)
-        passes = []
-        cur = {}
-        for ti, event in zip(t_events, events):
-            if event == 0:
-                cur = {"start": ti}
-            elif event == 2:
-                cur["end"] = ti
-                if "start" in cur:
-                    passes.append(cur)
-                cur = {}
+        weather = weather_realizations or weather_exceedance_pct is not None
+        climate = station_climate(gs) if weather else None
+        rise_t = ts.tt_jd(plan["rise_tt"])
+        set_t = ts.tt_jd(plan["set_tt"])
+        passes = [
+            {"start": rise_t[i], "end": set_t[i]} for i in range(len(plan["rise_tt"]))
+        ]
+        acm_passes = []
+        # Passes whose midpoint margin closes, trimmed to Doppler limits below
+        down_passes, up_passes = [], []
+        # (midpoint tt, range m, duration s) of every analysed pass
+        mid_passes = []
         for p in passes:
             pass_dur = (
                 p["end"].utc_datetime() - p["start"].utc_datetime()
@@ -934,6 +1247,7 @@ def full_rf_visibility_simulation(
             if pass_dur < min_pass_duration:
                 continue
             passes_analyzed += 1
+            acm_passes.append((p["start"], p["end"]))
             mid_time = (
                 p["start"].utc_datetime()
                 + (p["end"].utc_datetime() - p["start"].utc_datetime()) / 2
@@ -944,106 +1258,152 @@ def full_rf_visibility_simulation(
             dist_m = topoc.distance().m
 
             # ---- Downlink ----
-            dn_bands = [
-                ("sdown_fr", gs.get("sdown_fr"), gs.get("sdown_gt")),
-                ("xdown_fr", gs.get("xdown_fr"), gs.get("xdown_gt")),
-                ("kadown_fr", gs.get("kadown_fr"), gs.get("kadown_gt")),
-            ]
-            best_down = None
-            for band, frange, gt in dn_bands:
-                if not frange:
-                    continue
-                midf = (frange[0] + frange[1]) / 2
-                tx_modems = select_modems_for_freq_and_type(midf, "transmitter")
-                for m in tx_modems:
-                    tx_power = 2
-                    if isinstance(m.get("transmit_power_W"), (list, tuple)):
-                        tx_power = max(m["transmit_power_W"])
-                    elif isinstance(m.get("transmit_power_W"), (int, float)):
-                        tx_power = m["transmit_power_W"]
-                    for mod in m.get("modulations", []):
-                        bits_per_symbol = modulation_bits_per_symbol.get(mod, 1)
-                        ant_list = select_antennas_for_freq(midf)
-                        if not ant_list:
-                            continue
-                        ant = max(ant_list, key=lambda a: a["gain"])
-                        lb = calc_link_budget(
-                            dist_m,
-                            midf,
-                            tx_power,
-                            ant["gain"],
-                            gt,
-                            downlink_bps,
-                            mod,
-                            T_sys_gs,
-                            BER_thresh_dn,
-                        )
-                        if (
-                            best_down is None
-                            or lb["link_margin_dB"] > best_down["lb"]["link_margin_dB"]
-                        ):
-                            best_down = {
-                                "modem": m,
-                                "ant": ant,
-                                "lb": lb,
-                                "mod": mod,
-                                "gs": gs,
-                                "band": band,
-                                "midf": midf,
-                            }
-            if best_down and best_down["lb"]["link_margin_dB"] > 0:
-                total_data_down += downlink_bps * pass_dur
-                total_downlink_contact_s += pass_dur
-                margin = best_down["lb"]["link_margin_dB"]
-                if best_down_margin_dB is None or margin > best_down_margin_dB:
-                    best_down_margin_dB = margin
-                if verbose:
-                    print(
-                        f"\n[DOWNLINK] GS={gs['name']}, F={best_down['midf']/1e6:.1f} MHz, Ant={best_down['ant']['name']} ({best_down['ant']['gain']} dBi), Dev={best_down['modem']['name']}, Mod={best_down['mod']}"
-                    )
-                    print(
-                        f"  Pass {passes_analyzed}: {pass_dur:.1f}s, SNR={best_down['lb']['SNR_dB']:.2f} dB, Margin={best_down['lb']['link_margin_dB']:.2f}, BER={best_down['lb']['BER']:.2e} [LINK OK]"
+            mid_passes.append((mid_ts.tt, dist_m, pass_dur))
+            best_down = down_table[gs["name"]]["best"]
+            if best_down:
+                margin = link_margin(best_down, dist_m)
+                if weather_exceedance_pct is not None:
+                    margin -= atmospheric_loss_dB(
+                        best_down["midf"],
+                        topoc.altaz()[0].degrees,
+                        climate,
+                        weather_exceedance_pct,
+                        T_sys_gs,
                     )
+                if margin > 0:
+                    if not acm:
+                        down_passes.append((p["start"].tt, p["end"].tt))
+                    if best_down_margin_dB is None or margin > best_down_margin_dB:
+                        best_down_margin_dB = margin
+                    if verbose:
+                        lb = _entry_link_budget(
+                            best_down, dist_m, downlink_bps, T_sys_gs, BER_thresh_dn
+                        )
+                        print(
+                            f"\n[DOWNLINK] GS={gs['name']}, F={best_down['midf']/1e6:.1f} MHz, Ant={best_down['ant']['name']} ({best_down['ant']['gain']} dBi), Dev={best_down['modem']['name']}, Mod={best_down['mod']}"
+                        )
+                        print(
+                            f"  Pass {passes_analyzed}: {pass_dur:.1f}s, SNR={lb['SNR_dB']:.2f} dB, Margin={lb['link_margin_dB']:.2f}, BER={lb['BER']:.2e} [LINK OK]"
+                        )
 
             # ---- Uplink ----
-            up_frange = gs.get("sup_freq")
-            if up_frange:
-                midf = (up_frange[0] + up_frange[1]) / 2
-                rx_modems = select_modems_for_freq_and_type(midf, "receiver")
-                for m in rx_modems:
-                    gs_eirp_W = 50
-                    ant_list = select_antennas_for_freq(midf)
-                    if not ant_list:
-                        continue
-                    ant = max(ant_list, key=lambda a: a["gain"])
-                    for mod in m.get("modulations", []):
-                        lb = calc_link_budget(
-                            dist_m,
-                            midf,
-                            gs_eirp_W,
-                            20,
-                            ant["gain"],
-                            uplink_bps,
-                            mod,
-                            T_sys_sat,
-                            BER_thresh_up,
+            best_up = up_table[gs["name"]]["best"]
+            if best_up:
+                margin_up = link_margin(best_up, dist_m)
+                if margin_up > 0:
+                    up_passes.append((p["start"].tt, p["end"].tt))
+                    if best_up_margin_dB is None or margin_up > best_up_margin_dB:
+                        best_up_margin_dB = margin_up
+                    if verbose:
+                        lb = _entry_link_budget(
+                            best_up, dist_m, uplink_bps, T_sys_sat, BER_thresh_up
+                        )
+                        print(
+                            f"[UPLINK] GS={gs['name']}, F={best_up['midf']/1e6:.1f} MHz, Ant={best_up['ant']['name']} ({best_up['ant']['gain']} dBi), Dev={best_up['modem']['name']}, Mod={best_up['mod']}"
+                        )
+                        print(
+                            f"  Pass {passes_analyzed}: {pass_dur:.1f}s, SNR={lb['SNR_dB']:.2f} dB, Margin={lb['link_margin_dB']:.2f}, BER={lb['BER']:.2e} [LINK OK]"
                         )
-                        if lb["link_margin_dB"] > 0:
-                            total_data_up += uplink_bps * pass_dur
-                            total_uplink_contact_s += pass_dur
-                            margin_up = lb["link_margin_dB"]
-                            if (
-                                best_up_margin_dB is None
-                                or margin_up > best_up_margin_dB
-                            ):
-                                best_up_margin_dB = margin_up
-                            if verbose:
-                                print(
-                                    f"[UPLINK] GS={gs['name']}, F={midf/1e6:.1f} MHz, Ant={ant['name']} ({ant['gain']} dBi), Dev={m['name']}, Mod={mod}"
-                                )
-                                print(
-                                    f"  Pass {passes_analyzed}: {pass_dur:.1f}s, SNR={lb['SNR_dB']:.2f} dB, Margin={lb['link_margin_dB']:.2f}, BER={lb['BER']:.2e} [LINK OK]"
-                                )
+
+        if terminal is not None and acm_passes:
+            _add_optical_passes(
+                optical_passes,
+                sat,
+                j,
+                gs,
+                [(start.tt, end.tt) for start, end in acm_passes],
+                ts,
+                terminal,
+                climate or station_climate(gs),
+                acm_dt,
+            )
+        if weather_realizations and mid_passes:
+            _add_weather_passes(
+                weather_passes,
+                sat,
+                gs,
+                mid_passes,
+                ts,
+                down_table[gs["name"]]["bands"],
+                climate,
+            )
+        if down_passes:
+            trim = doppler_trimmed_intervals(
+                sat, gs, down_passes, ts, down_table[gs["name"]]["best"], acm_dt
+            )
+            down_start.extend(trim["start_tt"])
+            down_end.extend(trim["end_tt"])
+            down_net.extend([gs["network"]] * len(trim["start_tt"]))
+            doppler_trimmed_s += trim["trimmed_s"]
+            peak_doppler_hz = max(peak_doppler_hz, trim["peak_doppler_hz"])
+            peak_doppler_rate_hz_s = max(
+                peak_doppler_rate_hz_s, trim["peak_doppler_rate_hz_s"]
+            )
+        if up_passes:
+            trim = doppler_trimmed_intervals(
+                sat, gs, up_passes, ts, up_table[gs["name"]]["best"], acm_dt
+            )
+            up_start.extend(trim["start_tt"])
+            up_end.extend(trim["end_tt"])
+            up_net.extend([gs["network"]] * len(trim["start_tt"]))
+
+        if acm and acm_passes:
+            acm_res = integrate_pass_throughput(
+                sat,
+                gs,
+                acm_passes,
+                ts,
+                acm_dt,
+                T_sys_gs,
+                BER_thresh_dn,
+                climate,
+                weather_exceedance_pct,
+            )
+            peak_acm_rate_bps = max(peak_acm_rate_bps, acm_res["peak_rate_bps"])
+            doppler_trimmed_s += acm_res["doppler_trimmed_s"]
+            usable = acm_res["sample_bits"] > 0
+            half = 0.5 * acm_res["sample_s"][usable] / 86400
+            down_start.extend(acm_res["sample_tt"][usable] - half)
+            down_end.extend(acm_res["sample_tt"][usable] + half)
+            down_net.extend([gs["network"]] * int(usable.sum()))
+
+            # Overlapping stations share one transmitter: keep the station
+            # moving the most bits in each bin
+            idx = np.clip(
+                ((acm_res["sample_tt"] - t0.tt) * 86400 // acm_dt).astype(int),
+                0,
+                n_bins - 1,
+            )
+            bits = np.bincount(idx, weights=acm_res["sample_bits"], minlength=n_bins)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                alt = (
+                    np.bincount(
+                        idx,
+                        weights=acm_res["sample_bits"] * acm_res["sample_alt_deg"],
+                        minlength=n_bins,
+                    )
+                    / bits
+                )
+            better = bits > bin_bits
+            bin_bits[better] = bits[better]
+            bin_alt[better] = alt[better]
+
+    # Adjacent ACM samples touch, so join intervals a millisecond apart
+    window = (t0.tt, t1.tt, 1e-3 / 86400)
+    down_union = contact_union(down_start, down_end, down_net, *window)
+    up_union = contact_union(up_start, up_end, up_net, *window)
+    total_downlink_contact_s = down_union["covered"] * 86400
+    total_uplink_contact_s = up_union["covered"] * 86400
+    total_data_up = uplink_bps * total_uplink_contact_s
+    if acm:
+        total_data_down = float(bin_bits.sum())
+        volume_by_elevation, _ = np.histogram(
+            np.clip(bin_alt, ELEVATION_BINS[0], ELEVATION_BINS[-1]),
+            bins=ELEVATION_BINS,
+            weights=bin_bits,
+        )
+    else:
+        total_data_down = downlink_bps * total_downlink_contact_s
 
     # --- Return results as rf_dict ---
     rf_dict = {
@@ -1054,7 +1414,60 @@ def full_rf_visibility_simulation(
         "Total uplink contact time (hr)": f"{total_uplink_contact_s / 3600:.2f}",
         "Downlink % of mission": f"{100*total_downlink_contact_s/mission_s:.2f}%",
         "Uplink % of mission": f"{100*total_uplink_contact_s/mission_s:.2f}%",
+        "Downlink station overlap (hr)": f"{down_union['overlap'] * 24:.2f}",
+        "Unique downlink contact by network (hr)": {
+            net: float(f"{days * 24:.2f}")
+            for net, days in down_union.get("unique_by_group", {}).items()
+        },
+        "Downlink gaps": down_union["gaps"]["count"],
+        "Longest downlink gap (hr)": f"{down_union['gaps']['max'] * 24:.2f}",
+        "Mean downlink gap (hr)": f"{down_union['gaps']['mean'] * 24:.2f}",
+        "Downlink lost to Doppler limits (hr)": f"{doppler_trimmed_s / 3600:.2f}",
+        "Downlink weather exceedance (%)": (
+            "clear sky"
+            if weather_exceedance_pct is None
+            else float(weather_exceedance_pct)
+        ),
     }
+    if not acm:
+        rf_dict["Peak downlink Doppler (kHz)"] = float(f"{peak_doppler_hz / 1e3:.2f}")
+        rf_dict["Peak downlink Doppler rate (Hz/s)"] = float(
+            f"{peak_doppler_rate_hz_s:.1f}"
+        )
+
+    if acm:
+        rf_dict["Peak ACM downlink rate (Mbps)"] = float(
+            f"{peak_acm_rate_bps / 1e6:.3f}"
+        )
+        rf_dict["Downlink data by elevation (GB)"] = {
+            f"{lo}-{hi} deg": float(f"{v / 8 / 1e9:.3f}")
+            for lo, hi, v in zip(
+                ELEVATION_BINS[:-1], ELEVATION_BINS[1:], volume_by_elevation
+            )
+            if lo >= 10
+        }
+
+    if optical_passes:
+        rf_dict["Optical downlink"] = {
+            "Terminal": terminal["name"],
+            **optical_availability(
+                {key: np.concatenate(cols) for key, cols in optical_passes.items()},
+                terminal["data_rate_bps"],
+                weather_realizations or N_REALIZATIONS,
+                weather_seed,
+            ),
+        }
+
+    if weather_passes:
+        rf_dict["Downlink availability by band (%)"] = band_availability(
+            {
+                band: {key: np.concatenate(cols) for key, cols in rec.items()}
+                for band, rec in weather_passes.items()
+            },
+            weather_realizations,
+            weather_seed,
+            T_sys_gs,
+        )
 
     if best_down_margin_dB is not None:
         rf_dict["Best downlink margin (dB)"] = float(f"{best_down_margin_dB:.2f}")
@@ -1073,6 +1486,15 @@ def full_rf_visibility_simulation(
             f"Total uplink contact time: {total_uplink_contact_s/3600:.2f} hr ({100*total_uplink_contact_s/mission_s:.2f}% of mission)"
         )
 
+    if return_contacts:
+        up = (np.array([up_start, up_end], dtype=float) - t0.tt) * 86400
+        down = (np.array([down_start, down_end], dtype=float) - t0.tt) * 86400
+        contacts = {
+            "uplink": (up[0], up[1]),
+            "downlink": (down[0], down[1]),
+            "duration_s": (t1.tt - t0.tt) * 86400,
+        }
+        return rf_dict, contacts
     return rf_dict
 
 
@@ -1083,95 +1505,240 @@ def rf_margin_timeseries(
     downlink_bps=10000,
     verbose=False,
 ):
-    """Return times (s) and best downlink margin (dB) over one orbit."""
-    ts = load.timescale()
-    sat = EarthSatellite(tle[0], tle[1], "user_sat", ts)
+    """Return times (s) and best downlink margin (dB) over one orbit.
+
+    The whole orbit is evaluated at once: one skyfield time array and one
+    Earth-fixed propagation of the pooled satellite.  A
+    :class:`~radiation.station_db.StationDatabase` footprint query keeps
+    only the station pairs above the mask, whose margins come from the
+    cached :func:`link_constant_table`.
+    """
+    ts = get_timescale()
+    sat = get_satellite(tle)
     period_min = 2 * np.pi / sat.model.no_kozai
     period_s = period_min * 60
 
     if networks:
         if isinstance(networks, str):
             networks = [networks]
-        gs_list = [g for g in ground_segment if g["network"] in networks]
+        gs_list = [g for g in _catalog("ground_segment") if g["network"] in networks]
     else:
-        gs_list = ground_segment
+        gs_list = _catalog("ground_segment")
 
     T_sys_gs = 290
     BER_thresh_dn = 1e-5
 
     start = datetime.datetime.utcnow()
     n_steps = int(period_s // dt) + 1
-    times = []
-    margins = []
-
-    for i in range(n_steps):
-        t = start + datetime.timedelta(seconds=i * dt)
-        ts_t = ts.utc(
-            t.year,
-            t.month,
-            t.day,
-            t.hour,
-            t.minute,
-            t.second + t.microsecond / 1e6,
-        )
-        best_margin = None
-        for gs in gs_list:
-            diff = sat - gs["location"]
-            topoc = diff.at(ts_t)
-            alt = topoc.altaz()[0].degrees
-            if alt < 10:
-                continue
-            dist_m = topoc.distance().m
-            dn_bands = [
-                ("sdown_fr", gs.get("sdown_fr"), gs.get("sdown_gt")),
-                ("xdown_fr", gs.get("xdown_fr"), gs.get("xdown_gt")),
-                ("kadown_fr", gs.get("kadown_fr"), gs.get("kadown_gt")),
-            ]
-            for _band, frange, gt in dn_bands:
-                if not frange:
-                    continue
-                midf = (frange[0] + frange[1]) / 2
-                ant_list = select_antennas_for_freq(midf)
-                if not ant_list:
-                    continue
-                ant = max(ant_list, key=lambda a: a["gain"])
-                tx_modems = select_modems_for_freq_and_type(midf, "transmitter")
-                tx_pwr = 2
-                for m in tx_modems:
-                    if isinstance(m.get("transmit_power_W"), (list, tuple)):
-                        tx_pwr = max(m["transmit_power_W"])
-                    elif isinstance(m.get("transmit_power_W"), (int, float)):
-                        tx_pwr = m["transmit_power_W"]
-                    for mod in m.get("modulations", []):
-                        lb = calc_link_budget(
-                            dist_m,
-                            midf,
-                            tx_pwr,
-                            ant["gain"],
-                            gt,
-                            downlink_bps,
-                            mod,
-                            T_sys_gs,
-                            BER_thresh_dn,
-                        )
-                        margin = lb["link_margin_dB"]
-                        if best_margin is None or margin > best_margin:
-                            best_margin = margin
+    offsets = np.arange(n_steps) * dt
+    t_arr = ts.utc(
+        start.year,
+        start.month,
+        start.day,
+        start.hour,
+        start.minute,
+        start.second + start.microsecond / 1e6 + offsets,
+    )
+
+    table = link_constant_table("down", downlink_bps, T_sys_gs, BER_thresh_dn)
+    gs_list = [g for g in gs_list if table[g["name"]]["best"] is not None]
+    constant = np.array([table[g["name"]]["best"]["constant_dB"] for g in gs_list])
+    vis = StationDatabase(gs_list).visible(satellite_itrs_km(sat, t_arr), 10)
+    margins = link_margin({"constant_dB": constant[vis["station_idx"]]}, vis["range_m"])
+
+    best_margin = np.full(n_steps, -np.inf)
+    np.maximum.at(best_margin, vis["time_idx"], margins)
+    any_link = np.isfinite(best_margin)
+    best_margin[~any_link] = np.nan
+
+    if verbose:
+        print(f"RF margin: {int(any_link.sum())}/{n_steps} steps with a downlink")
 
-        times.append(i * dt)
-        margins.append(best_margin if best_margin is not None else float("nan"))
+    return offsets.tolist(), best_margin.tolist()
 
-    return times, margins
 
+MARGIN_TOLERANCE_DB = 0.25
+MIN_MARGIN_STEP_S = 1.0
 
-def rf_margin_plot_to_buffer(tle, networks=None, dt=60, verbose=False):
-    """Return an RF margin plot for one orbit."""
-    times, margins = rf_margin_timeseries(
-        tle, networks=networks, dt=dt, verbose=verbose
+
+def _visible_intervals(sat, db, tt0, tt1, ts, altitude_degrees=10.0):
+    """Return ``(station, rise_tt, set_tt)`` arrays of passes in a window.
+
+    ``db`` is a :class:`~radiation.station_db.StationDatabase`.  Passes
+    already up at ``tt0`` or still up at ``tt1`` are clipped to the window
+    rather than dropped.
+    """
+    sat_km = satellite_itrs_km(sat, ts.tt_jd(np.array([tt0])))
+    up0 = set(db.visible(sat_km, altitude_degrees)["station_idx"].tolist())
+    events = screen_station_events(
+        sat, db, ts.tt_jd(tt0), ts.tt_jd(tt1), altitude_degrees
     )
-    hours = np.array(times) / 3600.0
+    station, rise, fall = [], [], []
+    for j, (tt, ev) in enumerate(events):
+        up_at = tt0 if j in up0 else None
+        for t, code in zip(tt, ev):
+            if code == 0:
+                up_at = t
+            elif code == 2 and up_at is not None:
+                station.append(j)
+                rise.append(up_at)
+                fall.append(t)
+                up_at = None
+        if up_at is not None:
+            station.append(j)
+            rise.append(up_at)
+            fall.append(tt1)
+    return np.array(station, dtype=int), np.array(rise), np.array(fall)
+
+
+def rf_margin_segments(
+    tle,
+    networks=None,
+    downlink_bps=10000,
+    max_step_s=60,
+    tolerance_dB=MARGIN_TOLERANCE_DB,
+    min_step_s=MIN_MARGIN_STEP_S,
+    start_time=None,
+    verbose=False,
+):
+    """Return the best downlink margin over one orbit, sampled adaptively.
+
+    Unlike :func:`rf_margin_timeseries` no time is spent where no station
+    is in view: the orbit's passes are found with
+    :func:`~radiation.pass_screen.screen_station_events` and only their
+    union is sampled.  Each visibility window starts from a grid of at most
+    ``max_step_s`` plus every rise and set (where the best station can
+    change), and intervals are bisected until the midpoint margin is
+    within ``tolerance_dB`` of linear interpolation or narrower than
+    ``min_step_s``.  All intervals of one bisection level are evaluated in
+    a single propagation.
+
+    The orbit starts where :func:`full_rf_visibility_simulation` with the
+    same ``start_time`` does (see :func:`analysis_window`).
+
+    Returns a dict with the orbit ``period_s``, the number of margin
+    ``evaluations`` and ``segments``, one ``{"t_s", "margin_dB"}`` series
+    per visibility window with times in seconds from the start.
+    """
+    ts = get_timescale()
+    sat = get_satellite(tle)
+    period_s = 2 * np.pi / sat.model.no_kozai * 60
+
+    gs_list = _catalog("ground_segment")
+    if networks:
+        if isinstance(networks, str):
+            networks = [networks]
+        gs_list = [g for g in gs_list if g["network"] in networks]
+    T_sys_gs = 290
+    BER_thresh_dn = 1e-5
+    table = link_constant_table("down", downlink_bps, T_sys_gs, BER_thresh_dn)
+    gs_list = [g for g in gs_list if table[g["name"]]["best"] is not None]
+    constant = np.array([table[g["name"]]["best"]["constant_dB"] for g in gs_list])
+
+    tt0 = float(analysis_window(ts, 0, start_time)[0].tt)
+    tt1 = tt0 + period_s / 86400.0
+    out = {"period_s": period_s, "evaluations": 0, "segments": []}
+    if not gs_list:
+        return out
+    db = StationDatabase(gs_list)
+    station, rise, fall = _visible_intervals(sat, db, tt0, tt1, ts)
+    if not len(station):
+        return out
+    seg_start, seg_end = merge_intervals(rise, fall)
+
+    def best_margin(t_tt):
+        # Rise/set times are bisected to the mask, so allow a hair below it
+        vis = db.visible(satellite_itrs_km(sat, ts.tt_jd(t_tt)), 10 - 1e-2)
+        margins = link_margin(
+            {"constant_dB": constant[vis["station_idx"]]}, vis["range_m"]
+        )
+        best = np.full(len(t_tt), -np.inf)
+        np.maximum.at(best, vis["time_idx"], margins)
+        return np.where(np.isfinite(best), best, np.nan)
+
+    step = max_step_s / 86400.0
+    grid = [
+        np.linspace(a, b, max(int(np.ceil((b - a) / step)), 1) + 1)
+        for a, b in zip(seg_start, seg_end)
+    ]
+    t = np.unique(np.concatenate(grid + [rise, fall]))
+    f = best_margin(t)
+    seg = np.searchsorted(seg_start, t, side="right") - 1
+    # Bisect intervals inside a window until linear interpolation holds
+    same = seg[1:] == seg[:-1]
+    lo, hi = t[:-1][same], t[1:][same]
+    f_lo, f_hi = f[:-1][same], f[1:][same]
+    new_t, new_f = [t], [f]
+    min_step = min_step_s / 86400.0
+    while len(lo):
+        wide = hi - lo > 2 * min_step
+        lo, hi, f_lo, f_hi = lo[wide], hi[wide], f_lo[wide], f_hi[wide]
+        if not len(lo):
+            break
+        mid = 0.5 * (lo + hi)
+        f_mid = best_margin(mid)
+        new_t.append(mid)
+        new_f.append(f_mid)
+        err = np.abs(f_mid - 0.5 * (f_lo + f_hi))
+        bad = ~(err <= tolerance_dB)
+        lo, hi = np.r_[lo[bad], mid[bad]], np.r_[mid[bad], hi[bad]]
+        f_lo, f_hi = np.r_[f_lo[bad], f_mid[bad]], np.r_[f_mid[bad], f_hi[bad]]
+
+    t = np.concatenate(new_t)
+    f = np.concatenate(new_f)
+    order = np.argsort(t)
+    t, f = t[order], f[order]
+    seg = np.searchsorted(seg_start, t, side="right") - 1
+    bounds = np.searchsorted(seg, np.arange(len(seg_start) + 1))
+    offsets = (t - tt0) * 86400.0
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        out["segments"].append(
+            {
+                "t_s": np.round(offsets[a:b], 1).tolist(),
+                "margin_dB": np.round(f[a:b], 2).tolist(),
+            }
+        )
+    out["evaluations"] = len(t)
+
+    if verbose:
+        print(
+            f"RF margin: {len(t)} adaptive samples in "
+            f"{len(out['segments'])} visibility windows"
+        )
+    return out
+
+
+def get_pyplot():
+    """Import ``matplotlib.pyplot`` with the Agg backend on first plot."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def rf_margin_plot_to_buffer(
+    tle, networks=None, dt=60, verbose=False, series=None, start_time=None
+):
+    """Return an RF margin plot for one orbit.
+
+    ``series`` is a precomputed :func:`rf_margin_segments` result; otherwise
+    one is computed from ``start_time`` with ``dt`` as the largest step.
+    """
+    if series is None:
+        series = rf_margin_segments(
+            tle,
+            networks=networks,
+            max_step_s=dt,
+            start_time=start_time,
+            verbose=verbose,
+        )
+    plt = get_pyplot()
     fig, ax = plt.subplots(figsize=(6, 4))
-    ax.plot(hours, margins)
+    for seg in series["segments"]:
+        ax.plot(np.array(seg["t_s"]) / 3600.0, seg["margin_dB"], color="C0")
+    ax.set_xlim(0, series["period_s"] / 3600.0)
     ax.set_xlabel("Time (hr)")
     ax.set_ylabel("Downlink Margin (dB)")
     ax.set_title("RF Margin Over One Orbit")
@@ -1199,6 +1766,7 @@ def constant_margin_plot_to_buffer(margin_dB=5.0, period_s=5400, dt=60):
     times = np.arange(0, period_s + dt, dt)
     margins = np.full_like(times, margin_dB, dtype=float)
     hours = times / 3600.0
+    plt = get_pyplot()
     fig, ax = plt.subplots(figsize=(6, 4))
     ax.plot(hours, margins)
     ax.set_xlabel("Time (hr)")
@@ -0,0 +1,87 @@
+"""Process-wide pool of parsed skyfield objects.
+
+The timescale, ``EarthSatellite`` models keyed by TLE text and station
+positions keyed by coordinates are built once per process and shared by
+every RF call, including repeated requests and pass-search worker tasks.
+"""
+
+import functools
+
+import numpy as np
+from skyfield.api import EarthSatellite, Topos, load
+from skyfield.framelib import itrs
+
+SATELLITE_POOL_SIZE = 64
+STATION_POOL_SIZE = 512
+
+
+@functools.lru_cache(maxsize=1)
+def get_timescale():
+    """Return the shared skyfield timescale."""
+    return load.timescale()
+
+
+@functools.lru_cache(maxsize=SATELLITE_POOL_SIZE)
+def _satellite(line1, line2, name):
+    return EarthSatellite(line1, line2, name, get_timescale())
+
+
+def get_satellite(tle, name="user_sat"):
+    """Return the pooled ``EarthSatellite`` for a two-line element set."""
+    return _satellite(tle[0], tle[1], name)
+
+
+@functools.lru_cache(maxsize=STATION_POOL_SIZE)
+def station_topos(lat_deg, lon_deg, elev_m):
+    """Return the pooled ``Topos`` for a station location."""
+    return Topos(
+        latitude_degrees=lat_deg, longitude_degrees=lon_deg, elevation_m=elev_m
+    )
+
+
+@functools.lru_cache(maxsize=STATION_POOL_SIZE)
+def _station_vectors(lat_deg, lon_deg, elev_m):
+    loc = station_topos(lat_deg, lon_deg, elev_m)
+    lat, lon = np.radians(lat_deg), np.radians(lon_deg)
+    up = np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    return np.asarray(loc.itrs_xyz.km, dtype=float), up
+
+
+def station_vectors(gs_list):
+    """Return ``(S, 3)`` ITRS positions (km) and geodetic up vectors."""
+    pos, up = [], []
+    for gs in gs_list:
+        loc = gs["location"]
+        p, u = _station_vectors(
+            loc.latitude.degrees, loc.longitude.degrees, loc.elevation.m
+        )
+        pos.append(p)
+        up.append(u)
+    return np.reshape(pos, (-1, 3)), np.reshape(up, (-1, 3))
+
+
+def satellite_itrs_km(sat, t):
+    """Return ``(N, 3)`` Earth-fixed satellite positions (km) at times ``t``."""
+    return np.atleast_2d(sat.at(t).frame_xyz(itrs).km.T)
+
+
+def satellite_itrs_state(sat, t):
+    """Return ``(N, 3)`` Earth-fixed positions (m) and velocities (m/s).
+
+    Velocities are relative to the rotating Earth-fixed frame.
+    """
+    pos, vel = sat.at(t).frame_xyz_and_velocity(itrs)
+    return np.atleast_2d(pos.m.T), np.atleast_2d(vel.m_per_s.T)
+
+
+def elevation_and_range(sat_km, gs_list):
+    """Return ``(N, S)`` elevations (deg) and slant ranges (m).
+
+    One satellite propagation serves every station: the station vectors are
+    subtracted in the Earth-fixed frame and projected on each local up.
+    """
+    pos, up = station_vectors(gs_list)
+    rho = sat_km[:, None, :] - pos[None, :, :]
+    dist_km = np.linalg.norm(rho, axis=-1)
+    sin_alt = np.einsum("nsk,sk->ns", rho, up) / dist_km
+    return np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0))), dist_km * 1e3
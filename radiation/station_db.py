@@ -0,0 +1,184 @@
+"""Ground station database with an Earth-fixed KD-tree.
+
+Stations are stored as ECEF positions in a ``scipy.spatial.cKDTree``.  A
+satellite at radius ``r`` can only clear an elevation mask from stations
+within a bounded slant range (its horizon footprint), so a ball query per
+time step returns the few stations worth checking and the exact elevation
+is evaluated for those pairs only.  Per-step cost therefore grows with the
+number of stations in view, not with the size of the database.
+"""
+
+import itertools
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from radiation.sky_pool import station_topos, station_vectors
+
+# Smallest geocentric radius of any station (km): polar radius less the
+# deepest land depression, so the footprint bound holds on the ellipsoid
+R_MIN_KM = 6350.0
+# Geodetic and geocentric horizons differ by up to ~0.19 deg
+MASK_SLACK_DEG = 0.5
+
+# Accepted CSV headers (lower case) for each station field
+COLUMN_ALIASES = {
+    "name": ("name", "station", "station_name", "callsign", "id"),
+    "network": ("network", "operator", "owner"),
+    "latitude_deg": ("latitude_deg", "latitude", "lat"),
+    "longitude_deg": ("longitude_deg", "longitude", "lon", "lng", "long"),
+    "elevation_m": ("elevation_m", "elevation", "altitude_m", "altitude", "alt"),
+}
+# Scalar link fields copied through when a CSV carries them
+LINK_FIELDS = ("uEIRP", "sdown_gt", "xdown_gt", "kadown_gt")
+
+
+def horizon_range_km(r_km, altitude_degrees=10.0):
+    """Return the longest slant range (km) at which any station sees the mask.
+
+    On a sphere the stations seeing a satellite above ``altitude_degrees``
+    form a cap bounded by this slant range; using the smallest station
+    radius and a small mask slack keeps the bound valid on the ellipsoid.
+    """
+    r_km = np.asarray(r_km, dtype=float)
+    eps = np.radians(altitude_degrees - MASK_SLACK_DEG)
+    rs = R_MIN_KM
+    chord2 = np.maximum(r_km**2 - (rs * np.cos(eps)) ** 2, 0.0)
+    return np.sqrt(chord2) - rs * np.sin(eps)
+
+
+def _resolve_columns(columns):
+    lower = {str(c).strip().lower(): c for c in columns}
+    found = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in lower:
+                found[field] = lower[alias]
+                break
+    missing = {"latitude_deg", "longitude_deg"} - set(found)
+    if missing:
+        raise ValueError(f"Station CSV is missing columns: {sorted(missing)}")
+    return found
+
+
+class StationDatabase:
+    """Ground stations indexed for horizon footprint queries.
+
+    Parameters
+    ----------
+    stations : list of dict
+        Stations in the ``rf_model.ground_segment`` schema (``name``,
+        ``network`` and a ``location`` ``Topos``).  The list is kept as
+        ``stations`` so it can be passed wherever a ``gs_list`` is expected.
+    """
+
+    def __init__(self, stations):
+        self.stations = list(stations)
+        self.positions_km, self.up = station_vectors(self.stations)
+        self.names = np.array([gs["name"] for gs in self.stations], dtype=object)
+        self.tree = cKDTree(self.positions_km) if self.stations else None
+
+    def __len__(self):
+        return len(self.stations)
+
+    def subset(self, idx):
+        """Return the stations at indices ``idx`` as a list."""
+        return [self.stations[i] for i in np.atleast_1d(idx)]
+
+    def query_pairs(self, points_km, radius_km):
+        """Return ``(point, station)`` index pairs within ``radius_km``.
+
+        ``radius_km`` may be a scalar or one radius per point.  Pairs are
+        ordered by point, then station.
+        """
+        points_km = np.atleast_2d(points_km)
+        if self.tree is None or not len(points_km):
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        hits = self.tree.query_ball_point(points_km, radius_km, return_sorted=True)
+        counts = np.fromiter(map(len, hits), dtype=int, count=len(hits))
+        point = np.repeat(np.arange(len(hits)), counts)
+        station = np.fromiter(
+            itertools.chain.from_iterable(hits), dtype=int, count=int(counts.sum())
+        )
+        return point, station
+
+    def visible(self, sat_km, altitude_degrees=10.0):
+        """Return the station pairs above the mask for Earth-fixed positions.
+
+        ``sat_km`` is ``(N, 3)`` in the same frame as the station vectors
+        (e.g. :func:`radiation.sky_pool.satellite_itrs_km`).  Returns a dict
+        of equal-length arrays ``time_idx``, ``station_idx``, ``alt_deg``
+        and ``range_m``, one entry per visible pair.
+        """
+        sat_km = np.atleast_2d(sat_km)
+        radius = horizon_range_km(np.linalg.norm(sat_km, axis=1), altitude_degrees)
+        t_idx, s_idx = self.query_pairs(sat_km, radius)
+        rho = sat_km[t_idx] - self.positions_km[s_idx]
+        dist_km = np.linalg.norm(rho, axis=1)
+        sin_alt = np.einsum("nk,nk->n", rho, self.up[s_idx]) / np.maximum(dist_km, 1e-9)
+        alt = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+        keep = alt >= altitude_degrees
+        return {
+            "time_idx": t_idx[keep],
+            "station_idx": s_idx[keep],
+            "alt_deg": alt[keep],
+            "range_m": dist_km[keep] * 1e3,
+        }
+
+    def coverage(self, sat_km, dt, altitude_degrees=10.0):
+        """Summarise footprint coverage of regularly sampled positions.
+
+        Returns the fraction of samples with any station in view, the mean
+        number of stations in view and each station's contact time (s).
+        """
+        vis = self.visible(sat_km, altitude_degrees)
+        n = len(np.atleast_2d(sat_km))
+        per_station = np.bincount(vis["station_idx"], minlength=len(self)) * dt
+        return {
+            "coverage_fraction": len(np.unique(vis["time_idx"])) / n if n else 0.0,
+            "mean_stations_in_view": len(vis["time_idx"]) / n if n else 0.0,
+            "station_contact_s": dict(zip(self.names, per_station.tolist())),
+        }
+
+    @classmethod
+    def from_csv(cls, path, network="CSV", defaults=None):
+        """Load stations from a CSV export.
+
+        Latitude and longitude columns are required; name, network and
+        elevation (m) are optional, with headers matched case-insensitively
+        against :data:`COLUMN_ALIASES` (so e.g. ``lat, lng, altitude`` from
+        an amateur network export works).  Rows without coordinates are
+        skipped and unnamed or repeated names get a numbered name.
+        ``defaults`` (e.g. band ranges and G/T) are applied to every
+        station; :data:`LINK_FIELDS` columns override them per row.
+        """
+        import pandas as pd
+
+        frame = pd.read_csv(path)
+        cols = _resolve_columns(frame.columns)
+        stations, seen = [], set()
+        for i, row in enumerate(frame.to_dict("records")):
+            lat = pd.to_numeric(row[cols["latitude_deg"]], errors="coerce")
+            lon = pd.to_numeric(row[cols["longitude_deg"]], errors="coerce")
+            if pd.isna(lat) or pd.isna(lon):
+                continue
+            elev = row.get(cols.get("elevation_m"), 0.0)
+            elev = pd.to_numeric(elev, errors="coerce")
+            net = row.get(cols.get("network"), network)
+            net = network if pd.isna(net) else str(net)
+            name = row.get(cols.get("name"))
+            name = f"{net} {i}" if pd.isna(name) else str(name)
+            if name in seen:
+                name = f"{name} ({i})"
+            seen.add(name)
+
+            gs = {"name": name, "network": net}
+            gs["location"] = station_topos(
+                float(lat), float(lon), 0.0 if pd.isna(elev) else float(elev)
+            )
+            gs.update(defaults or {})
+            for field in LINK_FIELDS:
+                if field in row and not pd.isna(row[field]):
+                    gs[field] = float(row[field])
+            stations.append(gs)
+        return cls(stations)
@@ -0,0 +1,245 @@
+"""Cheapest ground station subset meeting a contact fraction target.
+
+Contact plans are rasterised into a (station, time-bin) visibility bitmap
+packed with ``np.packbits``.  Stations are then chosen by lazy greedy
+weighted set cover or, optionally, exactly with a mixed integer program.
+"""
+
+import heapq
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from radiation import rf_model
+from radiation.rf_model import analysis_window, station_contact_plans
+from radiation.sky_pool import get_timescale
+from radiation.station_db import StationDatabase
+
+# Indicative on-demand contact pricing (USD per hour) by network
+NETWORK_COST_PER_HOUR = {
+    "AWS": 600.0,
+    "VIASAT": 450.0,
+    "ATLAS": 300.0,
+}
+DEFAULT_COST_PER_HOUR = 500.0
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+
+def popcount(packed):
+    """Return the number of set bits in each row of a packed bitmap."""
+    return _POPCOUNT[packed].sum(axis=-1)
+
+
+def visibility_bitmap(plans, start_tt, end_tt, bin_s=60):
+    """Return ``(packed, n_bins)`` for a list of contact plans.
+
+    Row ``j`` of ``packed`` holds station ``j``'s bins, a bin being visible
+    when its centre falls inside a pass.
+    """
+    n_bins = max(int(np.ceil((end_tt - start_tt) * 86400 / bin_s)), 1)
+    rows = np.zeros((len(plans), n_bins), dtype=bool)
+    for j, plan in enumerate(plans):
+        rise = (np.asarray(plan["rise_tt"]) - start_tt) * 86400 / bin_s - 0.5
+        fall = (np.asarray(plan["set_tt"]) - start_tt) * 86400 / bin_s - 0.5
+        first = np.clip(np.ceil(rise).astype(int), 0, n_bins)
+        last = np.clip(np.floor(fall).astype(int), -1, n_bins - 1)
+        keep = first <= last
+        delta = np.zeros(n_bins + 1, dtype=int)
+        np.add.at(delta, first[keep], 1)
+        np.add.at(delta, last[keep] + 1, -1)
+        rows[j] = np.cumsum(delta[:-1]) > 0
+    return np.packbits(rows, axis=1), n_bins
+
+
+def station_costs(gs_list, packed, bin_s=60, cost_per_hour=None):
+    """Return the cost of booking every visible bin of each station."""
+    rates = {**NETWORK_COST_PER_HOUR, **(cost_per_hour or {})}
+    hours = popcount(packed) * bin_s / 3600.0
+    return np.array(
+        [
+            h * rates.get(gs.get("network"), DEFAULT_COST_PER_HOUR)
+            for gs, h in zip(gs_list, hours)
+        ]
+    )
+
+
+def greedy_cover(packed, costs, target_bins):
+    """Lazy greedy weighted set cover until ``target_bins`` bins are covered.
+
+    The heap holds each station's last known gain per dollar, an upper
+    bound since gains only shrink, so most stations are never re-scored.
+    Redundant picks are pruned afterwards, most expensive first.
+    """
+    costs = np.maximum(np.asarray(costs, dtype=float), 1e-9)
+    covered = np.zeros(packed.shape[1], dtype=np.uint8)
+    n_covered = 0
+    chosen = []
+    gains = popcount(packed)
+    heap = [(-g / c, j) for j, (g, c) in enumerate(zip(gains, costs)) if g > 0]
+    heapq.heapify(heap)
+
+    while n_covered < target_bins and heap:
+        _, j = heapq.heappop(heap)
+        gain = int(_POPCOUNT[packed[j] & ~covered].sum())
+        if gain == 0:
+            continue
+        ratio = gain / costs[j]
+        if heap and ratio < -heap[0][0]:
+            heapq.heappush(heap, (-ratio, j))
+            continue
+        chosen.append(j)
+        covered |= packed[j]
+        n_covered += gain
+
+    for j in sorted(chosen, key=lambda i: -costs[i]):
+        rest = [i for i in chosen if i != j]
+        if not rest:
+            break
+        union = np.bitwise_or.reduce(packed[rest], axis=0)
+        if int(_POPCOUNT[union].sum()) >= target_bins:
+            chosen = rest
+    return sorted(chosen)
+
+
+def ilp_cover(packed, n_bins, costs, target_bins, time_limit=30.0):
+    """Exact minimum cost subset covering ``target_bins`` bins via MILP.
+
+    Bins seen by the same set of stations are merged into one weighted row,
+    and the row coverage variables can stay continuous: ``y <= sum(x)``
+    with integer ``x`` already forces them to 0 or allows 1.
+
+    Returns ``(chosen, optimal)``, or ``(None, False)`` when the solver
+    finds no feasible subset within ``time_limit`` seconds.
+    """
+    n_st = packed.shape[0]
+    by_bin = np.unpackbits(packed, axis=1, count=n_bins).T.astype(bool)
+    visible = by_bin.any(axis=1)
+    patterns, weights = np.unique(by_bin[visible], axis=0, return_counts=True)
+    n_pat = len(patterns)
+    if n_pat == 0:
+        return [], True
+
+    c = np.concatenate([np.asarray(costs, dtype=float), np.zeros(n_pat)])
+    rows, cols = np.nonzero(patterns)
+    cover = sparse.hstack(
+        [
+            -sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n_pat, n_st)),
+            sparse.identity(n_pat, format="csr"),
+        ]
+    )
+    demand = sparse.hstack(
+        [sparse.csr_matrix((1, n_st)), sparse.csr_matrix(weights.reshape(1, -1))]
+    )
+    res = milp(
+        c,
+        constraints=[
+            LinearConstraint(cover, -np.inf, 0.0),
+            LinearConstraint(demand, target_bins, np.inf),
+        ],
+        integrality=np.concatenate([np.ones(n_st), np.zeros(n_pat)]),
+        bounds=Bounds(0, 1),
+        options={"time_limit": time_limit},
+    )
+    if res.x is None:
+        return None, False
+    return sorted(np.flatnonzero(res.x[:n_st] > 0.5).tolist()), res.status == 0
+
+
+def select_stations(
+    plans,
+    gs_list,
+    start_tt,
+    end_tt,
+    target_fraction,
+    bin_s=60,
+    method="greedy",
+    cost_per_hour=None,
+    time_limit=30.0,
+):
+    """Pick the cheapest stations giving ``target_fraction`` contact time.
+
+    ``method`` is ``"greedy"`` or ``"ilp"``; the ILP falls back to the
+    greedy subset if it finds nothing within ``time_limit`` seconds.  When
+    the target exceeds what all stations together achieve, the best
+    achievable coverage is used.
+    """
+    packed, n_bins = visibility_bitmap(plans, start_tt, end_tt, bin_s)
+    costs = station_costs(gs_list, packed, bin_s, cost_per_hour)
+    all_bins = int(_POPCOUNT[np.bitwise_or.reduce(packed, axis=0)].sum())
+    target_bins = min(int(np.ceil(target_fraction * n_bins)), all_bins)
+
+    optimal = False
+    if method == "ilp":
+        chosen, optimal = ilp_cover(packed, n_bins, costs, target_bins, time_limit)
+        if chosen is None:
+            chosen = greedy_cover(packed, costs, target_bins)
+    elif method == "greedy":
+        chosen = greedy_cover(packed, costs, target_bins)
+    else:
+        raise ValueError(f"Unknown station selection method: {method}")
+
+    covered = (
+        int(_POPCOUNT[np.bitwise_or.reduce(packed[chosen], axis=0)].sum())
+        if chosen
+        else 0
+    )
+    return {
+        "method": method,
+        "optimal": optimal,
+        "stations": [gs_list[j]["name"] for j in chosen],
+        "networks": sorted({gs_list[j].get("network") for j in chosen}),
+        "cost_usd": float(costs[chosen].sum()),
+        "contact_fraction": covered / n_bins,
+        "target_fraction": float(target_fraction),
+        "max_contact_fraction": all_bins / n_bins,
+        "target_met": covered >= target_fraction * n_bins,
+        "station_cost_usd": {gs_list[j]["name"]: float(costs[j]) for j in chosen},
+    }
+
+
+def optimize_ground_stations(
+    tle,
+    target_fraction,
+    duration_days=7,
+    networks=None,
+    start_time=None,
+    method="greedy",
+    bin_s=60,
+    gs_list=None,
+    cost_per_hour=None,
+    workers=None,
+    stations_csv=None,
+):
+    """Select ground stations for a TLE over an analysis window.
+
+    Candidates default to ``ground_segment``, or the sites loaded from
+    ``stations_csv`` with :meth:`StationDatabase.from_csv`, optionally
+    filtered by ``networks``; contact plans come from the on-disk contact
+    plan cache.
+    """
+    if gs_list is None:
+        if isinstance(networks, str):
+            networks = [networks]
+        candidates = (
+            StationDatabase.from_csv(stations_csv).stations
+            if stations_csv
+            else rf_model.ground_segment
+        )
+        gs_list = [g for g in candidates if not networks or g["network"] in networks]
+    ts = get_timescale()
+    t0, t1 = analysis_window(ts, duration_days, start_time)
+    plans = station_contact_plans(tle, gs_list, t0, t1, workers=workers, ts=ts)
+    result = select_stations(
+        plans,
+        gs_list,
+        float(t0.tt),
+        float(t1.tt),
+        target_fraction,
+        bin_s=bin_s,
+        method=method,
+        cost_per_hour=cost_per_hour,
+    )
+    result["duration_days"] = duration_days
+    return result
@@ -0,0 +1,181 @@
+"""Onboard mining job buffer and share queue driven by contact windows.
+
+Block templates can only be refreshed during uplink contacts and shares only
+leave the satellite during downlink contacts.  Between contacts the miner
+keeps hashing the last template until it expires, queues the shares it
+finds (dropping them once the queue is full) and submits them at the next
+downlink.  A share pays only if no block was found between the template's
+upload and the share's submission.
+
+Blocks arrive as a Poisson process, so instead of sampling block times the
+acceptance probability ``exp(-age / block_interval_s)`` is integrated
+analytically over elementary segments of the timeline.  Every step is a
+vectorised sweep over contact boundaries, so a year of contacts takes
+milliseconds.
+"""
+
+import numpy as np
+
+from radiation.contact_windows import merge_intervals
+
+BLOCK_INTERVAL_S = 600.0
+# Templates can be time-rolled until the header time runs two hours ahead
+JOB_LIFETIME_S = 7200.0
+# Pools retarget share difficulty for roughly one share every 20 s
+DEFAULT_SHARE_RATE_HZ = 0.05
+DEFAULT_SHARE_BUFFER = 4096
+
+
+def _membership(t, starts, ends):
+    """Return whether each ``t`` lies in a merged interval and its index."""
+    idx = np.searchsorted(starts, t, side="right") - 1
+    inside = (idx >= 0) & (t < np.append(ends, -np.inf)[idx])
+    return inside, idx
+
+
+def _accepted_time(a, b, in_up, in_down, job_t, submit_t, tau):
+    """Integrate ``exp(-(submit - job) / tau)`` over ``[a, b]`` per segment.
+
+    The job time is ``t`` itself while in an uplink contact and the
+    submission time is ``t`` while in a downlink contact; otherwise both are
+    the constants ``job_t`` / ``submit_t``.
+    """
+    out = np.zeros(len(a))
+    both = in_up & in_down
+    out[both] = (b - a)[both]
+
+    up = in_up & ~in_down
+    out[up] = tau * (
+        np.exp(-(submit_t[up] - b[up]) / tau) - np.exp(-(submit_t[up] - a[up]) / tau)
+    )
+
+    down = in_down & ~in_up
+    out[down] = tau * (
+        np.exp(-(a[down] - job_t[down]) / tau) - np.exp(-(b[down] - job_t[down]) / tau)
+    )
+
+    gap = ~in_up & ~in_down
+    out[gap] = (b - a)[gap] * np.exp(-(submit_t[gap] - job_t[gap]) / tau)
+    return out
+
+
+def simulate_work_queue(
+    uplink,
+    downlink,
+    duration_s,
+    share_rate_hz=DEFAULT_SHARE_RATE_HZ,
+    share_buffer=DEFAULT_SHARE_BUFFER,
+    job_lifetime_s=JOB_LIFETIME_S,
+    block_interval_s=BLOCK_INTERVAL_S,
+):
+    """Simulate the onboard job buffer and share queue over a contact plan.
+
+    Parameters
+    ----------
+    uplink, downlink : tuple of array_like
+        ``(starts, ends)`` of uplink and downlink contacts in seconds from
+        the window start; overlapping intervals are merged.
+    duration_s : float
+        Length of the simulated window (s).  The satellite starts without a
+        job and shares still queued at the end are reported as pending.
+    share_rate_hz : float
+        Expected shares found per second while hashing valid work.
+    share_buffer : int or None
+        Onboard share queue capacity; ``None`` is unlimited.
+    job_lifetime_s : float
+        Time after the last uplink contact at which a job expires and the
+        miner idles.
+    block_interval_s : float
+        Mean time between network blocks.
+
+    Returns
+    -------
+    dict
+        ``effective_mining_fraction`` (accepted work relative to mining the
+        whole window on fresh work), ``stale_share_rate`` (stale share
+        fraction of those submitted), ``dropped_share_fraction``,
+        ``idle_fraction`` (no valid job), ``pending_shares`` and the uplink
+        and downlink contact fractions.
+    """
+    up_s, up_e = merge_intervals(*uplink)
+    dn_s, dn_e = merge_intervals(*downlink)
+    up_s, up_e = np.clip(up_s, 0, duration_s), np.clip(up_e, 0, duration_s)
+    dn_s, dn_e = np.clip(dn_s, 0, duration_s), np.clip(dn_e, 0, duration_s)
+
+    bounds = np.unique(
+        np.concatenate(
+            [
+                [0.0, duration_s],
+                up_s,
+                up_e,
+                dn_s,
+                dn_e,
+                np.clip(up_e + job_lifetime_s, 0, duration_s),
+            ]
+        )
+    )
+    a, b = bounds[:-1], bounds[1:]
+    mid = 0.5 * (a + b)
+
+    in_up, up_idx = _membership(mid, up_s, up_e)
+    in_down, _ = _membership(mid, dn_s, dn_e)
+    has_job = up_idx >= 0
+    job_t = np.where(has_job, np.append(up_e, -np.inf)[up_idx], -np.inf)
+    valid = in_up | (has_job & (mid - job_t < job_lifetime_s))
+
+    # Shares found outside a downlink wait for the next downlink start
+    next_dn = np.searchsorted(dn_s, mid, side="left")
+    delivered = in_down | (next_dn < len(dn_s))
+    submit_t = np.where(in_down, mid, np.append(dn_s, np.inf)[next_dn])
+
+    # Fill the queue gap by gap; once full, later shares are dropped
+    hashing = np.where(valid, b - a, 0.0)
+    kept = hashing.copy()
+    if share_buffer is not None and share_rate_hz > 0:
+        queued = valid & ~in_down
+        group = np.where(queued, next_dn, -1)
+        order = np.flatnonzero(queued)
+        if order.size:
+            cum = np.cumsum(hashing[order])
+            first = np.r_[True, group[order][1:] != group[order][:-1]]
+            start_cum = np.maximum.accumulate(np.where(first, cum - hashing[order], 0))
+            before = cum - hashing[order] - start_cum
+            room = share_buffer / share_rate_hz
+            kept[order] = np.clip(room - before, 0.0, hashing[order])
+
+    ok = valid & delivered & (kept > 0)
+    accepted = np.zeros(len(a))
+    accepted[ok] = _accepted_time(
+        a[ok],
+        a[ok] + kept[ok],
+        in_up[ok],
+        in_down[ok],
+        job_t[ok],
+        submit_t[ok],
+        block_interval_s,
+    )
+
+    found = share_rate_hz * hashing.sum()
+    stored = share_rate_hz * kept.sum()
+    submitted = share_rate_hz * kept[delivered].sum()
+    good = share_rate_hz * accepted.sum()
+    return {
+        "effective_mining_fraction": float(accepted.sum() / duration_s),
+        "stale_share_rate": float(1 - good / submitted) if submitted else 0.0,
+        "dropped_share_fraction": float(1 - stored / found) if found else 0.0,
+        "idle_fraction": float(1 - hashing.sum() / duration_s),
+        "pending_shares": float(stored - submitted),
+        "accepted_shares": float(good),
+        "uplink_contact_fraction": float((up_e - up_s).sum() / duration_s),
+        "downlink_contact_fraction": float((dn_e - dn_s).sum() / duration_s),
+    }
+
+
+def work_queue_summary(result):
+    """Format :func:`simulate_work_queue` output for the RF summary."""
+    return {
+        "Effective mining fraction": f"{100 * result['effective_mining_fraction']:.2f}%",
+        "Stale share rate": f"{100 * result['stale_share_rate']:.2f}%",
+        "Dropped shares": f"{100 * result['dropped_share_fraction']:.2f}%",
+        "Idle (no valid job)": f"{100 * result['idle_fraction']:.2f}%",
+    }